@@ -0,0 +1,182 @@
+"""Compare the binary data catalog checkpoint with pickle.
+
+Usage::
+
+    python benchmarks/bench_checkpoint.py --units 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+from dg_kit.base.checkpoint import read_checkpoint, write_checkpoint
+from dg_kit.base.data_catalog import page_content_hash
+from dg_kit.base.dataclasses.data_catalog import (
+    AttributePage,
+    DataCatalogRow,
+    EntityPage,
+    IndexedCatalog,
+    ObjectReference,
+    RelationPage,
+)
+from dg_kit.base.enums import DataUnitType
+
+
+DOMAINS = ("sales", "finance", "marketing", "operations", "hr")
+
+
+def build_indexed_catalog(unit_count: int) -> IndexedCatalog:
+    """Build a synthetic catalog of entities with attributes and relations."""
+    row_by_id = {}
+    reference_by_id = {}
+    page_by_id = {}
+    content_hash_by_id = {}
+
+    attributes_per_entity = 8
+    entity_count = max(1, unit_count // (attributes_per_entity + 3))
+
+    def link(id: str) -> str:
+        return f"{abs(hash(id)):032x}"[:32]
+
+    def add(id, unit_type, name, domain, page):
+        reference = ObjectReference(id, link(id))
+        row_by_id[id] = DataCatalogRow(id, reference, unit_type, name, domain)
+        reference_by_id[id] = reference
+        page = page(reference)
+        page_by_id[id] = page
+        content_hash_by_id[id] = page_content_hash(page)
+
+    for e in range(entity_count):
+        domain = DOMAINS[e % len(DOMAINS)]
+        entity_id = f"entity-{e:08d}"
+        attribute_ids = [
+            f"{entity_id}-attribute-{a}" for a in range(attributes_per_entity)
+        ]
+        relation_ids = [f"{entity_id}-relation-{r}" for r in range(2)]
+
+        for a, attribute_id in enumerate(attribute_ids):
+            add(
+                attribute_id,
+                DataUnitType.ATTRIBUTE,
+                f"Attribute {a} of entity {e}",
+                domain,
+                lambda reference, a=a: AttributePage(
+                    reference.id,
+                    reference,
+                    DataUnitType.ATTRIBUTE,
+                    f"Attribute {a} of entity {e}.",
+                    link(entity_id),
+                    "STRING",
+                    "Not sensitive",
+                    (),
+                    ("data-platform",),
+                    (f"core.entity_{e}.column_{a}",),
+                    ("crm",),
+                ),
+            )
+        for r, relation_id in enumerate(relation_ids):
+            add(
+                relation_id,
+                DataUnitType.RELATION,
+                f"Relation {r} of entity {e}",
+                domain,
+                lambda reference: RelationPage(
+                    reference.id,
+                    reference,
+                    DataUnitType.RELATION,
+                    "Relation between entities.",
+                    link(entity_id),
+                    link(f"entity-{(e + 1) % entity_count:08d}"),
+                    (),
+                    ("data-platform",),
+                    (f"core.entity_{e}",),
+                    ("crm",),
+                ),
+            )
+        add(
+            entity_id,
+            DataUnitType.ENTITY,
+            f"Entity {e}",
+            domain,
+            lambda reference: EntityPage(
+                reference.id,
+                reference,
+                DataUnitType.ENTITY,
+                f"Entity number {e}.",
+                (link(attribute_ids[0]),),
+                tuple(link(attribute_id) for attribute_id in attribute_ids),
+                tuple(link(relation_id) for relation_id in relation_ids),
+                ("https://wiki.example.com/entities",),
+                ("data-platform",),
+                (f"core.entity_{e}",),
+                ("crm", "erp"),
+            ),
+        )
+
+    return IndexedCatalog(
+        row_by_id=row_by_id,
+        reference_by_id=reference_by_id,
+        page_by_id=page_by_id,
+        last_edited_time="2026-01-01T00:00:00.000Z",
+        content_hash_by_id=content_hash_by_id,
+    )
+
+
+def _timed(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--units", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    indexed_catalog = build_indexed_catalog(args.units)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pickle_path = Path(tmp_dir) / "catalog.pkl"
+        checkpoint_path = Path(tmp_dir) / "catalog.dgkc"
+
+        def write_pickle():
+            with open(pickle_path, "wb") as f:
+                pickle.dump(indexed_catalog, f)
+
+        def read_pickle():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        results = {
+            "pickle": (
+                _timed(write_pickle, args.repeat),
+                _timed(read_pickle, args.repeat),
+                pickle_path,
+            ),
+            "dgkc": (
+                _timed(
+                    lambda: write_checkpoint(indexed_catalog, checkpoint_path),
+                    args.repeat,
+                ),
+                _timed(lambda: read_checkpoint(checkpoint_path), args.repeat),
+                checkpoint_path,
+            ),
+        }
+
+        print(f"{len(indexed_catalog.row_by_id)} data units")
+        print(f"{'format':<8} {'write s':>9} {'read s':>9} {'size MB':>9}")
+        for name, (write_time, read_time, path) in results.items():
+            size = path.stat().st_size / 1024 / 1024
+            print(f"{name:<8} {write_time:>9.3f} {read_time:>9.3f} {size:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure memoized id generation and its effect on model parsing.
+
+Synthetic dbt and ODM projects are written to a temporary directory and parsed
+with the memoized ``id_generator`` and with the plain hash function patched in.
+Parsing is timed with a cold cache, as on the first version parsed, and with a
+warm cache, as on every further version parsed in the same process.
+
+Usage::
+
+    python benchmarks/bench_id_generation.py --tables 200 --columns 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from generators import write_dbt_project, write_odm_project
+
+from dg_kit.base.dataclasses import id_generator
+from dg_kit.integrations.dbt.parser import DBTParser
+from dg_kit.integrations.odm.parser import ODMParser
+
+
+def _timed(function, repeat: int, clear_cache: bool) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if clear_cache:
+            id_generator.cache_clear()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _parse_lm(dmd_path: Path, PM) -> None:
+    odm_parser = ODMParser(dmd_path, PM)
+    odm_parser.parse_bi()
+    odm_parser.parse_lm()
+
+
+def _compare(name: str, module: str, parse, repeat: int) -> None:
+    with mock.patch(f"{module}.id_generator", id_generator.__wrapped__):
+        plain = _timed(parse, repeat, clear_cache=True)
+    cold = _timed(parse, repeat, clear_cache=True)
+    parse()
+    warm = _timed(parse, repeat, clear_cache=False)
+    print(f"{name:<22} {plain:>9.3f} {cold:>9.3f} {warm:>9.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    nks = [
+        f"core.table_{t}.column_{c}"
+        for t in range(args.tables)
+        for c in range(args.columns)
+    ]
+    plain_id_generator = id_generator.__wrapped__
+
+    print(f"{'ids for ' + str(len(nks)) + ' nks':<22} {'s':>9}")
+    for name, function in (
+        ("plain", lambda: [plain_id_generator(nk) for nk in nks]),
+        ("memoized, cold", lambda: [id_generator(nk) for nk in nks]),
+    ):
+        print(f"{name:<22} {_timed(function, args.repeat, clear_cache=True):>9.3f}")
+    [id_generator(nk) for nk in nks]
+    warm = _timed(lambda: [id_generator(nk) for nk in nks], args.repeat, False)
+    print(f"{'memoized, warm':<22} {warm:>9.3f}")
+
+    print()
+    print(f"{'parser':<22} {'plain s':>9} {'cold s':>9} {'warm s':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dbt_path = Path(tmp_dir) / "dbt"
+        write_dbt_project(dbt_path, args.tables, args.columns)
+        PM = DBTParser(dbt_path, "bench").parse_pm()
+        _compare(
+            "DBTParser.parse_pm",
+            "dg_kit.integrations.dbt.parser",
+            lambda: DBTParser(dbt_path, "bench").parse_pm(),
+            args.repeat,
+        )
+
+        dmd_path = write_odm_project(Path(tmp_dir) / "odm", args.tables, args.columns)
+        _compare(
+            "ODMParser.parse_lm",
+            "dg_kit.integrations.odm.parser",
+            lambda: _parse_lm(dmd_path, PM),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Measure how sync planning and page building scale with model size.
+
+The catalog is seeded with an in-memory SQLite engine, then a model whose
+descriptions all changed is planned against it, so every page is rebuilt.
+
+Usage::
+
+    python benchmarks/bench_sync_planning.py --units 5000 10000 25000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+
+from dg_kit.base.data_catalog import DataCatalog
+from dg_kit.base.dataclasses import id_generator
+from dg_kit.base.dataclasses.logical_model import (
+    Attribute,
+    Entity,
+    EntityIdentifier,
+    Relation,
+)
+from dg_kit.base.dataclasses.physical_model import Column, Table
+from dg_kit.base.logical_model import LogicalModel
+from dg_kit.integrations.sqlite.api import SQLiteDataCatalog
+
+
+DOMAINS = ("sales", "finance", "marketing", "operations", "hr")
+
+
+def build_logical_model(unit_count: int, revision: str = "v1") -> LogicalModel:
+    """Build a synthetic model of entities with attributes and relations."""
+    attributes_per_entity = 8
+    entity_count = max(2, unit_count // (attributes_per_entity + 2))
+
+    LM = LogicalModel(revision)
+    entity_ids = [id_generator(f"entity_{e}") for e in range(entity_count)]
+
+    for e, entity_id in enumerate(entity_ids):
+        domain = DOMAINS[e % len(DOMAINS)]
+        table = Table(
+            id=id_generator(f"core.entity_{e}"),
+            nk=f"core.entity_{e}",
+            layer_id="core",
+            name=f"entity_{e}",
+        )
+        LM.register_entity(
+            Entity(
+                id=entity_id,
+                nk=f"entity_{e}",
+                name=f"Entity {e}",
+                domain=domain,
+                description=f"Entity number {e} ({revision}).",
+                pm_map=(table,),
+                source_systems=("crm",),
+                responsible_parties=(),
+                documents=(),
+            )
+        )
+
+        attributes = []
+        for a in range(attributes_per_entity):
+            attribute = Attribute(
+                id=id_generator(f"entity_{e}.attribute_{a}"),
+                nk=f"entity_{e}.attribute_{a}",
+                entity_id=entity_id,
+                name=f"Attribute {a}",
+                domain=domain,
+                description=f"Attribute {a} of entity {e} ({revision}).",
+                sensitivity_type="Not sensitive",
+                data_type="STRING",
+                pm_map=(
+                    Column(
+                        id=id_generator(f"core.entity_{e}.column_{a}"),
+                        nk=f"core.entity_{e}.column_{a}",
+                        layer_id="core",
+                        table_id=table.id,
+                        name=f"column_{a}",
+                        data_type="STRING",
+                    ),
+                ),
+                source_systems=("crm",),
+                responsible_parties=(),
+                documents=(),
+            )
+            LM.register_attribute(attribute)
+            attributes.append(attribute)
+
+        LM.register_identifier(
+            EntityIdentifier(
+                id=id_generator(f"entity_{e}.pk"),
+                nk=f"entity_{e}.pk",
+                entity_id=entity_id,
+                name="pk",
+                is_pk=True,
+                attributes=(attributes[0],),
+            )
+        )
+
+    for e, entity_id in enumerate(entity_ids):
+        for r in range(2):
+            target = entity_ids[(e + r + 1) % entity_count]
+            LM.register_relation(
+                Relation(
+                    id=id_generator(f"entity_{e}.relation_{r}"),
+                    nk=f"entity_{e}.relation_{r}",
+                    source_entity_id=entity_id,
+                    target_entity_id=target,
+                    name=f"Relation {r} of entity {e}",
+                    domain=DOMAINS[e % len(DOMAINS)],
+                    description=f"Relation {r} of entity {e} ({revision}).",
+                    pm_map=(),
+                    source_systems=(),
+                    responsible_parties=(),
+                    documents=(),
+                    optional_source=None,
+                    optional_target=None,
+                    source_cardinality=None,
+                    target_cardinality=None,
+                )
+            )
+
+    return LM
+
+
+def _timed(function, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--units", type=int, nargs="+", default=[5_000, 10_000, 25_000, 50_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(
+        f"{'units':>8} {'plan new s':>11} {'plan changed s':>15} "
+        f"{'pages s':>9} {'us/unit':>9}"
+    )
+    for unit_count in args.units:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = {
+                "name": "bench",
+                "data_catalog": {"dc_checkpoint_path": tmp_dir, "engine": "sqlite"},
+            }
+            DC = DataCatalog(SQLiteDataCatalog(config["data_catalog"]), config)
+
+            LM = build_logical_model(unit_count)
+            plan_new = _timed(lambda: DC.plan_sync(LM), args.repeat)
+
+            DC.sync_with_model(LM)
+            changed_LM = build_logical_model(unit_count, revision="v2")
+            plan_changed = _timed(lambda: DC.plan_sync(changed_LM), args.repeat)
+
+            link_by_id = DC._link_by_id()
+            build_pages = _timed(
+                lambda: list(
+                    DC._iter_pages(changed_LM, changed_LM.all_units_by_id, link_by_id)
+                ),
+                args.repeat,
+            )
+
+            units = len(LM.all_units_by_id)
+            print(
+                f"{units:>8} {plan_new:>11.3f} {plan_changed:>15.3f} "
+                f"{build_pages:>9.3f} {plan_changed / units * 1e6:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
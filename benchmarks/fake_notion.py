@@ -0,0 +1,490 @@
+"""In-memory stand-in for the Notion API endpoints used by ``NotionDataCatalog``.
+
+The server speaks HTTP on a local port, so the real ``notion_client`` code path
+(request building, JSON encoding, connection reuse) is exercised. Point an
+engine at it by replacing its client with :meth:`FakeNotionServer.client`.
+
+Served endpoints:
+
+- ``POST /v1/data_sources/{id}/query``
+- ``POST /v1/pages`` and ``PATCH /v1/pages/{id}``
+- ``GET`` and ``PATCH /v1/blocks/{id}/children``
+- ``PATCH`` and ``DELETE /v1/blocks/{id}``
+
+Every request can be delayed by a fixed ``latency``, and a token bucket of
+``rate_limit`` requests per second (with ``burst`` tokens) answers excess
+requests with HTTP 429 and a ``Retry-After`` header, as Notion does.
+
+Usage::
+
+    with FakeNotionServer(latency=0.01, rate_limit=3) as server:
+        engine = NotionDataCatalog({...})
+        engine.notion = server.client()
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+from notion_client import Client
+
+
+MAX_PAGE_SIZE = 100
+MAX_APPEND_CHILDREN = 100
+
+_ROUTES = (
+    ("POST", re.compile(r"^/v1/data_sources/([^/]+)/query$"), "data_sources.query"),
+    ("POST", re.compile(r"^/v1/pages$"), "pages.create"),
+    ("PATCH", re.compile(r"^/v1/pages/([^/]+)$"), "pages.update"),
+    ("GET", re.compile(r"^/v1/blocks/([^/]+)/children$"), "blocks.children.list"),
+    ("PATCH", re.compile(r"^/v1/blocks/([^/]+)/children$"), "blocks.children.append"),
+    ("PATCH", re.compile(r"^/v1/blocks/([^/]+)$"), "blocks.update"),
+    ("DELETE", re.compile(r"^/v1/blocks/([^/]+)$"), "blocks.delete"),
+)
+
+
+class NotionError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _now() -> str:
+    # Notion reports edit times with minute precision.
+    return (
+        datetime.now(timezone.utc)
+        .replace(second=0, microsecond=0)
+        .strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    )
+
+
+def _with_plain_text(rich_text: List[Dict]) -> List[Dict]:
+    # Notion drops empty text items and adds ``plain_text`` to the rest.
+    items = []
+    for item in rich_text:
+        content = item.get("text", {}).get("content", "")
+        if item.get("type", "text") == "text" and not content:
+            continue
+        items.append(dict(item, type=item.get("type", "text"), plain_text=content))
+    return items
+
+
+def _normalize_property(name: str, value: Dict) -> Dict:
+    property_type = next(key for key in value if key not in ("id", "type"))
+    property_value = value[property_type]
+    if property_type in ("title", "rich_text"):
+        property_value = _with_plain_text(property_value)
+    return {"id": name, "type": property_type, property_type: property_value}
+
+
+def _normalize_block(block: Dict) -> Dict:
+    block = copy.deepcopy(block)
+    block_type = block["type"]
+    content = block.setdefault(block_type, {})
+    if "rich_text" in content:
+        content["rich_text"] = _with_plain_text(content["rich_text"])
+    return block
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> float:
+        """Take a token and return 0, or return the seconds until one is free."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+class FakeNotionState:
+    """Pages and blocks of a single fake workspace."""
+
+    def __init__(self):
+        self.pages: Dict[str, Dict] = {}
+        self.blocks_by_page: Dict[str, List[Dict]] = {}
+        self.page_id_by_block_id: Dict[str, str] = {}
+        self._cursors = itertools.count()
+        self._cursor_offsets: Dict[str, int] = {}
+
+    def _page(self, page_id: str) -> Dict:
+        page = self.pages.get(page_id)
+        if page is None:
+            raise NotionError(404, "object_not_found", f"Page {page_id} not found.")
+        return page
+
+    def _touch(self, page_id: str) -> None:
+        self.pages[page_id]["last_edited_time"] = _now()
+
+    def _paginate(self, items: List[Dict], body: Dict) -> Dict:
+        page_size = min(int(body.get("page_size") or MAX_PAGE_SIZE), MAX_PAGE_SIZE)
+        start = 0
+        if body.get("start_cursor"):
+            start = self._cursor_offsets.pop(body["start_cursor"], None)
+            if start is None:
+                raise NotionError(400, "validation_error", "Invalid start_cursor.")
+
+        end = start + page_size
+        next_cursor = None
+        if end < len(items):
+            next_cursor = str(uuid.UUID(int=next(self._cursors)))
+            self._cursor_offsets[next_cursor] = end
+        return {
+            "object": "list",
+            "results": copy.deepcopy(items[start:end]),
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        }
+
+    def _matches(self, page: Dict, query_filter: Optional[Dict]) -> bool:
+        if not query_filter:
+            return True
+        if "or" in query_filter:
+            return any(self._matches(page, f) for f in query_filter["or"])
+        if "and" in query_filter:
+            return all(self._matches(page, f) for f in query_filter["and"])
+        if query_filter.get("timestamp") == "last_edited_time":
+            since = query_filter["last_edited_time"]["on_or_after"]
+            return page["last_edited_time"] >= since[:16]
+        if "rich_text" in query_filter:
+            prop = page["properties"].get(query_filter["property"], {})
+            text = "".join(item["plain_text"] for item in prop.get("rich_text", []))
+            return text == query_filter["rich_text"]["equals"]
+        raise NotionError(
+            400, "validation_error", f"Unsupported filter {query_filter}."
+        )
+
+    def query(self, data_source_id: str, body: Dict) -> Dict:
+        query_filter = body.get("filter")
+        if isinstance(query_filter, dict) and len(query_filter.get("or", ())) > 100:
+            raise NotionError(400, "validation_error", "Too many filters.")
+        pages = [
+            page
+            for page in self.pages.values()
+            if not page["archived"]
+            and page["parent"]["data_source_id"] == data_source_id
+            and self._matches(page, query_filter)
+        ]
+        return self._paginate(pages, body)
+
+    def create_page(self, body: Dict) -> Dict:
+        page_id = str(uuid.uuid4())
+        timestamp = _now()
+        self.pages[page_id] = {
+            "object": "page",
+            "id": page_id,
+            "created_time": timestamp,
+            "last_edited_time": timestamp,
+            "archived": False,
+            "in_trash": False,
+            "parent": body["parent"],
+            "properties": {
+                name: _normalize_property(name, value)
+                for name, value in body.get("properties", {}).items()
+            },
+        }
+        self.blocks_by_page[page_id] = []
+        for child in body.get("children", []):
+            self._append(page_id, [child])
+        return copy.deepcopy(self.pages[page_id])
+
+    def update_page(self, page_id: str, body: Dict) -> Dict:
+        page = self._page(page_id)
+        for name, value in body.get("properties", {}).items():
+            page["properties"][name] = _normalize_property(name, value)
+        for flag in ("archived", "in_trash"):
+            if flag in body:
+                page["archived"] = page["in_trash"] = bool(body[flag])
+        self._touch(page_id)
+        return copy.deepcopy(page)
+
+    def list_children(self, page_id: str, query: Dict) -> Dict:
+        self._page(page_id)
+        return self._paginate(self.blocks_by_page[page_id], query)
+
+    def _append(
+        self, page_id: str, children: List[Dict], after: Optional[str] = None
+    ) -> List[Dict]:
+        blocks = self.blocks_by_page[page_id]
+        position = len(blocks)
+        if after:
+            ids = [block["id"] for block in blocks]
+            if after not in ids:
+                raise NotionError(400, "validation_error", f"Block {after} not found.")
+            position = ids.index(after) + 1
+
+        new_blocks = []
+        for child in children:
+            block = _normalize_block(child)
+            block.update(object="block", id=str(uuid.uuid4()), has_children=False)
+            self.page_id_by_block_id[block["id"]] = page_id
+            new_blocks.append(block)
+        blocks[position:position] = new_blocks
+        self._touch(page_id)
+        return new_blocks
+
+    def append_children(self, page_id: str, body: Dict) -> Dict:
+        self._page(page_id)
+        children = body.get("children", [])
+        if len(children) > MAX_APPEND_CHILDREN:
+            raise NotionError(
+                400, "validation_error", "body.children.length should be ≤ 100."
+            )
+        new_blocks = self._append(page_id, children, body.get("after"))
+        return {
+            "object": "list",
+            "results": copy.deepcopy(new_blocks),
+            "has_more": False,
+            "next_cursor": None,
+        }
+
+    def _block(self, block_id: str) -> Tuple[str, int]:
+        page_id = self.page_id_by_block_id.get(block_id)
+        if page_id is None:
+            raise NotionError(404, "object_not_found", f"Block {block_id} not found.")
+        for position, block in enumerate(self.blocks_by_page[page_id]):
+            if block["id"] == block_id:
+                return page_id, position
+        raise NotionError(404, "object_not_found", f"Block {block_id} not found.")
+
+    def update_block(self, block_id: str, body: Dict) -> Dict:
+        page_id, position = self._block(block_id)
+        block = self.blocks_by_page[page_id][position]
+        block_type = block["type"]
+        if block_type not in body:
+            raise NotionError(
+                400, "validation_error", f"Expected {block_type} in block update."
+            )
+        block[block_type] = _normalize_block({"type": block_type, **body})[block_type]
+        self._touch(page_id)
+        return copy.deepcopy(block)
+
+    def delete_block(self, block_id: str) -> Dict:
+        page_id, position = self._block(block_id)
+        block = self.blocks_by_page[page_id].pop(position)
+        del self.page_id_by_block_id[block_id]
+        self._touch(page_id)
+        return dict(block, archived=True, in_trash=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, so Nagle's algorithm would
+    # stall every keep-alive response on the client's delayed ACK.
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send(
+        self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self) -> None:
+        fake: FakeNotionServer = self.server.fake
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        for method, pattern, endpoint in _ROUTES:
+            match = pattern.match(url.path)
+            if method == self.command and match:
+                break
+        else:
+            self._send(
+                400,
+                {
+                    "object": "error",
+                    "status": 400,
+                    "code": "invalid_request_url",
+                    "message": f"Invalid request URL {self.command} {url.path}.",
+                },
+            )
+            return
+
+        if fake.latency:
+            time.sleep(fake.latency)
+
+        retry_after = fake.bucket.take() if fake.bucket else 0.0
+        with fake.lock:
+            fake.requests[endpoint] += 1
+            if retry_after:
+                fake.rate_limited += 1
+        if retry_after:
+            self._send(
+                429,
+                {
+                    "object": "error",
+                    "status": 429,
+                    "code": "rate_limited",
+                    "message": "You have been rate limited. Please try again later.",
+                },
+                {"Retry-After": f"{retry_after:.3f}"},
+            )
+            return
+
+        if url.query:
+            body = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            with fake.lock:
+                payload = fake.dispatch(endpoint, match.groups(), body)
+        except NotionError as error:
+            self._send(
+                error.status,
+                {
+                    "object": "error",
+                    "status": error.status,
+                    "code": error.code,
+                    "message": error.message,
+                },
+            )
+            return
+        self._send(200, payload)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: "FakeNotionServer"
+
+
+class RetryTransport(httpx.HTTPTransport):
+    """Retry requests rejected with HTTP 429 after their ``Retry-After`` delay.
+
+    ``notion_client`` raises on rate limited requests, so runs against a rate
+    limited fake server retry them here and count the retries.
+    """
+
+    def __init__(self, max_retries: int, **kwargs):
+        super().__init__(**kwargs)
+        self.max_retries = max_retries
+        self.retries = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = super().handle_request(request)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            # Reading the body keeps the connection reusable for the retry.
+            response.read()
+            response.close()
+            time.sleep(float(response.headers.get("Retry-After", 1)))
+            attempt += 1
+            self.retries += 1
+
+
+class FakeNotionServer:
+    """Serve a :class:`FakeNotionState` over HTTP on a free local port."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: int = 10,
+    ):
+        """
+        :param latency: Seconds every request is delayed by.
+        :param rate_limit: Sustained requests per second before requests are
+            answered with HTTP 429. Unlimited by default.
+        :param burst: Requests allowed at once on top of the sustained rate.
+        """
+        self.latency = latency
+        self.bucket = _TokenBucket(rate_limit, burst) if rate_limit else None
+        self.state = FakeNotionState()
+        self.lock = threading.Lock()
+        self.requests: Counter = Counter()
+        self.rate_limited = 0
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def client(self, max_retries: int = 10) -> Client:
+        """Return a Notion client for this server that retries HTTP 429."""
+        transport = RetryTransport(max_retries=max_retries)
+        return Client(
+            auth="fake-token",
+            base_url=self.url,
+            client=httpx.Client(transport=transport),
+        )
+
+    def dispatch(self, endpoint: str, path_ids: Tuple[str, ...], body: Dict) -> Dict:
+        state = self.state
+        if endpoint == "data_sources.query":
+            return state.query(path_ids[0], body)
+        if endpoint == "pages.create":
+            return state.create_page(body)
+        if endpoint == "pages.update":
+            return state.update_page(path_ids[0], body)
+        if endpoint == "blocks.children.list":
+            return state.list_children(path_ids[0], body)
+        if endpoint == "blocks.children.append":
+            return state.append_children(path_ids[0], body)
+        if endpoint == "blocks.update":
+            return state.update_block(path_ids[0], body)
+        return state.delete_block(path_ids[0])
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.requests.clear()
+            self.rate_limited = 0
+
+    def start(self) -> "FakeNotionServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-notion", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeNotionServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,255 @@
+"""Generators of synthetic dbt and Oracle Data Modeler projects.
+
+Both generators are deterministic, so benchmark results stay comparable across
+runs. The ODM project maps entities and attributes onto the ``core`` tables
+and columns of the dbt project built with the same size, so convention rules
+and catalog sync see consistent models.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+import yaml
+
+
+SOURCE_NAME = "raw"
+MODEL_LAYERS = ("stage", "core", "mart")
+DOMAINS = ("sales", "finance", "marketing", "operations", "hr")
+
+
+def table_name(layer: str, t: int) -> str:
+    return f"{layer}_{t}"
+
+
+def column_name(layer: str, t: int, c: int) -> str:
+    return f"{layer}_{t}_column_{c}"
+
+
+def write_dbt_project(
+    root: Path,
+    models: int,
+    columns: int,
+    refs: int = 2,
+) -> Path:
+    """Write a dbt project with a source and three model layers.
+
+    Every layer has ``models`` tables of ``columns`` columns. Stage models
+    select from their source table, core models reference ``refs`` stage
+    models and mart models reference ``refs`` core models.
+
+    :returns: Project directory.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "seeds").mkdir(exist_ok=True)
+    (root / "models").mkdir(exist_ok=True)
+    (root / "dbt_project.yml").write_text(
+        yaml.safe_dump({"models": {"bench": {layer: {} for layer in MODEL_LAYERS}}})
+    )
+
+    def column_specs(layer: str, t: int):
+        return [
+            {
+                "name": column_name(layer, t, c),
+                "data_type": "STRING",
+                "description": f"Column {c} of {table_name(layer, t)}.",
+            }
+            for c in range(columns)
+        ]
+
+    (root / "models" / "sources.yml").write_text(
+        yaml.safe_dump(
+            {
+                "sources": [
+                    {
+                        "name": SOURCE_NAME,
+                        "tables": [
+                            {
+                                "name": table_name(SOURCE_NAME, t),
+                                "columns": column_specs(SOURCE_NAME, t),
+                            }
+                            for t in range(models)
+                        ],
+                    }
+                ]
+            }
+        )
+    )
+
+    for layer_index, layer in enumerate(MODEL_LAYERS):
+        layer_path = root / "models" / layer
+        layer_path.mkdir(exist_ok=True)
+        for t in range(models):
+            model_name = table_name(layer, t)
+            (layer_path / f"{model_name}.yml").write_text(
+                yaml.safe_dump(
+                    {
+                        "models": [
+                            {"name": model_name, "columns": column_specs(layer, t)}
+                        ]
+                    }
+                )
+            )
+
+            if layer_index == 0:
+                upstream = [
+                    "{{ source('%s', '%s') }}"
+                    % (SOURCE_NAME, table_name(SOURCE_NAME, t))
+                ]
+            else:
+                upstream_layer = MODEL_LAYERS[layer_index - 1]
+                upstream = [
+                    "{{ ref('%s') }}" % table_name(upstream_layer, (t + r) % models)
+                    for r in range(refs)
+                ]
+            (layer_path / f"{model_name}.sql").write_text(
+                "select * from " + "\njoin ".join(upstream)
+            )
+
+    return root
+
+
+def _write_xml(path: Path, xml: str) -> None:
+    path.write_text(xml, encoding="utf-8")
+
+
+def write_odm_project(
+    root: Path,
+    entities: int,
+    attributes: int,
+    relations: int = 2,
+    parties: int = 10,
+    documents: int = 10,
+    name: str = "bench",
+) -> Path:
+    """Write an ODM project mapped onto the matching dbt ``core`` layer.
+
+    Entity ``e`` maps to the core table ``e`` and its attributes to that
+    table's columns, so ``entities`` and ``attributes`` should not exceed the
+    ``models`` and ``columns`` of the dbt project. Every entity has
+    ``relations`` relations to the following entities, each with a foreign key
+    attribute that refers to the target's first attribute.
+
+    :returns: Path of the ``.dmd`` file.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    dmd_path = root / f"{name}.dmd"
+    dmd_path.write_text("", encoding="utf-8")
+    assets_path = root / name
+
+    folders = {
+        kind: assets_path / group / kind / "seg_0"
+        for group, kinds in (
+            ("logical", ("entity", "relation")),
+            ("businessinfo", ("contact", "document", "email", "url", "party")),
+        )
+        for kind in kinds
+    }
+    for folder in folders.values():
+        folder.mkdir(parents=True, exist_ok=True)
+
+    for d in range(documents):
+        _write_xml(
+            folders["document"] / f"D{d}.xml",
+            f'<Document id="D{d}" name="document_{d}"><propertyMap>'
+            f'<property name="reference" value="https://docs.example.com/{d}"/>'
+            f"</propertyMap></Document>",
+        )
+
+    for p in range(parties):
+        _write_xml(
+            folders["email"] / f"M{p}.xml",
+            f'<Email id="M{p}" name="email_{p}">'
+            f"<emailAddress>team_{p}@example.com</emailAddress></Email>",
+        )
+        _write_xml(
+            folders["url"] / f"U{p}.xml",
+            f'<URL id="U{p}" name="url_{p}"><url>https://example.com/{p}</url></URL>',
+        )
+        _write_xml(
+            folders["contact"] / f"C{p}.xml",
+            f'<Contact id="C{p}" name="contact_{p}">'
+            f"<emails><email>M{p}</email></emails><urls><urls>U{p}</urls></urls>"
+            f"</Contact>",
+        )
+        _write_xml(
+            folders["party"] / f"P{p}.xml",
+            f'<Party id="P{p}" name="team_{p}">'
+            f"<contacts><contact>C{p}</contact></contacts></Party>",
+        )
+
+    def shared_elements(index: int) -> str:
+        elements = ""
+        if parties:
+            elements += (
+                f"<responsibleParties><party>P{index % parties}</party>"
+                f"</responsibleParties>"
+            )
+        if documents:
+            elements += f'<documents usedDucuments="D{index % documents}"/>'
+        return elements
+
+    def property_map(**properties: str) -> str:
+        return (
+            "<propertyMap>"
+            + "".join(
+                f"<property name={quoteattr(key)} value={quoteattr(value)}/>"
+                for key, value in properties.items()
+            )
+            + "</propertyMap>"
+        )
+
+    for e in range(entities):
+        core_table = table_name("core", e)
+        attribute_xml = []
+        for a in range(attributes):
+            attribute_xml.append(
+                f'<Attribute id="E{e}A{a}" name="entity_{e}_attribute_{a}">'
+                f"<logicalDatatype>LOGDT024</logicalDatatype>"
+                f"<comment>Attribute {a} of entity {e}.</comment>"
+                + property_map(
+                    pm_map=f"core.{core_table}.{column_name('core', e, a)}",
+                    source_systems="crm,erp",
+                )
+                + "</Attribute>"
+            )
+        for r in range(relations):
+            target = (e + r + 1) % entities
+            attribute_xml.append(
+                f'<Attribute id="E{e}F{r}" name="entity_{e}_fk_{r}">'
+                f"<referedAttribute>E{target}A0</referedAttribute></Attribute>"
+            )
+
+        _write_xml(
+            folders["entity"] / f"E{e}.xml",
+            f'<Entity id="E{e}" name="entity_{e}">'
+            f"<comment>Entity {e}.</comment>"
+            + property_map(
+                domain=DOMAINS[e % len(DOMAINS)],
+                pm_map=f"core.{core_table}",
+                source_systems="crm",
+            )
+            + shared_elements(e)
+            + f"<attributes>{''.join(attribute_xml)}</attributes>"
+            f'<identifiers><identifier name="entity_{e}_pk"><pk>true</pk>'
+            f"<usedAttributes><attributeRef>E{e}A0</attributeRef></usedAttributes>"
+            f"</identifier></identifiers></Entity>",
+        )
+
+        for r in range(relations):
+            target = (e + r + 1) % entities
+            _write_xml(
+                folders["relation"] / f"R{e}_{r}.xml",
+                f'<Relation id="R{e}_{r}" name="entity_{e}_relation_{r}">'
+                f"<comment>Relation {r} of entity {e}.</comment>"
+                + property_map(domain=DOMAINS[e % len(DOMAINS)])
+                + shared_elements(e)
+                + f"<sourceEntity>E{e}</sourceEntity>"
+                f"<targetEntity>E{target}</targetEntity>"
+                f"<sourceCardinality>*</sourceCardinality>"
+                f"<targetCardinalityString>1</targetCardinalityString>"
+                f"</Relation>",
+            )
+
+    return dmd_path
@@ -0,0 +1,133 @@
+"""Load test the Notion catalog engine against a local fake Notion server.
+
+For every model size a fresh fake workspace is started and a
+``DataCatalog`` backed by ``NotionDataCatalog`` runs through these phases:
+
+- ``sync new``: sync a model into the empty catalog
+- ``sync unchanged``: sync the same model again
+- ``sync changed``: sync a model whose descriptions all changed
+- ``pull``: pull the full catalog
+
+Each phase reports its wall time, the API calls it made per unit, and the
+requests answered with HTTP 429 and retried. ``--latency`` and
+``--rate-limit`` make the fake server behave like the real API (Notion allows
+about 3 requests per second per integration), at the cost of long runs.
+
+Usage::
+
+    python benchmarks/load_notion_catalog.py --units 1000 10000 50000
+    python benchmarks/load_notion_catalog.py --units 1000 --latency 0.05 --rate-limit 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+
+from bench_sync_planning import build_logical_model
+from fake_notion import FakeNotionServer
+
+from dg_kit.base.data_catalog import DataCatalog
+from dg_kit.integrations.notion.api import NotionDataCatalog
+
+
+SECTIONS = (
+    "description",
+    "pk_attributes_references",
+    "attributes_references",
+    "relations_references",
+    "linked_documents",
+    "responsible_parties",
+    "pm_mapping_references",
+    "source_systems",
+    "parent_entity_reference",
+    "data_type",
+    "sensitivity_type",
+    "source_entity_reference",
+    "target_entity_reference",
+)
+
+
+def notion_config(checkpoint_path: str) -> dict:
+    return {
+        "engine": "notion",
+        "notion_token": "fake-token",
+        "dc_table_id": "bench-data-source",
+        "dc_checkpoint_path": checkpoint_path,
+        "row_property_mapping": {
+            "id": "Data unit id",
+            "title": "Data unit",
+            "type": "Data unit type",
+            "domain": "Domain",
+            "content_hash": "Content hash",
+        },
+        "section_name_mapping": {
+            section: section.replace("_", " ").capitalize() for section in SECTIONS
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--units", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every request."
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Requests per second before the server answers with HTTP 429.",
+    )
+    parser.add_argument("--burst", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{'units':>8} {'phase':<16} {'wall s':>9} {'calls':>9} "
+        f"{'calls/unit':>11} {'429s':>7} {'units/s':>9}"
+    )
+    for unit_count in args.units:
+        LM = build_logical_model(unit_count)
+        changed_LM = build_logical_model(unit_count, revision="v2")
+        units = len(LM.all_units_by_id)
+
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            FakeNotionServer(
+                latency=args.latency, rate_limit=args.rate_limit, burst=args.burst
+            ) as server,
+        ):
+            config = {
+                "name": "bench",
+                "data_catalog": notion_config(tmp_dir),
+            }
+            engine = NotionDataCatalog(config["data_catalog"])
+            # Retry-After of the fake server is exact, so a few retries suffice.
+            engine.notion = server.client(max_retries=10)
+            DC = DataCatalog(engine, config)
+
+            for phase, run in (
+                ("sync new", lambda: DC.sync_with_model(LM)),
+                ("sync unchanged", lambda: DC.sync_with_model(LM)),
+                ("sync changed", lambda: DC.sync_with_model(changed_LM)),
+                ("pull", DC.pull_data_catalog),
+            ):
+                server.reset_counters()
+                start = time.perf_counter()
+                run()
+                wall = time.perf_counter() - start
+
+                calls = sum(server.requests.values()) - server.rate_limited
+                print(
+                    f"{units:>8} {phase:<16} {wall:>9.2f} {calls:>9} "
+                    f"{calls / units:>11.2f} {server.rate_limited:>7} "
+                    f"{units / wall:>9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""End-to-end benchmark suite with stored baselines.
+
+Synthetic dbt and ODM projects of the selected size are generated once, then
+every benchmark is run ``--repeat`` times and its best time is reported. The
+results are compared with ``benchmarks/baselines.json`` and the run fails when
+a benchmark is slower than its baseline by more than ``--tolerance``.
+Baselines depend on the machine, so record them on the machine that compares
+against them.
+
+Usage::
+
+    python benchmarks/suite.py                      # compare with baselines
+    python benchmarks/suite.py --size medium --save # record new baselines
+    python benchmarks/suite.py --only odm dag       # run matching benchmarks
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from generators import write_dbt_project, write_odm_project
+
+from dg_kit.base import DirectedAcyclicGraph
+from dg_kit.base.convention import Convention, ConventionValidator
+from dg_kit.base.data_catalog import DataCatalog
+from dg_kit.integrations.dbt.parser import DBTParser
+from dg_kit.integrations.odm.parser import ODMParser
+from dg_kit.integrations.sqlite.api import SQLiteDataCatalog
+
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+SIZES = {
+    "small": {"models": 50, "columns": 10, "refs": 2, "relations": 2},
+    "medium": {"models": 200, "columns": 20, "refs": 3, "relations": 2},
+    "large": {"models": 1000, "columns": 30, "refs": 3, "relations": 3},
+}
+
+CONVENTION_CONFIG = {
+    "lm_mapping_layers": ["core"],
+    "rules": {
+        "lm_x_pm_consistency": {
+            "severity": "error",
+            "description": "Logical and physical mappings must stay consistent.",
+        },
+        "allowed_dependencies": {
+            "severity": "warning",
+            "description": "Restrict cross-layer dependencies.",
+            "rules": {"stage": ["raw"], "core": ["stage"], "mart": ["core"]},
+        },
+        "regex_by_layer": {
+            "severity": "warning",
+            "description": "Enforce table naming conventions.",
+            "rules": {
+                "core_tables": {"layer": "core", "regex": {"string": "^core_\\d+$"}},
+                "mart_tables": {"layer": "mart", "regex": {"string": "^mart_\\d+$"}},
+            },
+        },
+        "declarative": {
+            "severity": "warning",
+            "description": "Metadata completeness.",
+            "rules": {
+                "attributes_have_description": {
+                    "select": {"type": "attribute"},
+                    "field": "description",
+                    "not_null": True,
+                },
+                "columns_are_snake_case": {
+                    "select": {"type": "column"},
+                    "field": "name",
+                    "regex": "^[a-z0-9_]+$",
+                },
+            },
+        },
+    },
+    "technical_fields": {"core": []},
+}
+
+
+class Workspace:
+    """Generated projects and parsed models shared by the benchmarks."""
+
+    def __init__(self, root: Path, size: Dict[str, int]):
+        self.root = root
+        self.dbt_path = write_dbt_project(
+            root / "dbt", size["models"], size["columns"], size["refs"]
+        )
+        self.dmd_path = write_odm_project(
+            root / "odm",
+            entities=size["models"],
+            attributes=size["columns"],
+            relations=size["relations"],
+        )
+
+        self.PM = DBTParser(self.dbt_path, "bench").parse_pm()
+        odm_parser = ODMParser(self.dmd_path, self.PM)
+        odm_parser.parse_bi()
+        self.LM = odm_parser.parse_lm()
+        self.convention = Convention("bench", CONVENTION_CONFIG)
+        self.dag = self.build_dag()
+
+        # Warm the cache so the incremental benchmark measures unchanged models.
+        self.convention_cache_path = root / "convention_cache.sqlite"
+        self.validate_incremental()
+
+    def parse_bi(self) -> None:
+        ODMParser(self.dmd_path, self.PM).parse_bi()
+
+    def parse_lm(self) -> None:
+        odm_parser = ODMParser(self.dmd_path, self.PM)
+        odm_parser.parse_bi()
+        odm_parser.parse_lm()
+
+    def validate_incremental(self) -> None:
+        ConventionValidator(
+            self.LM, self.PM, self.convention, cache_path=self.convention_cache_path
+        ).validate()
+
+    def sync_new_catalog(self) -> None:
+        # A fresh checkpoint directory keeps every run a full sync.
+        config = {
+            "name": "bench",
+            "data_catalog": {
+                "engine": "sqlite",
+                "sqlite_path": ":memory:",
+                "dc_checkpoint_path": tempfile.mkdtemp(dir=self.root),
+            },
+        }
+        DC = DataCatalog(SQLiteDataCatalog(config["data_catalog"]), config)
+        DC.sync_with_model(self.LM)
+
+    def build_dag(self) -> DirectedAcyclicGraph:
+        dag = DirectedAcyclicGraph()
+        for table_id in self.PM.tables:
+            dag.add_node(table_id)
+        for dependent_id, dependency_ids in self.PM.dependencies.items():
+            for dependency_id in dependency_ids:
+                dag.add_edge(dependency_id, dependent_id)
+        return dag
+
+    def query_dag(self) -> None:
+        dag = self.dag
+        for table_id in self.PM.tables:
+            dag.descendants(table_id)
+            dag.ancestors(table_id)
+
+    def subgraphs(self) -> None:
+        dag = self.dag
+        for table_id in list(self.PM.tables)[:: max(1, len(self.PM.tables) // 50)]:
+            dag.subgraph(table_id).to_dict()
+
+
+BENCHMARKS: Dict[str, Callable[[Workspace], object]] = {
+    "dbt_parse_pm": lambda ws: DBTParser(ws.dbt_path, "bench").parse_pm(),
+    "odm_parse_bi": Workspace.parse_bi,
+    "odm_parse_lm": Workspace.parse_lm,
+    "convention_validate": lambda ws: ConventionValidator(
+        ws.LM, ws.PM, ws.convention
+    ).validate(),
+    "convention_validate_incremental": Workspace.validate_incremental,
+    "data_catalog_sync_new": Workspace.sync_new_catalog,
+    "dag_build": Workspace.build_dag,
+    "dag_ancestors_descendants": Workspace.query_dag,
+    "dag_subgraph": Workspace.subgraphs,
+}
+
+
+def _timed(function: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _load_baselines() -> Dict:
+    if BASELINES_PATH.is_file():
+        return json.loads(BASELINES_PATH.read_text(encoding="utf-8"))
+    return {"machine": {}, "results": {}}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", choices=SIZES, default="small")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--only", nargs="+", help="Run benchmarks whose name contains any of these."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline, as a fraction.",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as new baselines."
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.only or any(part in name for part in args.only)
+    ]
+    baselines = _load_baselines()
+    size_baselines = baselines["results"].get(args.size, {})
+
+    results: Dict[str, float] = {}
+    regressions = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = Workspace(Path(tmp_dir), SIZES[args.size])
+
+        print(f"{'benchmark':<32} {'best s':>9} {'baseline s':>11} {'ratio':>7}")
+        for name in names:
+            seconds = _timed(lambda: BENCHMARKS[name](workspace), args.repeat)
+            results[name] = seconds
+
+            baseline = size_baselines.get(name)
+            if baseline is None:
+                print(f"{name:<32} {seconds:>9.4f} {'-':>11} {'-':>7}")
+                continue
+
+            ratio = seconds / baseline
+            flag = ""
+            if ratio > 1 + args.tolerance:
+                regressions.append(name)
+                flag = "  REGRESSION"
+            print(f"{name:<32} {seconds:>9.4f} {baseline:>11.4f} {ratio:>7.2f}{flag}")
+
+    if args.save:
+        baselines["machine"] = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        }
+        baselines["results"][args.size] = {**size_baselines, **results}
+        BASELINES_PATH.write_text(
+            json.dumps(baselines, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        print(f"Saved baselines to {BASELINES_PATH}")
+        return 0
+
+    if regressions:
+        print(f"Regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
-from typing import Any, Literal
+from itertools import islice
+from typing import Any, Iterable, Iterator, Literal
 
 
 def add_value_to_indexed_list(index_dict: dict, key, value) -> None:
@@ -13,6 +14,13 @@ def add_value_to_indexed_list(index_dict: dict, key, value) -> None:
         index_dict[key] = [value]
 
 
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield consecutive lists of at most ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 class DirectedAcyclicGraph:
     """Minimal DAG implementation with subgraph extraction by node id."""
 
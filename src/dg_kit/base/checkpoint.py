@@ -0,0 +1,925 @@
+"""Binary checkpoint format for indexed data catalogs.
+
+The checkpoint stores an :class:`IndexedCatalog` as little-endian ``u32``
+columns that point into one interned string table, so repeated values such as
+domains, unit types and remote references are stored once. Layout::
+
+    header     magic b"DGKC", u16 version, u16 reserved, u32 section count
+    directory  per section: 4-byte tag, u64 offset, u64 length
+    STRS       u32 count, u32 offsets[count + 1], UTF-8 blob of NUL-terminated strings
+    META       u32 last_edited_time string index
+    SCHM       page fields per unit type: u32 type, u32 field count,
+               then per field u32 name and u32 kind (scalar or tuple)
+    UNIT       u32 count, then one u32 column per unit attribute, rows sorted by id
+    PAGE       u32 words of page records referenced from the unit page column
+    HIDX       optional open-addressing hash table of CRC-32(id) to unit position + 1
+
+Pages keep their canonical content (see
+:func:`dg_kit.base.data_catalog.canonical_page_content`), so model objects are
+stored by the name a catalog page shows. Fields are matched by name when
+loading, which keeps checkpoints readable across dataclass changes.
+
+:class:`MappedCheckpoint` memory-maps a checkpoint and exposes it as an
+:class:`IndexedCatalog` whose mappings decode units on first access.
+"""
+
+from __future__ import annotations
+
+import gc
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from dataclasses import fields
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from dg_kit.base.dataclasses.data_catalog import (
+    AttributePage,
+    DataCatalogRow,
+    EntityPage,
+    IndexedCatalog,
+    ObjectReference,
+    RelationPage,
+)
+from dg_kit.base.enums import DataUnitType
+
+
+CHECKPOINT_MAGIC = b"DGKC"
+CHECKPOINT_VERSION = 1
+
+NONE_INDEX = 0xFFFFFFFF
+
+HAS_ROW = 1
+HAS_PAGE = 2
+HAS_REFERENCE = 4
+HAS_CONTENT_HASH = 8
+
+FIELD_SCALAR = 0
+FIELD_TUPLE = 1
+
+UNIT_COLUMNS = (
+    "id",
+    "reference_link",
+    "data_unit_type",
+    "data_unit_name",
+    "domain",
+    "content_hash",
+    "flags",
+    "page_offset",
+)
+
+PAGE_CLASS_BY_UNIT_TYPE = {
+    DataUnitType.ENTITY: EntityPage,
+    DataUnitType.ATTRIBUTE: AttributePage,
+    DataUnitType.RELATION: RelationPage,
+}
+
+_HEADER = struct.Struct("<4sHHI")
+_DIRECTORY_ENTRY = struct.Struct("<4sQQ")
+_U32 = struct.Struct("<I")
+
+# Fields every page record shares with its unit row.
+_UNIT_PAGE_FIELDS = ("id", "reference", "data_unit_type")
+
+_UNIT_COLUMN_INDEX = {name: i for i, name in enumerate(UNIT_COLUMNS)}
+
+
+def _page_fields(page_cls: type) -> List[Tuple[str, int]]:
+    return [
+        (
+            page_field.name,
+            FIELD_TUPLE if str(page_field.type).startswith("Tuple") else FIELD_SCALAR,
+        )
+        for page_field in fields(page_cls)
+        if page_field.name not in _UNIT_PAGE_FIELDS
+    ]
+
+
+def _u32_array(values: Sequence[int] = ()) -> array:
+    column = array("I", values)
+    if column.itemsize != 4:
+        column = array("L", values)
+    return column
+
+
+def _to_little_endian(column: array) -> bytes:
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_little_endian(buffer, offset: int, count: int) -> array:
+    column = _u32_array()
+    column.frombytes(buffer[offset : offset + 4 * count])
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+class _StringTableBuilder:
+    def __init__(self):
+        self.index_by_string: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE_INDEX
+        index = self.index_by_string.get(value)
+        if index is None:
+            index = self.index_by_string[value] = len(self.index_by_string)
+        return index
+
+    def to_bytes(self) -> bytes:
+        offsets = _u32_array([0])
+        chunks = []
+        position = 0
+        for value in self.index_by_string:
+            encoded = value.encode("utf-8") + b"\0"
+            chunks.append(encoded)
+            position += len(encoded)
+            offsets.append(position)
+
+        return (
+            _U32.pack(len(self.index_by_string))
+            + _to_little_endian(offsets)
+            + b"".join(chunks)
+        )
+
+
+def encode_indexed_catalog(indexed_catalog: IndexedCatalog) -> bytes:
+    """Serialize an indexed catalog to the binary checkpoint format.
+
+    :param indexed_catalog: Catalog content to serialize.
+    :type indexed_catalog: IndexedCatalog
+    :returns: Checkpoint bytes.
+    :rtype: bytes
+    """
+    # Imported here, dg_kit.base.data_catalog imports this module.
+    from dg_kit.base.data_catalog import _canonical_value
+
+    def _scalar(value) -> Optional[str]:
+        # Canonical values turn None into empty text, None is kept distinct so
+        # optional page fields round-trip unchanged.
+        if value is None:
+            return None
+        return str(_canonical_value(value))
+
+    strings = _StringTableBuilder()
+    intern = strings.intern
+
+    row_by_id = indexed_catalog.row_by_id
+    reference_by_id = indexed_catalog.reference_by_id
+    page_by_id = indexed_catalog.page_by_id
+    content_hash_by_id = indexed_catalog.content_hash_by_id
+
+    schema = _u32_array()
+    page_fields_by_type: Dict[DataUnitType, List[Tuple[str, int]]] = {}
+    for unit_type, page_cls in PAGE_CLASS_BY_UNIT_TYPE.items():
+        page_fields = page_fields_by_type[unit_type] = _page_fields(page_cls)
+        schema.extend((intern(unit_type.value), len(page_fields)))
+        for name, kind in page_fields:
+            schema.extend((intern(name), kind))
+
+    columns = {name: _u32_array() for name in UNIT_COLUMNS}
+    page_words = _u32_array()
+
+    for id in sorted(row_by_id.keys() | reference_by_id.keys() | page_by_id.keys()):
+        row = row_by_id.get(id)
+        page = page_by_id.get(id)
+        reference = reference_by_id.get(id)
+        if reference is None:
+            reference = (row or page).reference
+
+        flags = 0
+        if row is not None:
+            flags |= HAS_ROW
+        if page is not None:
+            flags |= HAS_PAGE
+        if id in reference_by_id:
+            flags |= HAS_REFERENCE
+        if id in content_hash_by_id:
+            flags |= HAS_CONTENT_HASH
+
+        unit_type = None
+        if page is not None:
+            unit_type = DataUnitType(page.data_unit_type)
+        elif row is not None:
+            unit_type = DataUnitType(row.data_unit_type)
+
+        page_offset = NONE_INDEX
+        if page is not None:
+            page_offset = len(page_words)
+            for name, kind in page_fields_by_type[unit_type]:
+                value = getattr(page, name)
+                if kind == FIELD_TUPLE:
+                    value = value or ()
+                    page_words.append(len(value))
+                    page_words.extend(intern(_scalar(item)) for item in value)
+                else:
+                    page_words.append(intern(_scalar(value)))
+
+        columns["id"].append(intern(id))
+        columns["reference_link"].append(
+            intern(reference.reference_link if reference else None)
+        )
+        columns["data_unit_type"].append(intern(unit_type.value if unit_type else None))
+        columns["data_unit_name"].append(intern(row.data_unit_name if row else None))
+        columns["domain"].append(intern(row.domain if row else None))
+        columns["content_hash"].append(intern(content_hash_by_id.get(id)))
+        columns["flags"].append(flags)
+        columns["page_offset"].append(page_offset)
+
+    meta = _U32.pack(intern(indexed_catalog.last_edited_time))
+    unit_count = len(columns["id"])
+
+    id_strings = list(strings.index_by_string)
+    slot_count = 8
+    while slot_count < 2 * unit_count:
+        slot_count *= 2
+    mask = slot_count - 1
+    slots = _u32_array([0]) * slot_count
+    for position, id_index in enumerate(columns["id"]):
+        slot = zlib.crc32(id_strings[id_index].encode("utf-8")) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = position + 1
+
+    sections = [
+        (b"STRS", strings.to_bytes()),
+        (b"META", meta),
+        (b"SCHM", _to_little_endian(schema)),
+        (
+            b"UNIT",
+            _U32.pack(unit_count)
+            + b"".join(_to_little_endian(columns[name]) for name in UNIT_COLUMNS),
+        ),
+        (b"PAGE", _to_little_endian(page_words)),
+        (b"HIDX", _U32.pack(slot_count) + _to_little_endian(slots)),
+    ]
+
+    offset = _HEADER.size + _DIRECTORY_ENTRY.size * len(sections)
+    directory = []
+    for tag, payload in sections:
+        directory.append(_DIRECTORY_ENTRY.pack(tag, offset, len(payload)))
+        offset += len(payload)
+
+    return b"".join(
+        [_HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, 0, len(sections))]
+        + directory
+        + [payload for _, payload in sections]
+    )
+
+
+class CheckpointReader:
+    """Random access to the sections of a binary checkpoint.
+
+    Works on any buffer, including a memory-mapped file, and only decodes the
+    values that are asked for.
+    """
+
+    def __init__(self, buffer):
+        """Parse the checkpoint header and section directory.
+
+        :param buffer: Checkpoint bytes or a memory-mapped checkpoint file.
+        :type buffer: bytes | mmap.mmap
+        :raises ValueError: If the buffer is not a supported checkpoint.
+        """
+        self.buffer = buffer
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Checkpoint is truncated.")
+        magic, version, _, section_count = _HEADER.unpack_from(buffer, 0)
+        if magic != CHECKPOINT_MAGIC:
+            raise ValueError("Not a dg_kit data catalog checkpoint.")
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version {version}, expected {CHECKPOINT_VERSION}."
+            )
+
+        self.sections: Dict[bytes, Tuple[int, int]] = {}
+        for i in range(section_count):
+            tag, offset, length = _DIRECTORY_ENTRY.unpack_from(
+                buffer, _HEADER.size + i * _DIRECTORY_ENTRY.size
+            )
+            if offset + length > len(buffer):
+                raise ValueError(f"Checkpoint section {tag!r} is truncated.")
+            self.sections[tag] = (offset, length)
+
+        self._strings_offset = self.sections[b"STRS"][0]
+        self.string_count = self._u32(self._strings_offset)
+        self._string_blob_offset = self._strings_offset + 4 * (self.string_count + 2)
+
+        self._units_offset = self.sections[b"UNIT"][0]
+        self.unit_count = self._u32(self._units_offset)
+        self._pages_offset = self.sections[b"PAGE"][0]
+
+        self._hash_index_offset: Optional[int] = None
+        if b"HIDX" in self.sections:
+            self._hash_index_offset = self.sections[b"HIDX"][0]
+            self._hash_index_mask = self._u32(self._hash_index_offset) - 1
+
+        self.page_fields_by_type = self._read_schema()
+
+    def _u32(self, offset: int) -> int:
+        return _U32.unpack_from(self.buffer, offset)[0]
+
+    def _read_schema(self) -> Dict[DataUnitType, List[Tuple[str, int]]]:
+        offset, length = self.sections[b"SCHM"]
+        words = _from_little_endian(self.buffer, offset, length // 4)
+
+        page_fields_by_type: Dict[DataUnitType, List[Tuple[str, int]]] = {}
+        i = 0
+        while i < len(words):
+            unit_type = DataUnitType(self.string(words[i]))
+            field_count = words[i + 1]
+            i += 2
+            page_fields_by_type[unit_type] = [
+                (self.string(words[i + 2 * j]), words[i + 2 * j + 1])
+                for j in range(field_count)
+            ]
+            i += 2 * field_count
+
+        return page_fields_by_type
+
+    def string(self, index: int) -> Optional[str]:
+        """Decode one string from the string table.
+
+        :param index: String index, or ``NONE_INDEX``.
+        :type index: int
+        :returns: Decoded string, or ``None`` for ``NONE_INDEX``.
+        :rtype: str | None
+        """
+        if index == NONE_INDEX:
+            return None
+        start = self._u32(self._strings_offset + 4 + 4 * index)
+        end = self._u32(self._strings_offset + 8 + 4 * index) - 1
+        return str(
+            self.buffer[
+                self._string_blob_offset + start : self._string_blob_offset + end
+            ],
+            "utf-8",
+        )
+
+    def strings(self) -> List[str]:
+        """Decode the whole string table.
+
+        :returns: All strings, by index.
+        :rtype: list[str]
+        """
+        blob_end = self._string_blob_offset + self._u32(
+            self._strings_offset + 4 + 4 * self.string_count
+        )
+        values = str(self.buffer[self._string_blob_offset : blob_end], "utf-8").split(
+            "\0"
+        )[:-1]
+        if len(values) == self.string_count:
+            return values
+
+        # A string contains NUL itself, fall back to the offsets.
+        return [self.string(index) for index in range(self.string_count)]
+
+    def column(self, name: str) -> array:
+        """Decode one unit column.
+
+        :param name: Column name from ``UNIT_COLUMNS``.
+        :type name: str
+        :returns: Column values, by unit position.
+        :rtype: array
+        """
+        offset = self._units_offset + 4 + 4 * self.unit_count * _UNIT_COLUMN_INDEX[name]
+        return _from_little_endian(self.buffer, offset, self.unit_count)
+
+    def cell(self, name: str, position: int) -> int:
+        """Decode one unit column value.
+
+        :param name: Column name from ``UNIT_COLUMNS``.
+        :type name: str
+        :param position: Unit position in id order.
+        :type position: int
+        :returns: Raw column value.
+        :rtype: int
+        """
+        return self._u32(
+            self._units_offset
+            + 4
+            + 4 * (self.unit_count * _UNIT_COLUMN_INDEX[name] + position)
+        )
+
+    def page_words(self) -> array:
+        """Decode the whole page record section.
+
+        :returns: Page record words.
+        :rtype: array
+        """
+        offset, length = self.sections[b"PAGE"]
+        return _from_little_endian(self.buffer, offset, length // 4)
+
+    def page_word(self, index: int) -> int:
+        return self._u32(self._pages_offset + 4 * index)
+
+    def last_edited_time(self) -> Optional[str]:
+        return self.string(self._u32(self.sections[b"META"][0]))
+
+    def find(self, id: str) -> Optional[int]:
+        """Return the unit position of an identifier.
+
+        Uses the hash index when the checkpoint has one and a binary search over
+        the sorted id column otherwise.
+
+        :param id: Catalog object identifier.
+        :type id: str
+        :returns: Unit position, or ``None`` if the id is not stored.
+        :rtype: int | None
+        """
+        if self._hash_index_offset is not None:
+            slot = zlib.crc32(id.encode("utf-8")) & self._hash_index_mask
+            while True:
+                position = self._u32(self._hash_index_offset + 4 + 4 * slot) - 1
+                if position < 0:
+                    return None
+                if self.string(self.cell("id", position)) == id:
+                    return position
+                slot = (slot + 1) & self._hash_index_mask
+
+        ids = _StoredIds(self)
+        position = bisect_left(ids, id)
+        if position < self.unit_count and ids[position] == id:
+            return position
+        return None
+
+    def ids(self) -> Iterator[str]:
+        """Yield stored identifiers in sorted order."""
+        for position in range(self.unit_count):
+            yield self.string(self.cell("id", position))
+
+
+class _StoredIds(Sequence):
+    def __init__(self, reader: CheckpointReader):
+        self.reader = reader
+
+    def __len__(self) -> int:
+        return self.reader.unit_count
+
+    def __getitem__(self, position: int) -> str:
+        return self.reader.string(self.reader.cell("id", position))
+
+
+class PageDecoder:
+    """Decode page records of one unit type into page dataclasses.
+
+    Stored fields are matched to the current page class by name. Fields the
+    checkpoint does not have default to an empty tuple or ``None``, stored
+    fields the page class no longer has are skipped.
+    """
+
+    def __init__(self, unit_type: DataUnitType, stored_fields: List[Tuple[str, int]]):
+        """Prepare the field mapping for a unit type.
+
+        :param unit_type: Data unit type of the decoded pages.
+        :type unit_type: DataUnitType
+        :param stored_fields: ``(name, kind)`` fields recorded in the checkpoint.
+        :type stored_fields: list[tuple[str, int]]
+        """
+        self.unit_type = unit_type
+        self.page_cls = PAGE_CLASS_BY_UNIT_TYPE[unit_type]
+        self.stored_kinds = [kind for _, kind in stored_fields]
+
+        page_fields = _page_fields(self.page_cls)
+        position_by_name = {name: i for i, (name, _) in enumerate(stored_fields)}
+        self.field_plan: Optional[List[Tuple[Optional[int], object]]] = None
+        if [name for name, _ in stored_fields] != [name for name, _ in page_fields]:
+            self.field_plan = [
+                (position_by_name.get(name), () if kind == FIELD_TUPLE else None)
+                for name, kind in page_fields
+            ]
+
+    def decode(
+        self,
+        id: str,
+        reference: ObjectReference,
+        words: Sequence[int],
+        offset: int,
+        strings: Sequence[str],
+    ) -> EntityPage | AttributePage | RelationPage:
+        """Decode one page record.
+
+        :param id: Catalog object identifier.
+        :type id: str
+        :param reference: Remote reference of the page.
+        :type reference: ObjectReference
+        :param words: Page record words. Must support slicing.
+        :type words: Sequence[int]
+        :param offset: Offset of the record in ``words``.
+        :type offset: int
+        :param strings: String table, or a lazy view with indexed access.
+        :type strings: Sequence[str]
+        :returns: Page dataclass instance.
+        :rtype: EntityPage | AttributePage | RelationPage
+        """
+        values = []
+        append = values.append
+        string_at = strings.__getitem__
+        for kind in self.stored_kinds:
+            if kind == FIELD_TUPLE:
+                count = words[offset]
+                items = words[offset + 1 : offset + 1 + count]
+                offset += 1 + count
+                if NONE_INDEX in items:
+                    append(
+                        tuple(
+                            None if index == NONE_INDEX else string_at(index)
+                            for index in items
+                        )
+                    )
+                else:
+                    append(tuple(map(string_at, items)))
+            else:
+                index = words[offset]
+                offset += 1
+                append(None if index == NONE_INDEX else string_at(index))
+
+        if self.field_plan is not None:
+            values = [
+                default if position is None else values[position]
+                for position, default in self.field_plan
+            ]
+
+        return self.page_cls(id, reference, self.unit_type, *values)
+
+
+def decode_indexed_catalog(buffer) -> IndexedCatalog:
+    """Deserialize a complete indexed catalog from checkpoint bytes.
+
+    :param buffer: Checkpoint bytes.
+    :type buffer: bytes
+    :returns: Indexed catalog.
+    :rtype: IndexedCatalog
+    :raises ValueError: If the buffer is not a supported checkpoint.
+    """
+    reader = CheckpointReader(buffer)
+
+    # The loader only allocates acyclic objects, collection passes over the
+    # growing heap are pure overhead.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _decode_indexed_catalog(reader)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _decode_indexed_catalog(reader: CheckpointReader) -> IndexedCatalog:
+    strings = reader.strings()
+    page_words = reader.page_words()
+    page_decoders = {
+        unit_type: PageDecoder(unit_type, stored_fields)
+        for unit_type, stored_fields in reader.page_fields_by_type.items()
+    }
+    unit_types = {unit_type.value: unit_type for unit_type in DataUnitType}
+
+    row_by_id: Dict[str, DataCatalogRow] = {}
+    reference_by_id: Dict[str, ObjectReference] = {}
+    page_by_id: Dict[str, EntityPage | AttributePage | RelationPage] = {}
+    content_hash_by_id: Dict[str, str] = {}
+
+    for (
+        id_index,
+        link_index,
+        type_index,
+        name_index,
+        domain_index,
+        hash_index,
+        flags,
+        page_offset,
+    ) in zip(*(reader.column(name) for name in UNIT_COLUMNS)):
+        id = strings[id_index]
+        reference = (
+            ObjectReference(id, strings[link_index])
+            if link_index != NONE_INDEX
+            else None
+        )
+        unit_type = (
+            unit_types[strings[type_index]] if type_index != NONE_INDEX else None
+        )
+
+        if flags & HAS_REFERENCE:
+            reference_by_id[id] = reference
+        if flags & HAS_ROW:
+            row_by_id[id] = DataCatalogRow(
+                id,
+                reference,
+                unit_type,
+                strings[name_index],
+                None if domain_index == NONE_INDEX else strings[domain_index],
+            )
+        if flags & HAS_PAGE:
+            page_by_id[id] = page_decoders[unit_type].decode(
+                id, reference, page_words, page_offset, strings
+            )
+        if hash_index != NONE_INDEX:
+            content_hash_by_id[id] = strings[hash_index]
+
+    return IndexedCatalog(
+        row_by_id=row_by_id,
+        reference_by_id=reference_by_id,
+        page_by_id=page_by_id,
+        last_edited_time=reader.last_edited_time(),
+        content_hash_by_id=content_hash_by_id,
+    )
+
+
+def write_checkpoint(indexed_catalog: IndexedCatalog, path: Path | str) -> None:
+    """Write a checkpoint file atomically.
+
+    :param indexed_catalog: Catalog content to persist.
+    :type indexed_catalog: IndexedCatalog
+    :param path: Checkpoint file path.
+    :type path: Path | str
+    """
+    write_checkpoint_bytes(encode_indexed_catalog(indexed_catalog), path)
+
+
+def write_checkpoint_bytes(payload: bytes, path: Path | str) -> None:
+    """Write encoded checkpoint bytes to a file atomically.
+
+    :param payload: Bytes returned by :func:`encode_indexed_catalog`.
+    :type payload: bytes
+    :param path: Checkpoint file path.
+    :type path: Path | str
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: Path | str) -> IndexedCatalog:
+    """Read a complete checkpoint file.
+
+    :param path: Checkpoint file path.
+    :type path: Path | str
+    :returns: Indexed catalog.
+    :rtype: IndexedCatalog
+    :raises ValueError: If the file is not a supported checkpoint.
+    """
+    with open(path, "rb") as f:
+        return decode_indexed_catalog(f.read())
+
+
+class _WordView:
+    def __init__(self, reader: CheckpointReader):
+        self.reader = reader
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _from_little_endian(
+                self.reader.buffer,
+                self.reader._pages_offset + 4 * index.start,
+                index.stop - index.start,
+            )
+        return self.reader.page_word(index)
+
+
+class _StringView:
+    def __init__(self, reader: CheckpointReader):
+        self.reader = reader
+        self.cache: Dict[int, str] = {}
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if index == NONE_INDEX:
+            return None
+        value = self.cache.get(index)
+        if value is None:
+            value = self.cache[index] = self.reader.string(index)
+        return value
+
+
+class LazyCheckpointMapping(MutableMapping):
+    """Mapping over one kind of stored unit value, decoded on first access.
+
+    Writes go to an in-memory overlay and deletions hide stored keys, the
+    checkpoint itself is never modified.
+    """
+
+    def __init__(
+        self,
+        reader: CheckpointReader,
+        flag: int,
+        find: Callable[[str], Optional[int]],
+        decode: Callable[[int, str], object],
+    ):
+        """Create a mapping over stored units that have ``flag`` set.
+
+        :param reader: Reader of the mapped checkpoint.
+        :type reader: CheckpointReader
+        :param flag: Unit flag marking units that have this kind of value.
+        :type flag: int
+        :param find: Returns the unit position of an id, or ``None``.
+        :type find: Callable[[str], int | None]
+        :param decode: Builds the value of a unit from its position and id.
+        :type decode: Callable[[int, str], object]
+        """
+        self._reader = reader
+        self._flag = flag
+        self._find = find
+        self._decode = decode
+        self._overlay: Dict[str, object] = {}
+        self._hidden: Set[str] = set()
+        self._cache: Dict[str, object] = {}
+        self._stored_ids: Optional[List[str]] = None
+
+    def _stored_position(self, key: str) -> Optional[int]:
+        if key in self._hidden:
+            return None
+        position = self._find(key)
+        if position is None or not self._reader.cell("flags", position) & self._flag:
+            return None
+        return position
+
+    def _stored_keys(self) -> List[str]:
+        if self._stored_ids is None:
+            self._stored_ids = [
+                id
+                for id, flags in zip(self._reader.ids(), self._reader.column("flags"))
+                if flags & self._flag
+            ]
+        return self._stored_ids
+
+    def __getitem__(self, key: str):
+        if key in self._overlay:
+            return self._overlay[key]
+        if key in self._cache and key not in self._hidden:
+            return self._cache[key]
+
+        position = self._stored_position(key)
+        if position is None:
+            raise KeyError(key)
+
+        value = self._cache[key] = self._decode(position, key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._overlay or self._stored_position(key) is not None
+
+    def __setitem__(self, key: str, value) -> None:
+        if key not in self._overlay and self._stored_position(key) is not None:
+            self._hidden.add(key)
+        self._overlay[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._overlay:
+            del self._overlay[key]
+        elif self._stored_position(key) is not None:
+            self._hidden.add(key)
+        else:
+            raise KeyError(key)
+        self._cache.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._stored_keys():
+            if key not in self._hidden:
+                yield key
+        yield from list(self._overlay)
+
+    def __len__(self) -> int:
+        return len(self._stored_keys()) - len(self._hidden) + len(self._overlay)
+
+
+class MappedCheckpoint:
+    """Memory-mapped checkpoint exposed as a lazily decoded catalog.
+
+    Opening only parses the header, so startup cost does not depend on the
+    catalog size. Rows, references, pages and hashes are decoded when they are
+    first looked up.
+    """
+
+    def __init__(self, path: Path | str):
+        """Map a checkpoint file.
+
+        :param path: Checkpoint file path.
+        :type path: Path | str
+        :raises ValueError: If the file is not a supported checkpoint.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.reader = CheckpointReader(self._buffer)
+        except Exception:
+            self.close()
+            raise
+
+        self._strings = _StringView(self.reader)
+        self._words = _WordView(self.reader)
+        self._page_decoders = {
+            unit_type: PageDecoder(unit_type, stored_fields)
+            for unit_type, stored_fields in self.reader.page_fields_by_type.items()
+        }
+
+        self._positions: Dict[str, Optional[int]] = {}
+
+        def mapping(flag: int, decode: Callable[[int, str], object]):
+            return LazyCheckpointMapping(self.reader, flag, self._find, decode)
+
+        self.indexed_catalog = IndexedCatalog(
+            row_by_id=mapping(HAS_ROW, self._decode_row),
+            reference_by_id=mapping(HAS_REFERENCE, self._reference),
+            page_by_id=mapping(HAS_PAGE, self._decode_page),
+            last_edited_time=self.reader.last_edited_time(),
+            content_hash_by_id=mapping(HAS_CONTENT_HASH, self._decode_content_hash),
+        )
+
+    def _find(self, id: str) -> Optional[int]:
+        if id not in self._positions:
+            self._positions[id] = self.reader.find(id)
+        return self._positions[id]
+
+    def _reference(self, position: int, id: str) -> Optional[ObjectReference]:
+        link_index = self.reader.cell("reference_link", position)
+        if link_index == NONE_INDEX:
+            return None
+        return ObjectReference(id, self.reader.string(link_index))
+
+    def _unit_type(self, position: int) -> DataUnitType:
+        return DataUnitType(self._string(self.reader.cell("data_unit_type", position)))
+
+    def _decode_row(self, position: int, id: str) -> DataCatalogRow:
+        return DataCatalogRow(
+            id,
+            self._reference(position, id),
+            self._unit_type(position),
+            self.reader.string(self.reader.cell("data_unit_name", position)),
+            self._string(self.reader.cell("domain", position)),
+        )
+
+    def _string(self, index: int) -> Optional[str]:
+        if index == NONE_INDEX:
+            return None
+        return self._strings[index]
+
+    def _decode_page(
+        self, position: int, id: str
+    ) -> EntityPage | AttributePage | RelationPage:
+        return self._page_decoders[self._unit_type(position)].decode(
+            id,
+            self._reference(position, id),
+            self._words,
+            self.reader.cell("page_offset", position),
+            self._strings,
+        )
+
+    def _decode_content_hash(self, position: int, id: str) -> str:
+        return self.reader.string(self.reader.cell("content_hash", position))
+
+    def materialize(self, indexed_catalog: IndexedCatalog) -> IndexedCatalog:
+        """Return a fully decoded copy of a catalog backed by this checkpoint.
+
+        Stored units are decoded in one pass, then the overlay and deletions of
+        every lazy mapping are applied. Mappings that are not backed by this
+        checkpoint are taken over as they are.
+
+        :param indexed_catalog: Catalog whose mappings may be lazy views of
+            this checkpoint.
+        :type indexed_catalog: IndexedCatalog
+        :returns: Catalog made of plain dictionaries.
+        :rtype: IndexedCatalog
+        """
+        stored = decode_indexed_catalog(self._buffer)
+
+        def merged(mapping, stored_values: Dict[str, object]):
+            if not (
+                isinstance(mapping, LazyCheckpointMapping)
+                and mapping._reader is self.reader
+            ):
+                return mapping
+            for key in mapping._hidden:
+                stored_values.pop(key, None)
+            stored_values.update(mapping._overlay)
+            return stored_values
+
+        return IndexedCatalog(
+            row_by_id=merged(indexed_catalog.row_by_id, stored.row_by_id),
+            reference_by_id=merged(
+                indexed_catalog.reference_by_id, stored.reference_by_id
+            ),
+            page_by_id=merged(indexed_catalog.page_by_id, stored.page_by_id),
+            last_edited_time=indexed_catalog.last_edited_time,
+            content_hash_by_id=merged(
+                indexed_catalog.content_hash_by_id, stored.content_hash_by_id
+            ),
+        )
+
+    def close(self) -> None:
+        """Release the memory map. Mappings of this checkpoint stop working."""
+        buffer = getattr(self, "_buffer", None)
+        if buffer is not None:
+            buffer.close()
+            self._buffer = None
+        self._file.close()
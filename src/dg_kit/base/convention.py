@@ -2,23 +2,112 @@
 
 from __future__ import annotations
 
-from typing import List, Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from operator import attrgetter
+from pathlib import Path
+from typing import List, Any, Callable, Dict, Iterator, Optional, Sequence, Set, Tuple
+import cProfile
+import io
 import logging
+import os
+import pstats
 import re
+import time
 
 from dg_kit.base.physical_model import PhysicalModel
+from dg_kit.base import add_value_to_indexed_list
 from dg_kit.base.logical_model import LogicalModel
-from dg_kit.base.dataclasses.logical_model import Entity, Attribute, Relation
 from dg_kit.base.enums import ConventionRuleSeverity
+from dg_kit.base.convention_cache import (
+    ConventionCache,
+    block_digests,
+    changed_block_ids,
+    fingerprint,
+)
+from dg_kit.base.rule_plugins import load_rule_plugin
+from dg_kit.base.rule_dsl import (
+    ModelColumns,
+    compile_declarative_rules,
+    declarative_inputs,
+    evaluate_declarative_rules,
+)
 from dg_kit.base.dataclasses.convention import (
+    DeclarativeRule,
+    IncrementalConventionRule,
     ConventionRule,
     ConventionRuleFn,
+    ConventionRuleInputs,
+    ConventionRuleScopeFn,
+    ConventionRuleStats,
     ConventionBreach,
 )
 
 
 logger = logging.getLogger(__name__)
 
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Breaches and stats of one rule run.
+RuleResult = Tuple[List[ConventionBreach], ConventionRuleStats]
+PROFILE_TOP_FUNCTIONS = 25
+MAX_LAYER_PAIR_EXAMPLES = 5
+
+# Objects scanned by the built-in rules, reported in rule stats.
+BUILTIN_RULE_SCOPES: Dict[str, ConventionRuleScopeFn] = {
+    "allowed_dependencies": lambda LM, PM: sum(
+        len(dependencies) for dependencies in PM.dependencies.values()
+    ),
+    "regex_by_layer": lambda LM, PM: len(PM.tables),
+    "lm_x_pm_consistency": lambda LM, PM: (
+        len(LM.all_units_by_id) + len(PM.tables) + len(PM.columns)
+    ),
+}
+
+
+def _flatten(
+    issues_by_object: Dict[str, List[ConventionBreach]],
+) -> List[ConventionBreach]:
+    return [issue for issues in issues_by_object.values() for issue in issues]
+
+
+def _layer_name_by_unit_id(PM: PhysicalModel) -> Dict[str, str]:
+    layer_name_by_id = {layer.id: layer.name for layer in PM.layers.values()}
+    return {
+        unit_id: layer_name_by_id[unit.layer_id]
+        for units in (PM.tables, PM.columns)
+        for unit_id, unit in units.items()
+    }
+
+
+def _compile_matcher(patterns: List[str]) -> Callable[[str], Any]:
+    """Compile layer patterns into a single case-insensitive matcher.
+
+    Patterns are joined into one alternation, so a table name is tested with a
+    single regex call. Patterns with backreferences keep their own group
+    numbering and are tried one by one, stopping at the first match.
+
+    :param patterns: Regular expressions matched at the start of table names.
+    :type patterns: list[str]
+    :returns: Function returning a match for names accepted by any pattern.
+    :rtype: Callable[[str], Any]
+    """
+    compiled = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    if len(compiled) == 1:
+        return compiled[0].match
+
+    if not any(_BACKREFERENCE.search(pattern) for pattern in patterns):
+        try:
+            return re.compile(
+                "|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE
+            ).match
+        except re.error:
+            # Global inline flags or duplicate group names cannot be combined.
+            pass
+
+    return lambda name: any(regexp.match(name) for regexp in compiled)
+
 
 class Convention:
     """Store convention rules and execute convention checks."""
@@ -34,6 +123,9 @@ class Convention:
         self.name = name
         self.convention_config = convention_config
         self.rules: List[ConventionRule] = []
+        self._matchers_cache: Dict[str, Dict[str, Callable[[str], Any]]] = {}
+        self._declarative_cache: Dict[str, Tuple[DeclarativeRule, ...]] = {}
+        self._shared_columns: Optional[ModelColumns] = None
 
         if self.convention_config:
             for rule_name in convention_config["rules"]:
@@ -46,15 +138,86 @@ class Convention:
                         description=convention_config["rules"][rule_name][
                             "description"
                         ],
-                        fn=getattr(self, rule_name),
+                        fn=self._rule_fn(rule_name),
+                        scope=BUILTIN_RULE_SCOPES.get(rule_name),
+                        incremental=self._incremental_rule(rule_name),
                     )
                 )
 
+            if "regex_by_layer" in convention_config["rules"]:
+                self._layer_name_matchers(
+                    convention_config["rules"]["regex_by_layer"]["rules"]
+                )
+            if "declarative" in convention_config["rules"]:
+                self._declarative_rules(convention_config["rules"]["declarative"])
+
+    def _rule_fn(self, rule_name: str) -> ConventionRuleFn:
+        """Resolve a configured rule name to its function.
+
+        Methods of this class, built-in rules and those of subclasses, come
+        first. Other names are loaded from installed
+        ``dg_kit.convention_rules`` entry points.
+
+        :param rule_name: Rule name from the convention configuration.
+        :type rule_name: str
+        :returns: Rule function.
+        :rtype: ConventionRuleFn
+        :raises ValueError: If the rule is neither a method nor installed.
+        """
+        fn = getattr(self, rule_name, None)
+        if callable(fn):
+            return fn
+
+        return load_rule_plugin(rule_name)
+
+    def _incremental_rule(self, rule_name: str) -> Optional[IncrementalConventionRule]:
+        """Return the incremental form of a built-in rule, if it has one.
+
+        :param rule_name: Built-in rule name.
+        :type rule_name: str
+        :returns: Per-object inputs and check functions of the rule.
+        :rtype: IncrementalConventionRule | None
+        """
+        inputs = getattr(self, f"_{rule_name}_inputs", None)
+        check = getattr(self, f"_{rule_name}_check", None)
+        if inputs is None or check is None:
+            return None
+
+        return IncrementalConventionRule(inputs=inputs, check=check)
+
+    @contextmanager
+    def shared_model_columns(
+        self, LM: LogicalModel, PM: PhysicalModel
+    ) -> Iterator[None]:
+        """Share one columnar view of the models between rules.
+
+        Within the context, built-in rules reading ``LM`` and ``PM`` reuse the
+        same :class:`ModelColumns`, so every column is read once per
+        validation. The models must not change within the context.
+
+        :param LM: Logical model being validated.
+        :type LM: LogicalModel
+        :param PM: Physical model being validated.
+        :type PM: PhysicalModel
+        """
+        self._shared_columns = self._model_columns(LM, PM)
+        try:
+            yield
+        finally:
+            self._shared_columns = None
+
+    def _model_columns(self, LM: LogicalModel, PM: PhysicalModel) -> ModelColumns:
+        columns = self._shared_columns
+        if columns is not None and columns.LM is LM and columns.PM is PM:
+            return columns
+        return ModelColumns(LM, PM)
+
     def rule(
         self,
         name: str,
         severity: ConventionRuleSeverity,
         description: str,
+        scope: Optional[ConventionRuleScopeFn] = None,
     ):
         """Register a validation rule on the convention instance.
 
@@ -64,12 +227,14 @@ class Convention:
         :type severity: ConventionRuleSeverity
         :param description: Human-readable rule description.
         :type description: str
+        :param scope: Counts the model objects the rule scans, for rule stats.
+        :type scope: ConventionRuleScopeFn | None
         :returns: Decorator that registers the wrapped rule function.
         :rtype: ConventionRuleFn
         """
 
         def rule_registry(fn: ConventionRuleFn) -> ConventionRuleFn:
-            self.rules.append(ConventionRule(name, severity, description, fn))
+            self.rules.append(ConventionRule(name, severity, description, fn, scope))
             return fn
 
         return rule_registry
@@ -77,6 +242,10 @@ class Convention:
     def allowed_dependencies(self, LM: LogicalModel, PM: PhysicalModel, **kwargs):
         """Validate that dependencies only target allowed layers.
 
+        With ``group_by_layer_pair`` enabled, forbidden dependencies are
+        reported once per dependent and dependency layer pair instead of once
+        per dependency.
+
         :param LM: Logical model, unused but accepted for rule signature compatibility.
         :type LM: LogicalModel
         :param PM: Physical model containing dependency information.
@@ -86,41 +255,155 @@ class Convention:
         :returns: Detected convention breaches.
         :rtype: list[ConventionBreach]
         """
-        issues = []
-        missing_allowed_dependencies = []
-        rules_by_layer = kwargs.get("rules", {})
+        return _flatten(self._allowed_dependencies_check(LM, PM, None, **kwargs))
+
+    def _allowed_dependencies_inputs(
+        self, LM: LogicalModel, PM: PhysicalModel, **kwargs
+    ) -> List[ConventionRuleInputs]:
+        # Objects are listed in the order the check reports them: a layer
+        # before its first dependent, and layer pairs after every layer.
+        units = PM.all_units_by_id
+        layer_names_by_id = {layer.id: layer.name for layer in PM.layers.values()}
+        layer_name_by_id = {
+            table.id: layer_names_by_id[table.layer_id] for table in PM.tables.values()
+        }
+        group_by_layer_pair = kwargs.get("group_by_layer_pair", False)
+
+        ids: List[str] = []
+        names: List[str] = []
+        layer_names: List[str] = []
+        dependencies: List[str] = []
+        layer_ids: Set[str] = set()
+        edges_by_layer_pair: Dict[str, List[str]] = {}
+        for dependent_id, dependency_ids in PM.dependencies.items():
+            if not dependency_ids:
+                continue
+
+            layer_name = layer_name_by_id[dependent_id]
+            layer_id = f"layer:{layer_name}"
+            if layer_id not in layer_ids:
+                layer_ids.add(layer_id)
+                ids.append(layer_id)
+                names.append(layer_name)
+                layer_names.append(layer_name)
+                dependencies.append("")
+
+            if group_by_layer_pair:
+                for dependency_id in dependency_ids:
+                    add_value_to_indexed_list(
+                        edges_by_layer_pair,
+                        f"{layer_name}->{layer_name_by_id[dependency_id]}",
+                        f"{units[dependent_id].name}\x1e{units[dependency_id].name}",
+                    )
+                continue
+
+            ids.append(dependent_id)
+            names.append(units[dependent_id].name)
+            layer_names.append(layer_name)
+            dependencies.append(
+                "\x1f".join(
+                    sorted(
+                        f"{units[dependency_id].name}\x1e{layer_name_by_id[dependency_id]}"
+                        for dependency_id in dependency_ids
+                    )
+                )
+            )
+
+        blocks: List[ConventionRuleInputs] = [(ids, (names, layer_names, dependencies))]
+        if group_by_layer_pair:
+            layer_pairs = list(edges_by_layer_pair)
+            edges = [
+                "\x1f".join(sorted(edges_by_layer_pair[pair])) for pair in layer_pairs
+            ]
+            blocks.append((layer_pairs, (edges,)))
+
+        return blocks
+
+    def _allowed_dependencies_check(
+        self,
+        LM: LogicalModel,
+        PM: PhysicalModel,
+        object_ids: Optional[Set[str]],
+        **kwargs,
+    ) -> Dict[str, List[ConventionBreach]]:
+        issues: Dict[str, List[ConventionBreach]] = {}
+        severity = ConventionRuleSeverity(kwargs["severity"])
+        group_by_layer_pair = kwargs.get("group_by_layer_pair", False)
+
+        layer_name_by_id = _layer_name_by_unit_id(PM)
+        allowed_layers_by_layer = {
+            layer_name: frozenset(allowed_layers)
+            for layer_name, allowed_layers in kwargs.get("rules", {}).items()
+            if allowed_layers is not None
+        }
+        forbidden_by_layer_pair: Dict[str, List[Tuple[str, str]]] = {}
+
         for dependent_id, dependencies_set in PM.dependencies.items():
-            for dependency_id in dependencies_set:
-                dependent = PM.all_units_by_id[dependent_id]
-                dependent_layer = PM.layers[dependent.layer_id]
-
-                dependency = PM.all_units_by_id[dependency_id]
-                dependency_layer = PM.layers[dependency.layer_id]
-
-                allowed_dependency_layers = rules_by_layer.get(dependent_layer.name)
-                if allowed_dependency_layers is None:
-                    if dependent_layer.name not in missing_allowed_dependencies:
-                        message = (
-                            f"Missing allowed_dependencies rule for dependent layer "
-                            f"'{dependent_layer.name}'"
+            if not dependencies_set:
+                continue
+
+            dependent_layer_name = layer_name_by_id[dependent_id]
+            allowed_layers = allowed_layers_by_layer.get(dependent_layer_name)
+
+            if allowed_layers is None:
+                layer_key = f"layer:{dependent_layer_name}"
+                if layer_key not in issues and (
+                    object_ids is None or layer_key in object_ids
+                ):
+                    message = (
+                        f"Missing allowed_dependencies rule for dependent layer "
+                        f"'{dependent_layer_name}'"
+                    )
+                    issues[layer_key] = [
+                        ConventionBreach(
+                            severity=ConventionRuleSeverity.WARNING,
+                            message=message,
                         )
-                        issues.append(
-                            ConventionBreach(
-                                severity=ConventionRuleSeverity.WARNING,
-                                message=message,
-                            )
+                    ]
+                continue
+
+            if group_by_layer_pair:
+                for dependency_id in dependencies_set:
+                    dependency_layer_name = layer_name_by_id[dependency_id]
+                    if dependency_layer_name not in allowed_layers:
+                        add_value_to_indexed_list(
+                            forbidden_by_layer_pair,
+                            f"{dependent_layer_name}->{dependency_layer_name}",
+                            (dependent_id, dependency_id),
                         )
-                        missing_allowed_dependencies.append(dependent_layer.name)
-                        continue
-                    else:
-                        continue
+                continue
 
-                if dependency_layer.name not in allowed_dependency_layers:
-                    issue = ConventionBreach(
-                        severity=ConventionRuleSeverity(kwargs["severity"]),
-                        message=f"{dependent.name} from {dependent_layer.name} layer depends on {dependency.name} which is from {dependency_layer.name} layer",
-                    )
-                    issues.append(issue)
+            if object_ids is not None and dependent_id not in object_ids:
+                continue
+
+            dependent_name = PM.all_units_by_id[dependent_id].name
+            issues[dependent_id] = [
+                ConventionBreach(
+                    severity=severity,
+                    message=f"{dependent_name} from {dependent_layer_name} layer depends on {PM.all_units_by_id[dependency_id].name} which is from {layer_name_by_id[dependency_id]} layer",
+                )
+                for dependency_id in dependencies_set
+                if layer_name_by_id[dependency_id] not in allowed_layers
+            ]
+
+        for layer_pair, edges in forbidden_by_layer_pair.items():
+            if object_ids is not None and layer_pair not in object_ids:
+                continue
+
+            dependent_layer_name, dependency_layer_name = layer_pair.split("->", 1)
+            examples = sorted(
+                f"{PM.all_units_by_id[dependent_id].name} -> "
+                f"{PM.all_units_by_id[dependency_id].name}"
+                for dependent_id, dependency_id in edges
+            )
+            message = (
+                f"{len(edges)} dependencies from {dependent_layer_name} layer on "
+                f"{dependency_layer_name} layer: "
+                f"{', '.join(examples[:MAX_LAYER_PAIR_EXAMPLES])}"
+            )
+            if len(examples) > MAX_LAYER_PAIR_EXAMPLES:
+                message += f" and {len(examples) - MAX_LAYER_PAIR_EXAMPLES} more"
+            issues[layer_pair] = [ConventionBreach(severity=severity, message=message)]
 
         return issues
 
@@ -136,113 +419,237 @@ class Convention:
         :returns: Detected convention breaches.
         :rtype: list[ConventionBreach]
         """
-        issues = []
-
-        regexp_by_layer_name = {}
+        return _flatten(self._regex_by_layer_check(LM, PM, None, **kwargs))
+
+    def _regex_by_layer_inputs(
+        self, LM: LogicalModel, PM: PhysicalModel, **kwargs
+    ) -> List[ConventionRuleInputs]:
+        columns = self._model_columns(LM, PM)
+        return [
+            (
+                columns.column("table", "id"),
+                (columns.column("table", "name"), columns.column("table", "layer")),
+            )
+        ]
 
-        for regexp_name in kwargs["rules"]:
-            if kwargs["rules"][regexp_name]["layer"] in regexp_by_layer_name:
-                regexp_by_layer_name[kwargs["rules"][regexp_name]["layer"]].append(
-                    re.compile(
-                        kwargs["rules"][regexp_name]["regex"]["string"], re.IGNORECASE
-                    )
-                )
-            else:
-                regexp_by_layer_name[kwargs["rules"][regexp_name]["layer"]] = [
-                    re.compile(
-                        kwargs["rules"][regexp_name]["regex"]["string"], re.IGNORECASE
-                    )
-                ]
+    def _regex_by_layer_check(
+        self,
+        LM: LogicalModel,
+        PM: PhysicalModel,
+        object_ids: Optional[Set[str]],
+        **kwargs,
+    ) -> Dict[str, List[ConventionBreach]]:
+        issues: Dict[str, List[ConventionBreach]] = {}
+
+        matcher_by_layer_name = self._layer_name_matchers(kwargs["rules"])
+        matcher_by_layer_id = {
+            layer.id: matcher_by_layer_name[layer.name]
+            for layer in PM.layers.values()
+            if layer.name in matcher_by_layer_name
+        }
 
         for table in PM.tables.values():
-            if PM.layers[table.layer_id].name in regexp_by_layer_name:
-                regexp_gates = {
-                    comp_regexp.match(table.name)
-                    for comp_regexp in regexp_by_layer_name[
-                        PM.layers[table.layer_id].name
-                    ]
-                }
-                if not any(regexp_gates):
-                    issues.append(
+            if object_ids is not None and table.id not in object_ids:
+                continue
+
+            matcher = matcher_by_layer_id.get(table.layer_id)
+            if matcher is not None:
+                if not matcher(table.name):
+                    issues[table.id] = [
                         ConventionBreach(
                             severity=ConventionRuleSeverity(kwargs["severity"]),
                             message=f"Table '{table.name}' violates naming convention.",
                         )
-                    )
+                    ]
 
         return issues
 
-    def lm_x_pm_consistency(self, LM: LogicalModel, PM: PhysicalModel, **kwargs):
-        issues = []
+    def _layer_name_matchers(
+        self, regex_rules: Dict[str, Any]
+    ) -> Dict[str, Callable[[str], Any]]:
+        """Return the compiled table name matcher of every layer.
+
+        Matchers are compiled once per distinct ``regex_by_layer`` rule set.
 
-        lm_objects_by_pm_id: Dict[str, List[Entity | Attribute | Relation]] = {}
+        :param regex_rules: ``rules`` of the ``regex_by_layer`` configuration.
+        :type regex_rules: dict[str, Any]
+        :returns: Matcher by layer name. A matcher returns a truthy value when
+            a table name matches any pattern of its layer.
+        :rtype: dict[str, Callable[[str], Any]]
+        """
+        cache_key = fingerprint(regex_rules)
+        if cache_key not in self._matchers_cache:
+            patterns_by_layer_name: Dict[str, List[str]] = {}
+            for regexp_rule in regex_rules.values():
+                add_value_to_indexed_list(
+                    patterns_by_layer_name,
+                    regexp_rule["layer"],
+                    regexp_rule["regex"]["string"],
+                )
+
+            self._matchers_cache[cache_key] = {
+                layer_name: _compile_matcher(patterns)
+                for layer_name, patterns in patterns_by_layer_name.items()
+            }
+
+        return self._matchers_cache[cache_key]
+
+    def declarative(self, LM: LogicalModel, PM: PhysicalModel, **kwargs):
+        """Validate model objects against declarative rules.
+
+        See :mod:`dg_kit.base.rule_dsl` for the rule format.
+
+        :param LM: Logical model containing entities, attributes and relations.
+        :type LM: LogicalModel
+        :param PM: Physical model containing tables and columns.
+        :type PM: PhysicalModel
+        :param kwargs: Rule configuration with declarative rules and severity.
+        :type kwargs: dict[str, Any]
+        :returns: Detected convention breaches.
+        :rtype: list[ConventionBreach]
+        """
+        return _flatten(self._declarative_check(LM, PM, None, **kwargs))
+
+    def _declarative_inputs(
+        self, LM: LogicalModel, PM: PhysicalModel, **kwargs
+    ) -> Dict[str, Any]:
+        return declarative_inputs(
+            self._declarative_rules(kwargs), self._model_columns(LM, PM)
+        )
+
+    def _declarative_check(
+        self,
+        LM: LogicalModel,
+        PM: PhysicalModel,
+        object_ids: Optional[Set[str]],
+        **kwargs,
+    ) -> Dict[str, List[ConventionBreach]]:
+        return evaluate_declarative_rules(
+            self._declarative_rules(kwargs), self._model_columns(LM, PM), object_ids
+        )
+
+    def _declarative_rules(
+        self, declarative_config: Dict[str, Any]
+    ) -> Tuple[DeclarativeRule, ...]:
+        """Return compiled declarative rules, compiling each rule set once.
+
+        :param declarative_config: Configuration of the ``declarative`` rule.
+        :type declarative_config: dict[str, Any]
+        :returns: Compiled rules.
+        :rtype: tuple[DeclarativeRule, ...]
+        """
+        cache_key = fingerprint(
+            [declarative_config.get("rules", {}), declarative_config["severity"]]
+        )
+        if cache_key not in self._declarative_cache:
+            self._declarative_cache[cache_key] = compile_declarative_rules(
+                declarative_config.get("rules", {}),
+                ConventionRuleSeverity(declarative_config["severity"]),
+            )
+
+        return self._declarative_cache[cache_key]
+
+    def lm_x_pm_consistency(self, LM: LogicalModel, PM: PhysicalModel, **kwargs):
+        return _flatten(self._lm_x_pm_consistency_check(LM, PM, None, **kwargs))
+
+    def _lm_x_pm_consistency_inputs(
+        self, LM: LogicalModel, PM: PhysicalModel, **kwargs
+    ) -> List[ConventionRuleInputs]:
+        columns = self._model_columns(LM, PM)
+        lm_units = list(LM.all_units_by_id.values())
+        mapped_ids = LM.lm_ids_by_pm_id
+        table_ids = columns.column("table", "id")
+        column_ids = columns.column("column", "id")
+
+        return [
+            (
+                list(LM.all_units_by_id),
+                (
+                    list(map(attrgetter("name"), lm_units)),
+                    list(map(bool, map(attrgetter("pm_map"), lm_units))),
+                ),
+            ),
+            (
+                table_ids,
+                (
+                    columns.column("table", "name"),
+                    columns.column("table", "layer"),
+                    list(map(mapped_ids.__contains__, table_ids)),
+                ),
+            ),
+            (
+                column_ids,
+                (
+                    columns.column("column", "name"),
+                    columns.column("column", "layer"),
+                    columns.column("column", "table"),
+                    list(map(mapped_ids.__contains__, column_ids)),
+                ),
+            ),
+        ]
+
+    def _lm_x_pm_consistency_check(
+        self,
+        LM: LogicalModel,
+        PM: PhysicalModel,
+        object_ids: Optional[Set[str]],
+        **kwargs,
+    ) -> Dict[str, List[ConventionBreach]]:
+        issues: Dict[str, List[ConventionBreach]] = {}
+        severity = ConventionRuleSeverity(
+            self.convention_config["rules"]["lm_x_pm_consistency"]["severity"]
+        )
 
         for unit in LM.all_units_by_id.values():
+            if object_ids is not None and unit.id not in object_ids:
+                continue
+
             if not unit.pm_map:
-                issues.append(
+                issues[unit.id] = [
                     ConventionBreach(
-                        severity=ConventionRuleSeverity(
-                            self.convention_config["rules"]["lm_x_pm_consistency"][
-                                "severity"
-                            ]
-                        ),
+                        severity=severity,
                         message=f"Missing PM mapping for {unit.name}",
                     )
-                )
-                continue
-            else:
-                for pm_obj in LM.pm_objects_by_lm_id[unit.id]:
-                    if pm_obj.id in lm_objects_by_pm_id:
-                        lm_objects_by_pm_id[pm_obj.id].append(unit.id)
-                    else:
-                        lm_objects_by_pm_id[pm_obj.id] = [unit.id]
-
-        lm_mapping_layers = []
-
-        for layer in PM.layers.values():
-            if layer.name in self.convention_config["lm_mapping_layers"]:
-                lm_mapping_layers.append(layer.id)
-
-        for pm_unit in PM.tables.values():
-            if (
-                pm_unit.layer_id in lm_mapping_layers
-                and pm_unit.id not in lm_objects_by_pm_id
-            ):
-                layer_name = PM.layers[pm_unit.layer_id].name
-                issues.append(
-                    ConventionBreach(
-                        severity=ConventionRuleSeverity(
-                            self.convention_config["rules"]["lm_x_pm_consistency"][
-                                "severity"
-                            ]
-                        ),
-                        message=f"This PM object is not used in LM: {layer_name}.{pm_unit.name}",
-                    )
-                )
+                ]
 
-        for pm_unit in PM.columns.values():
-            if (
-                pm_unit.layer_id in lm_mapping_layers
-                and pm_unit.id not in lm_objects_by_pm_id
-            ):
-                layer_name = PM.layers[pm_unit.layer_id].name
-                if layer_name in self.convention_config["technical_fields"]:
-                    technical_fields = self.convention_config["technical_fields"][
-                        layer_name
-                    ]
-                    if pm_unit.name in technical_fields:
+        lm_mapping_layer_names = set(self.convention_config["lm_mapping_layers"])
+        lm_mapping_layer_name_by_id = {
+            layer.id: layer.name
+            for layer in PM.layers.values()
+            if layer.name in lm_mapping_layer_names
+        }
+        technical_fields_by_layer_name = {
+            layer_name: frozenset(technical_fields or ())
+            for layer_name, technical_fields in self.convention_config.get(
+                "technical_fields", {}
+            ).items()
+        }
+
+        for pm_units in (PM.tables, PM.columns):
+            for pm_unit in pm_units.values():
+                if object_ids is not None and pm_unit.id not in object_ids:
+                    continue
+
+                layer_name = lm_mapping_layer_name_by_id.get(pm_unit.layer_id)
+                if layer_name is None or pm_unit.id in LM.lm_ids_by_pm_id:
+                    continue
+
+                if pm_units is PM.tables:
+                    pm_unit_path = f"{layer_name}.{pm_unit.name}"
+                else:
+                    if pm_unit.name in technical_fields_by_layer_name.get(
+                        layer_name, ()
+                    ):
                         continue
-                table_name = PM.tables[pm_unit.table_id].name
-                issues.append(
+                    table_name = PM.tables[pm_unit.table_id].name
+                    pm_unit_path = f"{layer_name}.{table_name}.{pm_unit.name}"
+
+                issues[pm_unit.id] = [
                     ConventionBreach(
-                        severity=ConventionRuleSeverity(
-                            self.convention_config["rules"]["lm_x_pm_consistency"][
-                                "severity"
-                            ]
-                        ),
-                        message=f"This PM object is not used in LM: {layer_name}.{table_name}.{pm_unit.name}",
+                        severity=severity,
+                        message=f"This PM object is not used in LM: {pm_unit_path}",
                     )
-                )
+                ]
 
         return issues
 
@@ -250,7 +657,15 @@ class Convention:
 class ConventionValidator:
     """Run all configured convention rules against logical and physical models."""
 
-    def __init__(self, lm: LogicalModel, pm: PhysicalModel, convention: Convention):
+    def __init__(
+        self,
+        lm: LogicalModel,
+        pm: PhysicalModel,
+        convention: Convention,
+        jobs: int = 1,
+        profile: bool = False,
+        cache_path: Optional[str | Path] = None,
+    ):
         """Initialize the validator.
 
         :param lm: Logical model to validate.
@@ -259,26 +674,234 @@ class ConventionValidator:
         :type pm: PhysicalModel
         :param convention: Convention containing validation rules.
         :type convention: Convention
+        :param jobs: Number of rules run concurrently on a thread pool. ``0``
+            uses one job per CPU. Rules run sequentially when profiling.
+        :type jobs: int
+        :param profile: Run every rule under :mod:`cProfile` and keep the top
+            functions by cumulative time in its stats.
+        :type profile: bool
+        :param cache_path: Enables incremental validation. Breaches of rules
+            that support it are cached in this file per checked object, and
+            later runs only re-check objects whose rule inputs changed.
+        :type cache_path: str | Path | None
+        :raises ValueError: If ``jobs`` is negative.
         """
+        if jobs < 0:
+            raise ValueError(f"jobs must be zero or positive, got {jobs}")
+
         self.lm = lm
         self.pm = pm
         self.convention = convention
+        self.jobs = jobs or os.cpu_count() or 1
+        self.profile = profile
+        self.cache_path = cache_path
+        self.cache: Optional[ConventionCache] = None
+        self._digest_memo: Dict[int, Tuple[Sequence[Any], str]] = {}
+        self.rule_stats: List[ConventionRuleStats] = []
 
     def validate(self) -> List[ConventionBreach]:
         """Execute all configured rules and collect breaches.
 
+        Breaches are returned in rule order, whether rules ran sequentially or
+        concurrently. Timing and breach counts of every rule are kept in
+        :attr:`rule_stats`.
+
         :returns: Validation issues found across all rules.
         :rtype: list[ConventionBreach]
         """
+        rules = self.convention.rules
+
+        if self.cache_path is not None:
+            self.cache = ConventionCache(self.cache_path)
+
+        try:
+            with self.convention.shared_model_columns(self.lm, self.pm):
+                if self.jobs > 1 and len(rules) > 1:
+                    results = self._run_concurrently(rules)
+                else:
+                    results = [self._run_rule(rule) for rule in rules]
+
+            if self.cache is not None:
+                self.cache.retain_rules(
+                    rule.name for rule in rules if rule.incremental is not None
+                )
+        finally:
+            self._digest_memo = {}
+            if self.cache is not None:
+                self.cache.close()
+                self.cache = None
+
         issues: List[ConventionBreach] = []
+        self.rule_stats = []
+        for res, stats in results:
+            issues.extend(res)
+            self.rule_stats.append(stats)
+
+        return issues
+
+    def _run_rule(self, rule: ConventionRule) -> RuleResult:
+        """Execute one rule with its configured keyword arguments.
+
+        :param rule: Rule to execute.
+        :type rule: ConventionRule
+        :returns: Breaches reported by the rule and its execution stats.
+        :rtype: RuleResult
+        """
+        kwargs = self.convention.convention_config["rules"][rule.name]
+        profiler = cProfile.Profile() if self.profile else None
+
+        if self.cache is not None and rule.incremental is not None:
+            run = partial(self._run_incremental, rule, kwargs)
+        else:
+            run = partial(self._run_full, rule, kwargs)
+
+        start = time.perf_counter()
+        if profiler is None:
+            issues, objects_scanned = run()
+        else:
+            issues, objects_scanned = profiler.runcall(run)
+        wall_time = time.perf_counter() - start
+
+        profile = None
+        if profiler is not None:
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats(
+                pstats.SortKey.CUMULATIVE
+            ).print_stats(PROFILE_TOP_FUNCTIONS)
+            profile = stream.getvalue()
+
+        stats = ConventionRuleStats(
+            rule_name=rule.name,
+            wall_time=wall_time,
+            objects_scanned=objects_scanned,
+            breach_count=len(issues),
+            profile=profile,
+        )
+
+        return issues, stats
+
+    def _run_full(
+        self, rule: ConventionRule, kwargs: Dict[str, Any]
+    ) -> Tuple[List[ConventionBreach], Optional[int]]:
+        issues = list(rule.fn(self.lm, self.pm, **kwargs))
+        objects_scanned = (
+            rule.scope(self.lm, self.pm) if rule.scope is not None else None
+        )
+
+        return issues, objects_scanned
+
+    def _run_incremental(
+        self, rule: ConventionRule, kwargs: Dict[str, Any]
+    ) -> Tuple[List[ConventionBreach], int]:
+        """Re-check only objects whose rule inputs changed since the cached run.
+
+        Input blocks are compared with the cache by column digests. Blocks
+        with changed digests are diffed row by row against their previous
+        snapshot, and only the objects that differ are re-checked. Cache
+        entries of unchanged blocks and objects are left as they are.
+
+        :param rule: Rule supporting incremental validation.
+        :type rule: ConventionRule
+        :param kwargs: Rule configuration.
+        :type kwargs: dict[str, Any]
+        :returns: Breaches of every object and the number of re-checked objects.
+        :rtype: tuple[list[ConventionBreach], int]
+        """
+        config_fingerprint = fingerprint(
+            [
+                kwargs,
+                {
+                    key: value
+                    for key, value in self.convention.convention_config.items()
+                    if key != "rules"
+                },
+            ]
+        )
+        blocks = rule.incremental.inputs(self.lm, self.pm, **kwargs)
+        digests = block_digests(blocks, self._digest_memo)
+
+        state = self.cache.rule_state(rule.name)
+        replace = (
+            state is None
+            or state[0] != config_fingerprint
+            or len(state[1]) != len(blocks)
+        )
+        previous_digests = [] if replace else state[1]
+        cached = {} if replace else self.cache.breaches(rule.name)
+
+        changed_blocks: Dict[int, ConventionRuleInputs] = {}
+        changed_ids: Set[str] = set()
+        for index, block in enumerate(blocks):
+            if not replace and digests[index] == previous_digests[index]:
+                continue
+            changed_blocks[index] = block
+            changed_ids |= (
+                set(block[0])
+                if replace
+                else changed_block_ids(
+                    block,
+                    digests[index],
+                    self.cache.block(rule.name, index),
+                    previous_digests[index],
+                )
+            )
 
-        for rule in self.convention.rules:
-            res = rule.fn(
-                self.lm,
-                self.pm,
-                **self.convention.convention_config["rules"][rule.name],
+        if changed_blocks:
+            checked = (
+                rule.incremental.check(self.lm, self.pm, changed_ids, **kwargs)
+                if changed_ids
+                else {}
             )
-            for issue in res:
-                issues.append(issue)
+            checked = {
+                object_id: checked.get(object_id, []) for object_id in changed_ids
+            }
+            current_ids = set().union(*(object_ids for object_ids, _ in blocks))
+            removed_ids = [
+                object_id for object_id in cached if object_id not in current_ids
+            ]
+            self.cache.update_rule(
+                rule.name,
+                config_fingerprint,
+                digests,
+                changed_blocks,
+                checked,
+                removed_ids,
+                replace,
+            )
+            cached.update(checked)
 
-        return issues
+        # Breaches follow the order of objects in the input blocks. Only ids
+        # with breaches are looked up one by one.
+        issues: List[ConventionBreach] = []
+        reported_ids: Set[str] = set()
+        for object_ids, _ in blocks:
+            for object_id in filter(cached.__contains__, object_ids):
+                if object_id not in reported_ids:
+                    reported_ids.add(object_id)
+                    issues.extend(cached[object_id])
+
+        logger.debug(
+            f"{rule.name}: re-checked {len(changed_ids)} of "
+            f"{sum(len(object_ids) for object_ids, _ in blocks)} objects."
+        )
+
+        return issues, len(changed_ids)
+
+    def _run_concurrently(self, rules: List[ConventionRule]) -> List[RuleResult]:
+        """Execute rules on a thread pool, keeping results in rule order.
+
+        :param rules: Rules to execute.
+        :type rules: list[ConventionRule]
+        :returns: Results of each rule, in the same order as ``rules``.
+        :rtype: list[RuleResult]
+        """
+        if self.profile:
+            # Only one profiler can be active per process.
+            logger.warning(
+                f"Profiling runs convention rules sequentially, ignoring "
+                f"jobs={self.jobs}."
+            )
+            return [self._run_rule(rule) for rule in rules]
+
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(rules))) as pool:
+            return list(pool.map(self._run_rule, rules))
@@ -0,0 +1,407 @@
+"""Breach cache used by incremental convention validation.
+
+Rules supporting incremental validation describe what they read as input
+blocks: object ids and value columns aligned with them. The cache stores, per
+rule, a fingerprint of the rule configuration, a digest of every block column
+and the breaches of every object that has any. Blocks are compared by digest,
+so a run where nothing changed does not look at single objects. Only blocks
+whose digests changed are loaded and diffed row by row against the previous
+snapshot, which yields the objects to re-check.
+
+The cache is a SQLite database. A run rewrites only the entries of rules,
+blocks and objects that changed.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+
+from dg_kit.base.dataclasses.convention import (
+    ConventionBreach,
+    ConventionRuleInputs,
+)
+from dg_kit.base.enums import ConventionRuleSeverity
+
+
+logger = logging.getLogger(__name__)
+
+CONVENTION_CACHE_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS rule_states (
+    rule_name TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    digests TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rule_blocks (
+    rule_name TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (rule_name, block)
+);
+CREATE TABLE IF NOT EXISTS object_breaches (
+    rule_name TEXT NOT NULL,
+    object_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    severity TEXT NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (rule_name, object_id, position)
+);
+"""
+_TABLES = ("cache_meta", "rule_states", "rule_blocks", "object_breaches")
+
+
+def fingerprint(value: Any) -> str:
+    """Return a stable fingerprint of a JSON-serializable value.
+
+    :param value: Value to fingerprint. Tuples are treated as lists.
+    :type value: Any
+    :returns: Hex digest that is stable across processes.
+    :rtype: str
+    """
+    payload = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def column_digest(values: Sequence[Any]) -> str:
+    """Return a stable digest of a column of strings, numbers, booleans or None.
+
+    The column is hashed as a whole, without a Python call per value. Text
+    columns are joined, boolean and code columns hashed as bytes, and other
+    columns hashed through their ``repr``.
+
+    :param values: Column values.
+    :type values: Sequence[Any]
+    :returns: Hex digest that is stable across processes.
+    :rtype: str
+    """
+    try:
+        text = "\x00".join(values)
+    except TypeError:
+        try:
+            payload = bytes(values)
+        except (TypeError, ValueError):
+            payload = _encode(repr(list(values)))
+    else:
+        payload = _encode(text)
+
+    # Columns can reach megabytes, so the fastest available digest is used.
+    # It only detects changes and carries no security meaning.
+    return hashlib.sha1(payload, usedforsecurity=False).hexdigest()
+
+
+def _encode(text: str) -> bytes:
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        return text.encode("utf-8", "surrogatepass")
+
+
+def block_digests(
+    blocks: List[ConventionRuleInputs],
+    memo: Optional[Dict[int, Tuple[Sequence[Any], str]]] = None,
+) -> List[List[str]]:
+    """Return the digests of the ids and every value column of each block.
+
+    :param blocks: Input blocks of a rule.
+    :type blocks: list[ConventionRuleInputs]
+    :param memo: Digests by column identity, shared by rules reading the same
+        columns during one validation. Columns are kept alive by the memo.
+    :type memo: dict[int, tuple[Sequence[Any], str]] | None
+    :returns: Per block, the digest of its ids followed by those of its columns.
+    :rtype: list[list[str]]
+    """
+    if memo is None:
+        memo = {}
+
+    def digest(values: Sequence[Any]) -> str:
+        cached = memo.get(id(values))
+        if cached is None or cached[0] is not values:
+            cached = memo[id(values)] = (values, column_digest(values))
+        return cached[1]
+
+    return [
+        [digest(ids), *(digest(column) for column in columns)]
+        for ids, columns in blocks
+    ]
+
+
+def changed_block_ids(
+    block: ConventionRuleInputs,
+    digests: List[str],
+    previous_block: Optional[ConventionRuleInputs],
+    previous_digests: List[str],
+) -> Set[str]:
+    """Return the ids of objects whose inputs differ from the previous block.
+
+    Only columns whose digest changed are compared row by row. Objects missing
+    from the previous block count as changed.
+
+    :param block: Current input block.
+    :type block: ConventionRuleInputs
+    :param digests: Digests of the current block.
+    :type digests: list[str]
+    :param previous_block: Block of the previous run, or ``None`` if unknown.
+    :type previous_block: ConventionRuleInputs | None
+    :param previous_digests: Digests of the previous block.
+    :type previous_digests: list[str]
+    :returns: Ids of added or changed objects.
+    :rtype: set[str]
+    """
+    ids, columns = block
+    if previous_block is None or len(previous_digests) != len(digests):
+        return set(ids)
+
+    previous_ids, previous_columns = previous_block
+    if previous_digests[0] == digests[0]:
+        changed_columns = [
+            (columns[index], previous_columns[index])
+            for index in range(len(columns))
+            if digests[index + 1] != previous_digests[index + 1]
+        ]
+        return {
+            object_id
+            for row, object_id in enumerate(ids)
+            if any(
+                current[row] != previous[row] for current, previous in changed_columns
+            )
+        }
+
+    previous_rows = dict(zip(previous_ids, zip(*previous_columns)))
+    return {
+        object_id
+        for object_id, row in zip(ids, zip(*columns))
+        if previous_rows.get(object_id) != row
+    }
+
+
+@lru_cache(maxsize=None)
+def _package_version() -> Optional[str]:
+    try:
+        return version("dg_kit")
+    except PackageNotFoundError:
+        return None
+
+
+class ConventionCache:
+    """SQLite store of cached rule inputs and breaches.
+
+    Missing, unreadable or outdated caches start empty, so the next validation
+    checks every object. Reads are safe from concurrently running rules.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open the cache, creating it if needed.
+
+        :param path: Cache file path.
+        :type path: str | Path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        try:
+            self.connection = self._connect()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Ignoring unreadable convention cache {self.path}: {e}")
+            self.path.unlink(missing_ok=True)
+            self.connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            connection.executescript(_SCHEMA)
+            meta = dict(connection.execute("SELECT key, value FROM cache_meta"))
+            expected = {
+                "version": str(CONVENTION_CACHE_VERSION),
+                "dg_kit_version": str(_package_version()),
+            }
+            if meta != expected:
+                if meta:
+                    logger.info(
+                        "Convention cache is outdated, validating every object."
+                    )
+                with connection:
+                    for table in _TABLES:
+                        connection.execute(f"DELETE FROM {table}")
+                    connection.executemany(
+                        "INSERT INTO cache_meta (key, value) VALUES (?, ?)",
+                        expected.items(),
+                    )
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+
+        return connection
+
+    def rule_state(self, rule_name: str) -> Optional[Tuple[str, List[List[str]]]]:
+        """Return the configuration fingerprint and block digests of a rule.
+
+        :param rule_name: Rule name.
+        :type rule_name: str
+        :returns: Fingerprint and digests, or ``None`` if the rule is not cached.
+        :rtype: tuple[str, list[list[str]]] | None
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT config, digests FROM rule_states WHERE rule_name = ?",
+                (rule_name,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def block(self, rule_name: str, block: int) -> Optional[ConventionRuleInputs]:
+        """Return an input block of the previous run.
+
+        :param rule_name: Rule name.
+        :type rule_name: str
+        :param block: Block index.
+        :type block: int
+        :returns: Object ids and value columns, or ``None`` if not cached.
+        :rtype: ConventionRuleInputs | None
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT content FROM rule_blocks WHERE rule_name = ? AND block = ?",
+                (rule_name, block),
+            ).fetchone()
+
+        if row is None:
+            return None
+        ids, columns = json.loads(row[0])
+        return ids, tuple(columns)
+
+    def breaches(self, rule_name: str) -> Dict[str, List[ConventionBreach]]:
+        """Return cached breaches of a rule by object id.
+
+        :param rule_name: Rule name.
+        :type rule_name: str
+        :returns: Breaches of every object that has any.
+        :rtype: dict[str, list[ConventionBreach]]
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT object_id, severity, message FROM object_breaches "
+                "WHERE rule_name = ? ORDER BY object_id, position",
+                (rule_name,),
+            ).fetchall()
+
+        severities = {str(severity): severity for severity in ConventionRuleSeverity}
+        breaches: Dict[str, List[ConventionBreach]] = {}
+        for object_id, severity, message in rows:
+            breaches.setdefault(object_id, []).append(
+                ConventionBreach(severity=severities[severity], message=message)
+            )
+        return breaches
+
+    def update_rule(
+        self,
+        rule_name: str,
+        config: str,
+        digests: List[List[str]],
+        blocks: Dict[int, ConventionRuleInputs],
+        breaches: Dict[str, List[ConventionBreach]],
+        removed_ids: Iterable[str],
+        replace: bool,
+    ) -> None:
+        """Store the changed entries of one rule.
+
+        :param rule_name: Rule name.
+        :type rule_name: str
+        :param config: Fingerprint of the rule configuration.
+        :type config: str
+        :param digests: Digests of every current block.
+        :type digests: list[list[str]]
+        :param blocks: Changed blocks by index.
+        :type blocks: dict[int, ConventionRuleInputs]
+        :param breaches: Breaches of every re-checked object, empty lists
+            included.
+        :type breaches: dict[str, list[ConventionBreach]]
+        :param removed_ids: Objects that no longer exist.
+        :type removed_ids: Iterable[str]
+        :param replace: Drop every cached block and breach of the rule first.
+        :type replace: bool
+        """
+        with self._lock, self.connection:
+            if replace:
+                for table in ("rule_blocks", "object_breaches"):
+                    self.connection.execute(
+                        f"DELETE FROM {table} WHERE rule_name = ?", (rule_name,)
+                    )
+            else:
+                self.connection.execute(
+                    "DELETE FROM rule_blocks WHERE rule_name = ? AND block >= ?",
+                    (rule_name, len(digests)),
+                )
+                self.connection.executemany(
+                    "DELETE FROM object_breaches WHERE rule_name = ? AND object_id = ?",
+                    ((rule_name, object_id) for object_id in (*breaches, *removed_ids)),
+                )
+
+            self.connection.execute(
+                "INSERT OR REPLACE INTO rule_states (rule_name, config, digests) "
+                "VALUES (?, ?, ?)",
+                (rule_name, config, json.dumps(digests)),
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO rule_blocks (rule_name, block, content) "
+                "VALUES (?, ?, ?)",
+                (
+                    (
+                        rule_name,
+                        index,
+                        json.dumps([list(ids), list(map(list, columns))]),
+                    )
+                    for index, (ids, columns) in blocks.items()
+                ),
+            )
+            self.connection.executemany(
+                "INSERT INTO object_breaches "
+                "(rule_name, object_id, position, severity, message) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        rule_name,
+                        object_id,
+                        position,
+                        str(breach.severity),
+                        breach.message,
+                    )
+                    for object_id, object_breaches in breaches.items()
+                    for position, breach in enumerate(object_breaches)
+                ),
+            )
+
+    def retain_rules(self, rule_names: Iterable[str]) -> None:
+        """Drop cached entries of rules that are no longer configured.
+
+        :param rule_names: Names of the configured rules.
+        :type rule_names: Iterable[str]
+        """
+        rule_names = list(rule_names)
+        placeholders = ", ".join("?" * len(rule_names)) or "NULL"
+        with self._lock, self.connection:
+            for table in _TABLES[1:]:
+                self.connection.execute(
+                    f"DELETE FROM {table} WHERE rule_name NOT IN ({placeholders})",
+                    rule_names,
+                )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.connection.close()
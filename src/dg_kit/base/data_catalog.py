@@ -7,13 +7,25 @@ manager used by pull and sync commands.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from contextlib import contextmanager
+from dataclasses import fields, replace
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from os import environ
+import hashlib
+import json
 import logging
-import pickle
 from pathlib import Path
 
-from dg_kit.base.enums import DataUnitType
+from dg_kit.base import chunked
+from dg_kit.base.checkpoint import (
+    MappedCheckpoint,
+    encode_indexed_catalog,
+    read_checkpoint,
+    write_checkpoint,
+    write_checkpoint_bytes,
+)
+from dg_kit.base.enums import DataUnitType, SyncAction
 from dg_kit.base.dataclasses.data_catalog import (
     DataCatalogRow,
     EntityPage,
@@ -21,6 +33,8 @@ from dg_kit.base.dataclasses.data_catalog import (
     RelationPage,
     ObjectReference,
     IndexedCatalog,
+    SyncOperation,
+    SyncPlan,
 )
 from dg_kit.base.logical_model import LogicalModel
 from dg_kit.base.dataclasses.logical_model import (
@@ -31,6 +45,66 @@ from dg_kit.base.dataclasses.logical_model import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYNC_BATCH_SIZE = 100
+
+
+def _canonical_value(value: Any) -> Any:
+    if value is None:
+        # Backends return empty text for missing values, e.g. no description.
+        return ""
+    if isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, str):
+        return value
+    if isinstance(value, ObjectReference):
+        return value.reference_link
+    if isinstance(value, (tuple, list)):
+        return [_canonical_value(item) for item in value]
+    if hasattr(value, "name"):
+        # Physical model objects and business units are shown by name in pages.
+        return value.name
+    return str(value)
+
+
+def canonical_page_content(
+    page: EntityPage | AttributePage | RelationPage,
+) -> Dict[str, Any]:
+    """Return the backend-independent content of a data unit page.
+
+    Model objects are reduced to what a catalog page actually shows, so a page
+    built from the logical model and the same page pulled back from a backend
+    have identical canonical content.
+
+    :param page: Data unit page.
+    :type page: EntityPage | AttributePage | RelationPage
+    :returns: JSON-serializable page content without the remote reference.
+    :rtype: dict[str, Any]
+    """
+    return {
+        page_field.name: _canonical_value(getattr(page, page_field.name))
+        for page_field in fields(page)
+        if page_field.name != "reference"
+    }
+
+
+def page_content_hash(page: EntityPage | AttributePage | RelationPage) -> str:
+    """Return a stable hash of the canonical page content.
+
+    :param page: Data unit page.
+    :type page: EntityPage | AttributePage | RelationPage
+    :returns: Hex digest of the canonical page content.
+    :rtype: str
+    """
+    payload = json.dumps(
+        canonical_page_content(page),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
 class DataCatalogEngine(ABC):
     """Define the storage interface for a data catalog backend."""
@@ -38,13 +112,16 @@ class DataCatalogEngine(ABC):
     @abstractmethod
     def pull_data_catalog(
         self,
-    ) -> Tuple[
-        Dict[str, DataCatalogRow], Dict[str, EntityPage | AttributePage | RelationPage]
-    ]:
-        """Fetch the full catalog state from the backing store.
-
-        :returns: Indexed catalog content keyed by object identifier.
-        :rtype: tuple[dict[str, DataCatalogRow], dict[str, EntityPage | AttributePage | RelationPage]]
+        edited_since: Optional[str] = None,
+    ) -> IndexedCatalog:
+        """Fetch the catalog state from the backing store.
+
+        :param edited_since: ISO 8601 timestamp. When given, only units edited
+            at or after this moment are returned.
+        :type edited_since: str | None
+        :returns: Indexed catalog content keyed by object identifier, with the
+            latest edit timestamp seen as ``last_edited_time``.
+        :rtype: IndexedCatalog
         """
         raise NotImplementedError
 
@@ -91,14 +168,112 @@ class DataCatalogEngine(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def delete_by_id(self, id: str) -> None:
+    def delete_by_id(
+        self, id: str, reference: Optional[ObjectReference] = None
+    ) -> None:
         """Delete a catalog object by identifier.
 
         :param id: Catalog object identifier.
         :type id: str
+        :param reference: Cached reference to the remote object, if known. Engines
+            use it to skip looking the object up before deleting it.
+        :type reference: ObjectReference | None
         """
         raise NotImplementedError
 
+    def add_rows(self, raw_data_catalog_rows: List[Dict]) -> List[ObjectReference]:
+        """Create several catalog rows.
+
+        The default implementation calls :meth:`add_row` for every row. Engines
+        with bulk writes should override it.
+
+        :param raw_data_catalog_rows: Raw row payloads to create.
+        :type raw_data_catalog_rows: list[dict]
+        :returns: References to the created remote objects, in input order.
+        :rtype: list[ObjectReference]
+        """
+        return [
+            self.add_row(raw_data_catalog_row)
+            for raw_data_catalog_row in raw_data_catalog_rows
+        ]
+
+    def update_rows(self, data_catalog_rows: List[DataCatalogRow]) -> None:
+        """Persist several updated catalog rows.
+
+        The default implementation calls :meth:`update_row` for every row.
+
+        :param data_catalog_rows: Row metadata to update.
+        :type data_catalog_rows: list[DataCatalogRow]
+        """
+        for data_catalog_row in data_catalog_rows:
+            self.update_row(data_catalog_row)
+
+    def add_pages(
+        self, data_unit_pages: List[EntityPage | AttributePage | RelationPage]
+    ) -> None:
+        """Create several data unit pages.
+
+        The default implementation calls :meth:`add_page` for every page.
+
+        :param data_unit_pages: Page payloads to create.
+        :type data_unit_pages: list[EntityPage | AttributePage | RelationPage]
+        """
+        for data_unit_page in data_unit_pages:
+            self.add_page(data_unit_page)
+
+    def update_pages(
+        self, data_unit_pages: List[EntityPage | AttributePage | RelationPage]
+    ) -> None:
+        """Persist several updated data unit pages.
+
+        The default implementation calls :meth:`update_page` for every page.
+
+        :param data_unit_pages: Page payloads to update.
+        :type data_unit_pages: list[EntityPage | AttributePage | RelationPage]
+        """
+        for data_unit_page in data_unit_pages:
+            self.update_page(data_unit_page)
+
+    def estimate_api_calls(
+        self,
+        action: SyncAction,
+        current_page: Optional[EntityPage | AttributePage | RelationPage] = None,
+        new_page: Optional[EntityPage | AttributePage | RelationPage] = None,
+    ) -> int:
+        """Estimate the backend calls needed for one sync operation.
+
+        Used by :meth:`DataCatalog.plan_sync`, so implementations must not
+        perform any I/O. The default assumes one call per operation.
+
+        :param action: Planned sync action.
+        :type action: SyncAction
+        :param current_page: Cached page before the change, for page updates.
+        :type current_page: EntityPage | AttributePage | RelationPage | None
+        :param new_page: Page to be written, for page additions and updates.
+        :type new_page: EntityPage | AttributePage | RelationPage | None
+        :returns: Estimated number of backend calls.
+        :rtype: int
+        """
+        return 1
+
+    def delete_many(
+        self,
+        ids: Iterable[str],
+        reference_by_id: Optional[Dict[str, ObjectReference]] = None,
+    ) -> None:
+        """Delete several catalog objects.
+
+        The default implementation calls :meth:`delete_by_id` for every object.
+
+        :param ids: Catalog object identifiers.
+        :type ids: Iterable[str]
+        :param reference_by_id: Cached references to the remote objects.
+        :type reference_by_id: dict[str, ObjectReference] | None
+        """
+        reference_by_id = reference_by_id or {}
+        for id in ids:
+            self.delete_by_id(id, reference_by_id.get(id))
+
 
 class DataCatalog:
     """Manage a locally cached view of the data catalog."""
@@ -107,6 +282,7 @@ class DataCatalog:
         self,
         engine: DataCatalogEngine,
         config: Dict,
+        offline: bool = False,
     ):
         """Initialize the catalog and load the cached or remote state.
 
@@ -114,14 +290,28 @@ class DataCatalog:
         :type engine: DataCatalogEngine
         :param config: Project configuration containing catalog settings.
         :type config: dict
+        :param offline: Only load the local checkpoint and never pull from the
+            remote backend.
+        :type offline: bool
+        :raises FileNotFoundError: If ``offline`` is set and no usable local
+            checkpoint exists.
         """
         self.engine = engine
         self.config = config
+        self._checkpoint_deferred = False
+        self._rows_added_since_checkpoint = False
+        self._mapped_checkpoint: Optional[MappedCheckpoint] = None
         self.artifact_path = Path(
-            f"{self.config['data_catalog']['dc_checkpoint_path']}/{self.config['name']}.pkl"
+            f"{self.config['data_catalog']['dc_checkpoint_path']}/{self.config['name']}.dgkc"
         )
 
-        if self.artifact_path.exists():
+        if offline:
+            if not self.artifact_path.exists():
+                raise FileNotFoundError(
+                    f"Couldn't find indexed catalog localy at {self.artifact_path}. Run `dg_kit data-catalog pull` first."
+                )
+            self.indexed_catalog = self.load_from_local()
+        elif self.artifact_path.exists():
             try:
                 logger.info(f"Initiating indexed DB from {self.artifact_path}.")
                 self.indexed_catalog: IndexedCatalog = self.load_from_local()
@@ -136,11 +326,54 @@ class DataCatalog:
             )
             self.pull_data_catalog()
 
-    def pull_data_catalog(self):
-        """Refresh the local cache from the remote catalog backend."""
-        self.indexed_catalog = self.engine.pull_data_catalog()
+    def pull_data_catalog(self, incremental: bool = False) -> None:
+        """Refresh the local cache from the remote catalog backend.
+
+        :param incremental: Fetch only units edited since the last pull and merge
+            them into the cached catalog. Falls back to a full pull when the
+            cache has no ``last_edited_time`` high-water mark.
+        :type incremental: bool
+        """
+        indexed_catalog = getattr(self, "indexed_catalog", None)
+        edited_since = getattr(indexed_catalog, "last_edited_time", None)
+
+        if incremental and edited_since:
+            logger.info(f"Pulling data units edited since {edited_since}.")
+            delta = self.engine.pull_data_catalog(edited_since=edited_since)
+            self._merge_indexed_catalog(delta)
+        else:
+            if incremental:
+                logger.info("No pull checkpoint found. Pulling full data catalog.")
+            self.indexed_catalog = self.engine.pull_data_catalog()
+
         self.save_to_local()
 
+    def _merge_indexed_catalog(self, delta: IndexedCatalog) -> None:
+        """Merge a partial pull into the cached catalog.
+
+        Units archived remotely are not reported by an incremental pull, so they
+        stay in the cache until the next full pull.
+
+        :param delta: Catalog content returned by an incremental pull.
+        :type delta: IndexedCatalog
+        """
+        self.indexed_catalog.row_by_id.update(delta.row_by_id)
+        self.indexed_catalog.reference_by_id.update(delta.reference_by_id)
+        self.indexed_catalog.page_by_id.update(delta.page_by_id)
+        self.indexed_catalog.content_hash_by_id.update(delta.content_hash_by_id)
+
+        last_edited_time = max(
+            filter(
+                None,
+                (self.indexed_catalog.last_edited_time, delta.last_edited_time),
+            )
+        )
+        self.indexed_catalog = replace(
+            self.indexed_catalog, last_edited_time=last_edited_time
+        )
+
+        logger.info(f"Merged {len(delta.row_by_id)} updated data units.")
+
     def get_row_by_id(self, id: str) -> DataCatalogRow:
         """Return a catalog row by identifier.
 
@@ -167,9 +400,21 @@ class DataCatalog:
         :param data_catalog_row: Row metadata to persist.
         :type data_catalog_row: DataCatalogRow
         """
-        self.indexed_catalog.row_by_id[data_catalog_row.id] = data_catalog_row
-        self.engine.update_row(data_catalog_row)
-        self.save_to_local()
+        self.update_rows([data_catalog_row])
+
+    def update_rows(self, data_catalog_rows: List[DataCatalogRow]) -> None:
+        """Update several rows and write the checkpoint once.
+
+        :param data_catalog_rows: Row metadata to persist.
+        :type data_catalog_rows: list[DataCatalogRow]
+        """
+        if not data_catalog_rows:
+            return
+
+        self.engine.update_rows(data_catalog_rows)
+        for data_catalog_row in data_catalog_rows:
+            self.indexed_catalog.row_by_id[data_catalog_row.id] = data_catalog_row
+        self._checkpoint()
 
     def update_page(self, page: EntityPage | AttributePage | RelationPage) -> None:
         """Update a page in memory, remotely, and in the local checkpoint.
@@ -177,9 +422,22 @@ class DataCatalog:
         :param page: Page payload to persist.
         :type page: EntityPage | AttributePage | RelationPage
         """
-        self.indexed_catalog.page_by_id[page.id] = page
-        self.engine.update_page(page)
-        self.save_to_local()
+        self.update_pages([page])
+
+    def update_pages(
+        self, pages: List[EntityPage | AttributePage | RelationPage]
+    ) -> None:
+        """Update several pages and write the checkpoint once.
+
+        :param pages: Page payloads to persist.
+        :type pages: list[EntityPage | AttributePage | RelationPage]
+        """
+        if not pages:
+            return
+
+        self.engine.update_pages(pages)
+        self._index_pages(pages)
+        self._checkpoint()
 
     def add_page(self, page: EntityPage | AttributePage | RelationPage) -> None:
         """Add a new page to the catalog.
@@ -188,14 +446,32 @@ class DataCatalog:
         :type page: EntityPage | AttributePage | RelationPage
         :raises KeyError: If a page with the same identifier already exists.
         """
-        if page.id in self.indexed_catalog.page_by_id:
-            raise KeyError(
-                f"Data unit page with id='{page.id}' already exists. Use update instead."
-            )
+        self.add_pages([page])
 
-        self.indexed_catalog.page_by_id[page.id] = page
-        self.engine.add_page(page)
-        self.save_to_local()
+    def add_pages(self, pages: List[EntityPage | AttributePage | RelationPage]) -> None:
+        """Add several new pages and write the checkpoint once.
+
+        :param pages: Page payloads to create.
+        :type pages: list[EntityPage | AttributePage | RelationPage]
+        :raises KeyError: If a page with the same identifier already exists.
+        """
+        if not pages:
+            return
+
+        for page in pages:
+            if page.id in self.indexed_catalog.page_by_id:
+                raise KeyError(
+                    f"Data unit page with id='{page.id}' already exists. Use update instead."
+                )
+
+        self.engine.add_pages(pages)
+        self._index_pages(pages)
+        self._checkpoint()
+
+    def _index_pages(self, pages: List[EntityPage | AttributePage | RelationPage]):
+        for page in pages:
+            self.indexed_catalog.page_by_id[page.id] = page
+            self.indexed_catalog.content_hash_by_id[page.id] = page_content_hash(page)
 
     def add_row(self, raw_data_catalog_row: Dict) -> ObjectReference:
         """Add a new row to the catalog from raw row metadata.
@@ -206,26 +482,58 @@ class DataCatalog:
         :rtype: ObjectReference
         :raises KeyError: If a row with the same identifier already exists.
         """
-        if raw_data_catalog_row["id"] in self.indexed_catalog.row_by_id:
-            raise KeyError(
-                f"Data unit with id='{raw_data_catalog_row['id']}' already exists. Use update instead."
-            )
+        return self.add_rows([raw_data_catalog_row])[0]
 
-        page_reference = self.engine.add_row(raw_data_catalog_row)
-        data_catalog_row = DataCatalogRow(
-            id=raw_data_catalog_row["id"],
-            reference=page_reference,
-            data_unit_type=raw_data_catalog_row["data_unit_type"],
-            data_unit_name=raw_data_catalog_row["data_unit_name"],
-            domain=raw_data_catalog_row["domain"],
-        )
-        self.indexed_catalog.row_by_id[raw_data_catalog_row["id"]] = data_catalog_row
-        self.indexed_catalog.reference_by_id[raw_data_catalog_row["id"]] = (
-            page_reference
-        )
-        self.save_to_local()
+    def add_rows(self, raw_data_catalog_rows: List[Dict]) -> List[ObjectReference]:
+        """Add several new rows and write the checkpoint once.
+
+        Created rows are not idempotent. If the engine fails part way through
+        a batch, the local checkpoint is dropped and the next run pulls the
+        catalog again instead of creating the already written rows a second
+        time. Inside :meth:`deferred_checkpoint` the checkpoint is written when
+        the block exits.
+
+        :param raw_data_catalog_rows: Raw row payloads expected by the backend.
+        :type raw_data_catalog_rows: list[dict]
+        :returns: References to the created remote pages, in input order.
+        :rtype: list[ObjectReference]
+        :raises KeyError: If a row with the same identifier already exists.
+        """
+        if not raw_data_catalog_rows:
+            return []
+
+        for raw_data_catalog_row in raw_data_catalog_rows:
+            if raw_data_catalog_row["id"] in self.indexed_catalog.row_by_id:
+                raise KeyError(
+                    f"Data unit with id='{raw_data_catalog_row['id']}' already exists. Use update instead."
+                )
 
-        return page_reference
+        try:
+            page_references = self.engine.add_rows(raw_data_catalog_rows)
+        except Exception:
+            logger.error("Adding data units failed.")
+            self._drop_checkpoint()
+            raise
+
+        for raw_data_catalog_row, page_reference in zip(
+            raw_data_catalog_rows, page_references
+        ):
+            self.indexed_catalog.row_by_id[raw_data_catalog_row["id"]] = DataCatalogRow(
+                id=raw_data_catalog_row["id"],
+                reference=page_reference,
+                data_unit_type=raw_data_catalog_row["data_unit_type"],
+                data_unit_name=raw_data_catalog_row["data_unit_name"],
+                domain=raw_data_catalog_row["domain"],
+            )
+            self.indexed_catalog.reference_by_id[raw_data_catalog_row["id"]] = (
+                page_reference
+            )
+        if self._checkpoint_deferred:
+            self._rows_added_since_checkpoint = True
+        else:
+            self.save_to_local()
+
+        return page_references
 
     def delete_by_id(self, id: str) -> None:
         """Delete a row and page from the catalog by identifier.
@@ -233,335 +541,514 @@ class DataCatalog:
         :param id: Catalog object identifier.
         :type id: str
         """
+        self.engine.delete_by_id(id, self._cached_reference(id))
+        self._pop_unit(id)
+        self._checkpoint()
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        """Delete several rows and pages and write the checkpoint once.
+
+        :param ids: Catalog object identifiers.
+        :type ids: Iterable[str]
+        """
+        ids = list(ids)
+        if not ids:
+            return
+
+        reference_by_id: Dict[str, ObjectReference] = {}
+        for id in ids:
+            reference = self._cached_reference(id)
+            if reference:
+                reference_by_id[id] = reference
+
+        self.engine.delete_many(ids, reference_by_id)
+        for id in ids:
+            self._pop_unit(id)
+        self._checkpoint()
+
+    def _cached_reference(self, id: str) -> Optional[ObjectReference]:
+        """Return the cached remote reference of a unit.
+
+        :param id: Catalog object identifier.
+        :type id: str
+        :returns: Cached remote reference, if any.
+        :rtype: ObjectReference | None
+        """
+        reference = self.indexed_catalog.reference_by_id.get(id)
+        if reference is None and id in self.indexed_catalog.row_by_id:
+            reference = self.indexed_catalog.row_by_id[id].reference
+
+        return reference
+
+    def _pop_unit(self, id: str) -> None:
+        """Drop a unit from the in-memory index.
+
+        :param id: Catalog object identifier.
+        :type id: str
+        """
+        self.indexed_catalog.reference_by_id.pop(id, None)
         self.indexed_catalog.row_by_id.pop(id, None)
         self.indexed_catalog.page_by_id.pop(id, None)
-        self.engine.delete_by_id(id)
-        self.save_to_local()
+        self.indexed_catalog.content_hash_by_id.pop(id, None)
+
+    def _checkpoint(self) -> None:
+        """Write the local checkpoint unless writes are deferred."""
+        if not self._checkpoint_deferred:
+            self.save_to_local()
+
+    def _drop_checkpoint(self) -> None:
+        """Delete the local checkpoint, so the next run pulls the catalog."""
+        logger.error(f"Dropping local checkpoint {self.artifact_path}.")
+        self.artifact_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def deferred_checkpoint(self) -> Iterator[None]:
+        """Write the local checkpoint once when the block exits successfully.
+
+        If the block raises, nothing is written: the in-memory index may miss
+        rows the engine created before failing. When rows were added inside
+        the block, the existing checkpoint is dropped as well, since it does
+        not know about them either.
+        """
+        self._checkpoint_deferred = True
+        self._rows_added_since_checkpoint = False
+        try:
+            yield
+        except BaseException:
+            if self._rows_added_since_checkpoint:
+                self._drop_checkpoint()
+            raise
+        else:
+            self.save_to_local()
+        finally:
+            self._checkpoint_deferred = False
+            self._rows_added_since_checkpoint = False
 
     def sync_with_model(
         self,
         LM: LogicalModel,
+        batch_size: Optional[int] = None,
     ):
         """Synchronize the catalog contents with the logical model.
 
+        Changes are sent to the engine in batches of ``batch_size`` units. New
+        rows are created before any page, so pages can reference every unit.
+
         :param LM: Logical model used as the source of truth.
         :type LM: LogicalModel
+        :param batch_size: Units per engine call. Defaults to
+            ``data_catalog.batch_size`` from the config, or 100.
+        :type batch_size: int | None
         """
+        batch_size = batch_size or self.config["data_catalog"].get(
+            "batch_size", DEFAULT_SYNC_BATCH_SIZE
+        )
+
         lm_ids = set(LM.all_units_by_id)
         row_ids = set(self.indexed_catalog.row_by_id)
         rows_and_lm_intersection = row_ids & lm_ids
         rows_diff = row_ids - lm_ids
         lm_diff = lm_ids - row_ids
 
-        logger.info("Deleting data units from DC...")
-        for id in rows_diff:
-            self.delete_by_id(id)
+        with self.deferred_checkpoint():
+            logger.info("Deleting data units from DC...")
+            for ids in chunked(rows_diff, batch_size):
+                self.delete_many(ids)
 
-        logger.info("Adding new data units...")
-        for data_unit_id in lm_diff:
-            if data_unit_id in LM.entities:
-                data_unit_type = DataUnitType.ENTITY
-            elif data_unit_id in LM.attributes:
-                data_unit_type = DataUnitType.ATTRIBUTE
-            elif data_unit_id in LM.relations:
-                data_unit_type = DataUnitType.RELATION
-
-            data_unit = LM.all_units_by_id[data_unit_id]
-
-            raw_data_catalog_row = {
-                "id": data_unit.id,
-                "data_unit_name": data_unit.name,
-                "data_unit_type": data_unit_type,
-                "domain": data_unit.domain or "Unknown",
-            }
+            logger.info("Adding new data units...")
+            new_rows = (
+                raw_row
+                for raw_row in (
+                    self._build_raw_row(LM, data_unit_id) for data_unit_id in lm_diff
+                )
+                if raw_row is not None
+            )
+            for raw_rows in chunked(new_rows, batch_size):
+                self.add_rows(raw_rows)
 
-            self.add_row(raw_data_catalog_row)
+            # Every unit has a row from here on, resolve their links once.
+            link_by_id = self._link_by_id()
 
-        for data_unit_id in lm_diff:
-            if data_unit_id in LM.entities:
-                entity = LM.entities[data_unit_id]
-
-                for identifier in LM.identifiers_by_entity_id[entity.id]:
-                    if identifier.is_pk:
-                        pk_attributes_references = tuple(
-                            [
-                                self.indexed_catalog.reference_by_id[
-                                    attribute.id
-                                ].reference_link
-                                for attribute in identifier.attributes
-                            ]
-                        )
-                attributes_references = tuple(
-                    [
-                        self.indexed_catalog.reference_by_id[
-                            attribute.id
-                        ].reference_link
-                        for attribute in LM.attributes_by_entity_id[entity.id]
-                    ]
-                )
-                relations_references = tuple(
-                    [
-                        self.indexed_catalog.reference_by_id[relation.id].reference_link
-                        for relation in LM.relations_by_entity_id[entity.id]
-                    ]
-                )
+            for pages in chunked(self._iter_pages(LM, lm_diff, link_by_id), batch_size):
+                self.add_pages(pages)
 
-                page = EntityPage(
-                    id=data_unit_id,
-                    reference=self.indexed_catalog.reference_by_id[entity.id],
-                    data_unit_type=DataUnitType.ENTITY,
-                    description=entity.description,
-                    pk_attributes_references=pk_attributes_references,
-                    attributes_references=attributes_references,
-                    relations_references=relations_references,
-                    linked_documents=tuple(
-                        [document.name for document in entity.documents]
-                    ),
-                    responsible_parties=tuple(
-                        [party.name for party in entity.responsible_parties]
-                    ),
-                    pm_mapping_references=entity.pm_map,
-                    source_systems=entity.source_systems,
+            logger.info("Updating updated data units...")
+            changed_rows = (
+                row
+                for row in (
+                    self._build_row(LM, data_unit_id, link_by_id)
+                    for data_unit_id in rows_and_lm_intersection
                 )
+                if row is not None and row != self.indexed_catalog.row_by_id[row.id]
+            )
+            for rows in chunked(changed_rows, batch_size):
+                self.update_rows(rows)
 
-            elif data_unit_id in LM.attributes:
-                attribute = LM.attributes[data_unit_id]
-
-                page = AttributePage(
-                    id=data_unit_id,
-                    reference=self.indexed_catalog.reference_by_id[attribute.id],
-                    data_unit_type=DataUnitType.ATTRIBUTE,
-                    description=attribute.description,
-                    parent_entity_reference=self.indexed_catalog.reference_by_id[
-                        attribute.entity_id
-                    ].reference_link,
-                    data_type=attribute.data_type,
-                    sensitivity_type=attribute.sensitivity_type,
-                    linked_documents=tuple(
-                        [document.name for document in attribute.documents]
-                    ),
-                    responsible_parties=tuple(
-                        [party.name for party in attribute.responsible_parties]
-                    ),
-                    pm_mapping_references=attribute.pm_map,
-                    source_systems=attribute.source_systems,
-                )
+            changed_pages = (
+                page
+                for page in self._iter_pages(LM, rows_and_lm_intersection, link_by_id)
+                if page_content_hash(page) != self._stored_content_hash(page.id)
+            )
+            for pages in chunked(changed_pages, batch_size):
+                self.update_pages(pages)
 
-            elif data_unit_id in LM.relations:
-                relation = LM.relations[data_unit_id]
-
-                page = RelationPage(
-                    id=data_unit_id,
-                    reference=self.indexed_catalog.reference_by_id[relation.id],
-                    data_unit_type=DataUnitType.RELATION,
-                    description=relation.description,
-                    source_entity_reference=self.indexed_catalog.reference_by_id[
-                        relation.source_entity_id
-                    ].reference_link,
-                    target_entity_reference=self.indexed_catalog.reference_by_id[
-                        relation.target_entity_id
-                    ].reference_link,
-                    linked_documents=tuple(
-                        [document.name for document in relation.documents]
-                    ),
-                    responsible_parties=tuple(
-                        [party.name for party in relation.responsible_parties]
-                    ),
-                    pm_mapping_references=relation.pm_map,
-                    source_systems=relation.source_systems,
-                )
+    def plan_sync(self, LM: LogicalModel) -> SyncPlan:
+        """Compute the operations :meth:`sync_with_model` would perform.
 
-            else:
-                logger.error(
-                    f"Unexpected data unit id {data_unit_id} while adding pages."
+        The plan is built from the logical model and the cached catalog only, so
+        it never contacts the backend. Units that do not exist yet are linked
+        through placeholder references starting with ``planned:``. API call
+        counts come from :meth:`DataCatalogEngine.estimate_api_calls`.
+
+        :param LM: Logical model used as the source of truth.
+        :type LM: LogicalModel
+        :returns: Planned operations in execution order, with the estimated
+            total number of API calls.
+        :rtype: SyncPlan
+        """
+        lm_ids = set(LM.all_units_by_id)
+        row_ids = set(self.indexed_catalog.row_by_id)
+        rows_and_lm_intersection = sorted(row_ids & lm_ids)
+        rows_diff = sorted(row_ids - lm_ids)
+        lm_diff = sorted(lm_ids - row_ids)
+
+        link_by_id = self._link_by_id()
+        operations: List[SyncOperation] = []
+
+        for data_unit_id in rows_diff:
+            row = self.indexed_catalog.row_by_id[data_unit_id]
+            operations.append(
+                SyncOperation(
+                    action=SyncAction.DELETE,
+                    data_unit_id=data_unit_id,
+                    data_unit_type=row.data_unit_type,
+                    data_unit_name=row.data_unit_name,
+                    api_calls=self.engine.estimate_api_calls(SyncAction.DELETE),
                 )
+            )
+
+        new_ids: List[str] = []
+        for data_unit_id in lm_diff:
+            raw_row = self._build_raw_row(LM, data_unit_id)
+            if raw_row is None:
                 continue
 
-            self.add_page(page)
+            new_ids.append(data_unit_id)
+            link_by_id[data_unit_id] = f"planned:{data_unit_id}"
+            operations.append(
+                SyncOperation(
+                    action=SyncAction.ADD_ROW,
+                    data_unit_id=data_unit_id,
+                    data_unit_type=raw_row["data_unit_type"],
+                    data_unit_name=raw_row["data_unit_name"],
+                    api_calls=self.engine.estimate_api_calls(SyncAction.ADD_ROW),
+                )
+            )
 
-        logger.info("Updating updated data units...")
-        for data_unit_id in rows_and_lm_intersection:
-            if data_unit_id in LM.entities:
-                entity = LM.entities[data_unit_id]
-                row = DataCatalogRow(
-                    id=entity.id,
-                    reference=ObjectReference(
-                        id=entity.id,
-                        reference_link=self.indexed_catalog.reference_by_id[
-                            entity.id
-                        ].reference_link,
+        for page in self._iter_pages(LM, new_ids, link_by_id):
+            operations.append(
+                SyncOperation(
+                    action=SyncAction.ADD_PAGE,
+                    data_unit_id=page.id,
+                    data_unit_type=page.data_unit_type,
+                    data_unit_name=LM.all_units_by_id[page.id].name,
+                    api_calls=self.engine.estimate_api_calls(
+                        SyncAction.ADD_PAGE, new_page=page
                     ),
-                    data_unit_name=entity.name,
-                    data_unit_type=DataUnitType.ENTITY,
-                    domain=entity.domain
-                    or environ.get("DG_KIT_DEFAULT_DOMAIN", "Unknown"),
                 )
+            )
 
-            elif data_unit_id in LM.attributes:
-                attribute = LM.attributes[data_unit_id]
-                row = DataCatalogRow(
-                    id=attribute.id,
-                    reference=ObjectReference(
-                        id=attribute.id,
-                        reference_link=self.indexed_catalog.reference_by_id[
-                            attribute.id
-                        ].reference_link,
-                    ),
-                    data_unit_name=attribute.name,
-                    data_unit_type=DataUnitType.ATTRIBUTE,
-                    domain=attribute.domain
-                    or environ.get("DG_KIT_DEFAULT_DOMAIN", "Unknown"),
+        for data_unit_id in rows_and_lm_intersection:
+            row = self._build_row(LM, data_unit_id, link_by_id)
+            if row is None or row == self.indexed_catalog.row_by_id[data_unit_id]:
+                continue
+
+            operations.append(
+                SyncOperation(
+                    action=SyncAction.UPDATE_ROW,
+                    data_unit_id=data_unit_id,
+                    data_unit_type=row.data_unit_type,
+                    data_unit_name=row.data_unit_name,
+                    api_calls=self.engine.estimate_api_calls(SyncAction.UPDATE_ROW),
                 )
+            )
+
+        for page in self._iter_pages(LM, rows_and_lm_intersection, link_by_id):
+            if page_content_hash(page) == self._stored_content_hash(page.id):
+                continue
 
-            elif data_unit_id in LM.relations:
-                relation = LM.relations[data_unit_id]
-                row = DataCatalogRow(
-                    id=relation.id,
-                    reference=ObjectReference(
-                        id=relation.id,
-                        reference_link=self.indexed_catalog.reference_by_id[
-                            relation.id
-                        ].reference_link,
+            operations.append(
+                SyncOperation(
+                    action=SyncAction.UPDATE_PAGE,
+                    data_unit_id=page.id,
+                    data_unit_type=page.data_unit_type,
+                    data_unit_name=LM.all_units_by_id[page.id].name,
+                    api_calls=self.engine.estimate_api_calls(
+                        SyncAction.UPDATE_PAGE,
+                        current_page=self.indexed_catalog.page_by_id.get(page.id),
+                        new_page=page,
                     ),
-                    data_unit_name=relation.name,
-                    data_unit_type=DataUnitType.RELATION,
-                    domain=relation.domain
-                    or environ.get("DG_KIT_DEFAULT_DOMAIN", "Unknown"),
                 )
+            )
 
-            else:
-                logger.error(
-                    f"Unexpected data unit id {data_unit_id} while updating rows."
-                )
-                continue
+        return SyncPlan(
+            operations=tuple(operations),
+            api_calls=sum(operation.api_calls for operation in operations),
+        )
 
-            if row == self.indexed_catalog.row_by_id[data_unit_id]:
-                continue
-            else:
-                self.update_row(row)
+    def _link_by_id(self) -> Dict[str, str]:
+        """Resolve every cached catalog reference to its remote link.
 
-        for data_unit_id in rows_and_lm_intersection:
-            if data_unit_id in LM.entities:
-                entity = LM.entities[data_unit_id]
-
-                for identifier in LM.identifiers_by_entity_id[entity.id]:
-                    if identifier.is_pk:
-                        pk_attributes_references = tuple(
-                            [
-                                self.indexed_catalog.reference_by_id[
-                                    attribute.id
-                                ].reference_link
-                                for attribute in identifier.attributes
-                            ]
-                        )
-                attributes_references = tuple(
+        :returns: Mapping of data unit id to reference link.
+        :rtype: dict[str, str]
+        """
+        return {
+            id: reference.reference_link
+            for id, reference in self.indexed_catalog.reference_by_id.items()
+        }
+
+    def _data_unit_type(
+        self, LM: LogicalModel, data_unit_id: str
+    ) -> Optional[DataUnitType]:
+        if data_unit_id in LM.entities:
+            return DataUnitType.ENTITY
+        if data_unit_id in LM.attributes:
+            return DataUnitType.ATTRIBUTE
+        if data_unit_id in LM.relations:
+            return DataUnitType.RELATION
+
+        logger.error(f"Unexpected data unit id {data_unit_id}.")
+        return None
+
+    def _build_raw_row(self, LM: LogicalModel, data_unit_id: str) -> Optional[Dict]:
+        """Build the raw row payload for a data unit missing from the catalog.
+
+        :param LM: Logical model used as the source of truth.
+        :type LM: LogicalModel
+        :param data_unit_id: Data unit identifier.
+        :type data_unit_id: str
+        :returns: Raw row payload, or ``None`` for unknown units.
+        :rtype: dict | None
+        """
+        data_unit_type = self._data_unit_type(LM, data_unit_id)
+        if data_unit_type is None:
+            return None
+
+        data_unit = LM.all_units_by_id[data_unit_id]
+
+        return {
+            "id": data_unit.id,
+            "data_unit_name": data_unit.name,
+            "data_unit_type": data_unit_type,
+            "domain": data_unit.domain or "Unknown",
+        }
+
+    def _build_row(
+        self, LM: LogicalModel, data_unit_id: str, link_by_id: Dict[str, str]
+    ) -> Optional[DataCatalogRow]:
+        """Build the catalog row for a data unit already in the catalog.
+
+        :param LM: Logical model used as the source of truth.
+        :type LM: LogicalModel
+        :param data_unit_id: Data unit identifier.
+        :type data_unit_id: str
+        :param link_by_id: Reference link of every catalog unit.
+        :type link_by_id: dict[str, str]
+        :returns: Catalog row, or ``None`` for unknown units.
+        :rtype: DataCatalogRow | None
+        """
+        data_unit_type = self._data_unit_type(LM, data_unit_id)
+        if data_unit_type is None:
+            return None
+
+        data_unit = LM.all_units_by_id[data_unit_id]
+
+        return DataCatalogRow(
+            id=data_unit.id,
+            reference=ObjectReference(
+                id=data_unit.id, reference_link=link_by_id[data_unit.id]
+            ),
+            data_unit_name=data_unit.name,
+            data_unit_type=data_unit_type,
+            domain=data_unit.domain or environ.get("DG_KIT_DEFAULT_DOMAIN", "Unknown"),
+        )
+
+    def _iter_pages(
+        self,
+        LM: LogicalModel,
+        data_unit_ids: Iterable[str],
+        link_by_id: Dict[str, str],
+    ) -> Iterator[EntityPage | AttributePage | RelationPage]:
+        """Build catalog pages lazily, skipping unknown units.
+
+        :param LM: Logical model used as the source of truth.
+        :type LM: LogicalModel
+        :param data_unit_ids: Data unit identifiers to build pages for.
+        :type data_unit_ids: Iterable[str]
+        :param link_by_id: Reference link of every catalog unit.
+        :type link_by_id: dict[str, str]
+        :returns: Iterator over the built pages.
+        :rtype: Iterator[EntityPage | AttributePage | RelationPage]
+        """
+        for data_unit_id in data_unit_ids:
+            page = self._build_page(LM, data_unit_id, link_by_id)
+            if page is not None:
+                yield page
+
+    def _build_page(
+        self,
+        LM: LogicalModel,
+        data_unit_id: str,
+        link_by_id: Dict[str, str],
+    ) -> Optional[EntityPage | AttributePage | RelationPage]:
+        """Build the catalog page for a data unit.
+
+        :param LM: Logical model used as the source of truth.
+        :type LM: LogicalModel
+        :param data_unit_id: Data unit identifier. Every unit it references must
+            already have a catalog row.
+        :type data_unit_id: str
+        :param link_by_id: Reference link of every catalog unit.
+        :type link_by_id: dict[str, str]
+        :returns: Catalog page, or ``None`` for unknown units.
+        :rtype: EntityPage | AttributePage | RelationPage | None
+        """
+        if data_unit_id in LM.entities:
+            entity = LM.entities[data_unit_id]
+
+            pk_attributes_references = ()
+            for identifier in LM.identifiers_by_entity_id.get(entity.id, []):
+                if identifier.is_pk:
+                    pk_attributes_references = tuple(
+                        [
+                            link_by_id[attribute.id]
+                            for attribute in identifier.attributes
+                        ]
+                    )
+
+            return EntityPage(
+                id=data_unit_id,
+                reference=ObjectReference(entity.id, link_by_id[entity.id]),
+                data_unit_type=DataUnitType.ENTITY,
+                description=entity.description,
+                pk_attributes_references=pk_attributes_references,
+                attributes_references=tuple(
                     [
-                        self.indexed_catalog.reference_by_id[
-                            attribute.id
-                        ].reference_link
-                        for attribute in LM.attributes_by_entity_id[entity.id]
+                        link_by_id[attribute.id]
+                        for attribute in LM.attributes_by_entity_id.get(entity.id, [])
                     ]
-                )
-                relations_references = tuple(
+                ),
+                relations_references=tuple(
                     [
-                        self.indexed_catalog.reference_by_id[relation.id].reference_link
-                        for relation in LM.relations_by_entity_id[entity.id]
+                        link_by_id[relation.id]
+                        for relation in LM.relations_by_entity_id.get(entity.id, [])
                     ]
-                )
+                ),
+                linked_documents=tuple(
+                    [document.name for document in entity.documents]
+                ),
+                responsible_parties=tuple(
+                    [party.name for party in entity.responsible_parties]
+                ),
+                pm_mapping_references=entity.pm_map,
+                source_systems=entity.source_systems,
+            )
 
-                page = EntityPage(
-                    id=data_unit_id,
-                    reference=self.indexed_catalog.reference_by_id[entity.id],
-                    data_unit_type=DataUnitType.ENTITY,
-                    description=entity.description,
-                    pk_attributes_references=pk_attributes_references,
-                    attributes_references=attributes_references,
-                    relations_references=relations_references,
-                    linked_documents=tuple(
-                        [document.name for document in entity.documents]
-                    ),
-                    responsible_parties=tuple(
-                        [party.name for party in entity.responsible_parties]
-                    ),
-                    pm_mapping_references=entity.pm_map,
-                    source_systems=entity.source_systems,
-                )
+        if data_unit_id in LM.attributes:
+            attribute = LM.attributes[data_unit_id]
+
+            return AttributePage(
+                id=data_unit_id,
+                reference=ObjectReference(attribute.id, link_by_id[attribute.id]),
+                data_unit_type=DataUnitType.ATTRIBUTE,
+                description=attribute.description,
+                parent_entity_reference=link_by_id[attribute.entity_id],
+                data_type=attribute.data_type,
+                sensitivity_type=attribute.sensitivity_type,
+                linked_documents=tuple(
+                    [document.name for document in attribute.documents]
+                ),
+                responsible_parties=tuple(
+                    [party.name for party in attribute.responsible_parties]
+                ),
+                pm_mapping_references=attribute.pm_map,
+                source_systems=attribute.source_systems,
+            )
 
-            elif data_unit_id in LM.attributes:
-                attribute = LM.attributes[data_unit_id]
-
-                page = AttributePage(
-                    id=data_unit_id,
-                    reference=self.indexed_catalog.reference_by_id[attribute.id],
-                    data_unit_type=DataUnitType.ATTRIBUTE,
-                    description=attribute.description,
-                    parent_entity_reference=self.indexed_catalog.reference_by_id[
-                        attribute.entity_id
-                    ].reference_link,
-                    data_type=attribute.data_type,
-                    sensitivity_type=attribute.sensitivity_type,
-                    linked_documents=tuple(
-                        [document.name for document in attribute.documents]
-                    ),
-                    responsible_parties=tuple(
-                        [party.name for party in attribute.responsible_parties]
-                    ),
-                    pm_mapping_references=attribute.pm_map,
-                    source_systems=attribute.source_systems,
-                )
+        if data_unit_id in LM.relations:
+            relation = LM.relations[data_unit_id]
+
+            return RelationPage(
+                id=data_unit_id,
+                reference=ObjectReference(relation.id, link_by_id[relation.id]),
+                data_unit_type=DataUnitType.RELATION,
+                description=relation.description,
+                source_entity_reference=link_by_id[relation.source_entity_id],
+                target_entity_reference=link_by_id[relation.target_entity_id],
+                linked_documents=tuple(
+                    [document.name for document in relation.documents]
+                ),
+                responsible_parties=tuple(
+                    [party.name for party in relation.responsible_parties]
+                ),
+                pm_mapping_references=relation.pm_map,
+                source_systems=relation.source_systems,
+            )
 
-            elif data_unit_id in LM.relations:
-                relation = LM.relations[data_unit_id]
-
-                page = RelationPage(
-                    id=data_unit_id,
-                    reference=self.indexed_catalog.reference_by_id[relation.id],
-                    data_unit_type=DataUnitType.RELATION,
-                    description=relation.description,
-                    source_entity_reference=self.indexed_catalog.reference_by_id[
-                        relation.source_entity_id
-                    ].reference_link,
-                    target_entity_reference=self.indexed_catalog.reference_by_id[
-                        relation.target_entity_id
-                    ].reference_link,
-                    linked_documents=tuple(
-                        [document.name for document in relation.documents]
-                    ),
-                    responsible_parties=tuple(
-                        [party.name for party in relation.responsible_parties]
-                    ),
-                    pm_mapping_references=relation.pm_map,
-                    source_systems=relation.source_systems,
-                )
+        logger.error(f"Unexpected data unit id {data_unit_id} while building pages.")
+        return None
 
-            else:
-                logger.error(
-                    f"Unexpected data unit id {data_unit_id} while updating pages."
-                )
+    def _stored_content_hash(self, id: str) -> Optional[str]:
+        """Return the content hash recorded for a page.
 
-                continue
+        :param id: Catalog object identifier.
+        :type id: str
+        :returns: Stored hash, computed from the cached page when none was stored.
+        :rtype: str | None
+        """
+        content_hash = self.indexed_catalog.content_hash_by_id.get(id)
+        if content_hash is None and id in self.indexed_catalog.page_by_id:
+            content_hash = page_content_hash(self.indexed_catalog.page_by_id[id])
+            self.indexed_catalog.content_hash_by_id[id] = content_hash
 
-            if page == self.indexed_catalog.page_by_id[data_unit_id]:
-                continue
-            else:
-                self.update_page(page)
+        return content_hash
 
     def save_to_local(self) -> None:
-        """Serialize the indexed catalog to the local checkpoint file."""
-        with open(
-            f"{self.config['data_catalog']['dc_checkpoint_path']}/{self.config['name']}.pkl",
-            "wb",
-        ) as f:
-            pickle.dump(self.indexed_catalog, f)
+        """Write the indexed catalog to the local checkpoint file.
+
+        With ``data_catalog.lazy_checkpoint`` the new file is mapped again
+        afterwards, so ``indexed_catalog`` is replaced by a fresh lazy view.
+        """
+        if self._mapped_checkpoint is None:
+            write_checkpoint(self.indexed_catalog, self.artifact_path)
+            return
+
+        # Encode before unmapping, unchanged units are still read from the map.
+        payload = encode_indexed_catalog(
+            self._mapped_checkpoint.materialize(self.indexed_catalog)
+        )
+        self._close_mapped_checkpoint()
+        write_checkpoint_bytes(payload, self.artifact_path)
+        self.indexed_catalog = self.load_from_local()
 
     def load_from_local(self) -> IndexedCatalog:
         """Load the indexed catalog from the local checkpoint file.
 
-        :returns: Deserialized indexed catalog.
+        With ``data_catalog.lazy_checkpoint`` enabled the file is memory-mapped
+        and units are decoded on first access.
+
+        :returns: Indexed catalog stored in the checkpoint.
         :rtype: IndexedCatalog
+        :raises ValueError: If the checkpoint format or version is not supported.
         """
-        with open(
-            f"{self.config['data_catalog']['dc_checkpoint_path']}/{self.config['name']}.pkl",
-            "rb",
-        ) as f:
-            return pickle.load(f)
+        if not self.config["data_catalog"].get("lazy_checkpoint", False):
+            return read_checkpoint(self.artifact_path)
+
+        self._close_mapped_checkpoint()
+        self._mapped_checkpoint = MappedCheckpoint(self.artifact_path)
+        return self._mapped_checkpoint.indexed_catalog
+
+    def _close_mapped_checkpoint(self) -> None:
+        if self._mapped_checkpoint is not None:
+            self._mapped_checkpoint.close()
+            self._mapped_checkpoint = None
@@ -1,9 +1,16 @@
 """Shared dataclass helpers and identifier utilities."""
 
+from functools import lru_cache
 import hashlib
 
 
+# Parsers derive ids from natural keys and often ask for the same key again,
+# for example when a table is declared in several YAML files.
+ID_CACHE_SIZE = 32768
+
+
+@lru_cache(maxsize=ID_CACHE_SIZE)
 def id_generator(*parts: str, size: int = 16) -> str:
-    h = hashlib.blake2b(digest_size=size)
-    h.update("\x1f".join(parts).encode("utf-8"))
-    return h.hexdigest()
+    return hashlib.blake2b(
+        "\x1f".join(parts).encode("utf-8"), digest_size=size
+    ).hexdigest()
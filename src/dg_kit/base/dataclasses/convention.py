@@ -3,7 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol, Set
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from dg_kit.base.enums import ConventionRuleSeverity
 from dg_kit.base.logical_model import LogicalModel
@@ -22,9 +32,62 @@ class ConventionRuleFn(Protocol):
     ) -> Set[ConventionBreach]: ...
 
 
+class ConventionRuleScopeFn(Protocol):
+    def __call__(self, lm: LogicalModel, pm: PhysicalModel) -> int: ...
+
+
+# Object ids and one or more value columns aligned with them. Values are
+# strings, numbers, booleans or None.
+ConventionRuleInputs = Tuple[Sequence[str], Tuple[Sequence[Any], ...]]
+
+
+class ConventionRuleInputsFn(Protocol):
+    def __call__(
+        self, lm: LogicalModel, pm: PhysicalModel, **kwargs: dict
+    ) -> List[ConventionRuleInputs]: ...
+
+
+class ConventionRuleCheckFn(Protocol):
+    def __call__(
+        self,
+        lm: LogicalModel,
+        pm: PhysicalModel,
+        object_ids: Optional[Set[str]],
+        **kwargs: dict,
+    ) -> Dict[str, List[ConventionBreach]]: ...
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalConventionRule:
+    inputs: ConventionRuleInputsFn
+    check: ConventionRuleCheckFn
+
+
 @dataclass(frozen=True, slots=True)
 class ConventionRule:
     name: str
     severity: ConventionRuleSeverity
     description: str
     fn: ConventionRuleFn
+    scope: Optional[ConventionRuleScopeFn] = None
+    incremental: Optional[IncrementalConventionRule] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ConventionRuleStats:
+    rule_name: str
+    wall_time: float
+    objects_scanned: Optional[int]
+    breach_count: int
+    profile: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class DeclarativeRule:
+    name: str
+    object_type: str
+    selector: Tuple[Tuple[str, FrozenSet[str]], ...]
+    field: str
+    predicates: Tuple[Tuple[str, Any], ...]
+    severity: ConventionRuleSeverity
+    message: Optional[str] = None
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 
 
 from dataclasses import dataclass, field
 
-from dg_kit.base.enums import DataUnitType
+from dg_kit.base.enums import DataUnitType, SyncAction
 from dg_kit.base.dataclasses.business_information import Document, Team
 
 
@@ -81,3 +81,20 @@ class IndexedCatalog:
     page_by_id: Dict[str, EntityPage | AttributePage | RelationPage] = field(
         default_factory=dict
     )
+    last_edited_time: Optional[str] = None
+    content_hash_by_id: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class SyncOperation:
+    action: SyncAction
+    data_unit_id: str
+    data_unit_type: Optional[DataUnitType]
+    data_unit_name: Optional[str]
+    api_calls: int
+
+
+@dataclass(frozen=True, slots=True)
+class SyncPlan:
+    operations: Tuple[SyncOperation, ...] = ()
+    api_calls: int = 0
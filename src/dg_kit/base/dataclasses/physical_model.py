@@ -1,6 +1,8 @@
 """Dataclasses describing layers, tables, and columns."""
 
+from array import array
 from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,3 +30,19 @@ class Column:
     name: str
     data_type: str
     description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnarPhysicalModel:
+    layer_ids: Tuple[str, ...]
+    layer_names: Tuple[str, ...]
+    table_ids: Tuple[str, ...]
+    table_names: Tuple[str, ...]
+    table_layer: array
+    column_ids: Tuple[str, ...]
+    column_names: Tuple[str, ...]
+    column_data_types: Tuple[str, ...]
+    column_table: array
+    column_layer: array
+    dependency_dependent: array
+    dependency_dependency: array
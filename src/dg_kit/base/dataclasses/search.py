@@ -0,0 +1,17 @@
+"""Dataclasses returned by model search."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    id: str
+    kind: str
+    name: str
+    layers: Tuple[str, ...]
+    score: float
+    unit: Any
+    description: Optional[str] = None
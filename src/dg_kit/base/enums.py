@@ -20,3 +20,11 @@ class DataCatalogRowProperties(StrEnum):
     UNIT_TYPE = "Data unit type"
     TITLE = "Data unit"
     DOMAIN = "Domain"
+
+
+class SyncAction(StrEnum):
+    ADD_ROW = "add_row"
+    ADD_PAGE = "add_page"
+    UPDATE_ROW = "update_row"
+    UPDATE_PAGE = "update_page"
+    DELETE = "delete"
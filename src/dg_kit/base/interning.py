@@ -0,0 +1,206 @@
+"""Shared storage for repeated values in model objects.
+
+Model units repeat many values: domains, data types, sensitivity types, source
+systems and responsible party tuples, and, across model versions, most ids,
+names and descriptions. Parsers pass these values through one
+:class:`Interner` so equal values are stored once, no matter how many units or
+model versions refer to them.
+
+Whole units repeat across versions as well. :class:`UnitStore` keeps one
+instance per distinct unit content, addressed by a content hash, so versions
+that leave a unit unchanged reference the same object. Units are counted per
+retaining version and dropped once no version uses them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, TypeVar
+import hashlib
+import sys
+
+
+T = TypeVar("T")
+
+# Values that are always shared by the interpreter and not worth counting.
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class Interner:
+    """Return one canonical instance for each distinct string or tuple."""
+
+    def __init__(self):
+        self._values: Dict[Any, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: T) -> T:
+        """Return the canonical instance of a hashable value.
+
+        :param value: String, tuple or other hashable value. ``None`` is
+            returned unchanged.
+        :type value: T
+        :returns: Previously interned equal value, or ``value`` itself.
+        :rtype: T
+        """
+        if value is None:
+            return value
+
+        canonical = self._values.get(value)
+        if canonical is None:
+            self.misses += 1
+            self._values[value] = value
+            return value
+
+        self.hits += 1
+        return canonical
+
+    def strings(self, values: Iterable[Optional[str]]) -> Tuple[Optional[str], ...]:
+        """Intern each string and the resulting tuple.
+
+        :param values: Strings to store.
+        :type values: Iterable[str | None]
+        :returns: Canonical tuple of canonical strings.
+        :rtype: tuple[str | None, ...]
+        """
+        return self.intern(tuple(self.intern(value) for value in values))
+
+    def stats(self) -> Dict[str, int]:
+        """Return interning counters.
+
+        :returns: Number of distinct values, reused values and first sightings.
+        :rtype: dict[str, int]
+        """
+        return {"values": len(self._values), "hits": self.hits, "misses": self.misses}
+
+
+def content_hash(unit: Any) -> str:
+    """Return a hash of a frozen dataclass and everything it references.
+
+    :param unit: Model unit, such as an entity or attribute.
+    :type unit: Any
+    :returns: Hex digest that changes whenever any field value changes.
+    :rtype: str
+    """
+    return hashlib.blake2b(repr(unit).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class UnitStore:
+    """Content-addressed store of immutable model units shared across versions.
+
+    Stored units stay available for lookups until they are released. Versions
+    :meth:`retain` the hashes of their units and :meth:`release` them when
+    they are dropped; a unit is removed once its last version releases it.
+    """
+
+    def __init__(self):
+        self.units_by_hash: Dict[str, Any] = {}
+        self._hash_by_unit: Dict[Any, str] = {}
+        self._ref_counts: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.units_by_hash)
+
+    def store(self, unit: T) -> T:
+        """Return the shared instance of a unit, storing it if it is new.
+
+        :param unit: Hashable model unit.
+        :type unit: T
+        :returns: Previously stored equal unit, or ``unit`` itself.
+        :rtype: T
+        """
+        return self.units_by_hash[self.hash(unit)]
+
+    def hash(self, unit: Any) -> str:
+        """Return the content hash of a unit, storing the unit if it is new.
+
+        Hashes are computed once per distinct content, so looking up units
+        repeated across versions costs one dictionary lookup.
+
+        :param unit: Hashable model unit.
+        :type unit: Any
+        :returns: Content hash of the unit.
+        :rtype: str
+        """
+        unit_hash = self._hash_by_unit.get(unit)
+        if unit_hash is None:
+            unit_hash = content_hash(unit)
+            self._hash_by_unit[unit] = unit_hash
+            self.units_by_hash.setdefault(unit_hash, unit)
+
+        return unit_hash
+
+    def retain(self, unit_hashes: Iterable[str]) -> None:
+        """Count one more version referring to each unit.
+
+        :param unit_hashes: Content hashes of stored units.
+        :type unit_hashes: Iterable[str]
+        :raises KeyError: If a hash is not stored.
+        """
+        for unit_hash in unit_hashes:
+            if unit_hash not in self.units_by_hash:
+                raise KeyError(f"Unit {unit_hash} is not stored.")
+            self._ref_counts[unit_hash] = self._ref_counts.get(unit_hash, 0) + 1
+
+    def release(self, unit_hashes: Iterable[str]) -> None:
+        """Count one less version referring to each unit.
+
+        Units no longer retained by any version are removed from the store.
+
+        :param unit_hashes: Content hashes previously passed to :meth:`retain`.
+        :type unit_hashes: Iterable[str]
+        :raises KeyError: If a hash is not retained.
+        """
+        for unit_hash in unit_hashes:
+            if unit_hash not in self._ref_counts:
+                raise KeyError(f"Unit {unit_hash} is not retained.")
+
+            self._ref_counts[unit_hash] -= 1
+            if self._ref_counts[unit_hash] == 0:
+                del self._ref_counts[unit_hash]
+                unit = self.units_by_hash.pop(unit_hash)
+                self._hash_by_unit.pop(unit, None)
+
+
+def deep_sizeof(root: Any, seen: Optional[Set[int]] = None) -> int:
+    """Return the memory used by an object graph.
+
+    Containers, dataclass instances and objects with ``__dict__`` are followed.
+    Objects whose id is in ``seen`` are skipped and visited ids are added to it,
+    so passing the same set over several roots counts shared objects once.
+
+    :param root: Object to measure.
+    :type root: Any
+    :param seen: Ids of objects that are already accounted for.
+    :type seen: set[int] | None
+    :returns: Size in bytes of the objects not seen before.
+    :rtype: int
+    """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, _ATOMIC_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            stack.extend(getattr(obj, field.name) for field in fields(obj))
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(vars(obj))
+
+    return size
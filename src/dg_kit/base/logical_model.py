@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import Dict, List
 
 from dg_kit.base import add_value_to_indexed_list
+from dg_kit.base.interning import Interner, UnitStore, deep_sizeof
 from dg_kit.base.dataclasses.logical_model import (
     EntityIdentifier,
     Entity,
@@ -24,6 +25,7 @@ class LogicalModel:
         self.attributes_by_entity_id: Dict[str, List[Attribute]] = {}
         self.identifiers_by_entity_id: Dict[str, List[EntityIdentifier]] = {}
         self.pm_objects_by_lm_id: Dict[str, List[str]] = {}
+        self.lm_ids_by_pm_id: Dict[str, List[str]] = {}
 
     def register_entity(self, entity: Entity) -> None:
         self.entities[entity.id] = entity
@@ -34,6 +36,7 @@ class LogicalModel:
                 self.pm_objects_by_lm_id[entity.id].append(pm_obj)
             else:
                 self.pm_objects_by_lm_id[entity.id] = [pm_obj]
+            add_value_to_indexed_list(self.lm_ids_by_pm_id, pm_obj.id, entity.id)
 
     def register_attribute(self, attribute: Attribute) -> None:
         self.attributes[attribute.id] = attribute
@@ -45,6 +48,7 @@ class LogicalModel:
 
         for pm_obj in attribute.pm_map:
             add_value_to_indexed_list(self.pm_objects_by_lm_id, attribute.id, pm_obj)
+            add_value_to_indexed_list(self.lm_ids_by_pm_id, pm_obj.id, attribute.id)
 
     def register_relation(self, relation: Relation) -> None:
         self.relations[relation.id] = relation
@@ -59,6 +63,7 @@ class LogicalModel:
 
         for pm_obj in relation.pm_map:
             add_value_to_indexed_list(self.pm_objects_by_lm_id, relation.id, pm_obj)
+            add_value_to_indexed_list(self.lm_ids_by_pm_id, pm_obj.id, relation.id)
 
     def register_dependency(self, dependent: Entity, dependency: Attribute) -> None:
         add_value_to_indexed_list(self.dependencies, dependent.id, dependency.id)
@@ -72,6 +77,76 @@ class LogicalModel:
 class LogicalModelsDatabase:
     def __init__(self):
         self.logical_models: Dict[str, LogicalModel] = {}
+        # Shared by parsers so that versions reuse each other's values and units.
+        self.interner = Interner()
+        self.units = UnitStore()
+        self.unit_hashes_by_version: Dict[str, Dict[str, str]] = {}
 
     def register_logical_model(self, logical_model: LogicalModel) -> None:
+        unit_hashes = {
+            unit_id: self.units.hash(unit)
+            for unit_id, unit in logical_model.all_units_by_id.items()
+        }
+        self.units.retain(unit_hashes.values())
+
+        if logical_model.version in self.logical_models:
+            self.unregister_logical_model(logical_model.version)
+
         self.logical_models[logical_model.version] = logical_model
+        self.unit_hashes_by_version[logical_model.version] = unit_hashes
+
+    def unregister_logical_model(self, version: str) -> None:
+        """Drop a registered version and the units only it referred to.
+
+        :param version: Registered version.
+        :type version: str
+        :raises KeyError: If the version is not registered.
+        """
+        del self.logical_models[version]
+        self.units.release(self.unit_hashes_by_version.pop(version).values())
+
+    def diff_versions(self, old_version: str, new_version: str) -> Dict[str, List[str]]:
+        """Compare two registered versions by unit content hash.
+
+        :param old_version: Version to compare from.
+        :type old_version: str
+        :param new_version: Version to compare to.
+        :type new_version: str
+        :returns: Ids of ``added``, ``removed`` and ``changed`` units.
+        :rtype: dict[str, list[str]]
+        :raises KeyError: If either version is not registered.
+        """
+        old_hashes = self.unit_hashes_by_version[old_version]
+        new_hashes = self.unit_hashes_by_version[new_version]
+
+        return {
+            "added": [unit_id for unit_id in new_hashes if unit_id not in old_hashes],
+            "removed": [unit_id for unit_id in old_hashes if unit_id not in new_hashes],
+            "changed": [
+                unit_id
+                for unit_id, unit_hash in new_hashes.items()
+                if unit_id in old_hashes and old_hashes[unit_id] != unit_hash
+            ],
+        }
+
+    def memory_report(self) -> Dict[str, Dict[str, int]]:
+        """Report the memory used by each registered model version.
+
+        Versions are measured in registration order. ``bytes`` is everything
+        reachable from a model, while ``unique_bytes`` leaves out objects
+        already counted for earlier versions, so the ``unique_bytes`` of all
+        versions add up to the memory of the whole database.
+
+        :returns: Unit count and sizes keyed by version.
+        :rtype: dict[str, dict[str, int]]
+        """
+        report: Dict[str, Dict[str, int]] = {}
+        seen_by_database: set[int] = set()
+        for version, logical_model in self.logical_models.items():
+            report[version] = {
+                "units": len(logical_model.all_units_by_id),
+                "bytes": deep_sizeof(logical_model),
+                "unique_bytes": deep_sizeof(logical_model, seen_by_database),
+            }
+
+        return report
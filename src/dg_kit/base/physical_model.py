@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from array import array
+from typing import Dict, List, Optional
+import sys
 
 from dg_kit.base import add_value_to_indexed_list
 from dg_kit.base.dataclasses.physical_model import (
     Table,
     Column,
     Layer,
+    ColumnarPhysicalModel,
 )
 
 
+# Code of a layer or table that is referenced but not registered.
+MISSING_CODE = 0xFFFFFFFF
+
+
 class PhysicalModel:
     def __init__(self, version):
         self.version = version
@@ -20,21 +27,92 @@ class PhysicalModel:
         self.columns: Dict[str, Column] = {}
         self.dependencies: Dict[str, List[str]] = {}
         self.all_units_by_id: Dict[str, Layer | Table | Column] = {}
+        self._columnar: Optional[ColumnarPhysicalModel] = None
 
     def register_layer(self, layer: Layer):
         self.layers[layer.id] = layer
         self.all_units_by_id[layer.id] = layer
+        self._columnar = None
 
     def register_table(self, table: Table) -> None:
         self.tables[table.id] = table
         self.all_units_by_id[table.id] = table
+        self._columnar = None
 
     def register_column(self, column: Column) -> None:
         self.columns[column.id] = column
         self.all_units_by_id[column.id] = column
+        self._columnar = None
 
     def register_dependency(self, dependent: Table, dependency: Table) -> None:
         add_value_to_indexed_list(self.dependencies, dependent.id, dependency.id)
+        self._columnar = None
+
+    def to_columnar(self) -> ColumnarPhysicalModel:
+        """Return a columnar snapshot of the model.
+
+        Layers and tables are stored as parallel tuples in registration order.
+        Tables, columns and dependency edges refer to them through unsigned
+        32-bit code arrays, with ``MISSING_CODE`` for unregistered references.
+        The arrays support the buffer protocol, so NumPy can wrap them without
+        copying. The snapshot is cached until the next ``register_*`` call.
+
+        :returns: Columnar snapshot of layers, tables, columns and dependencies.
+        :rtype: ColumnarPhysicalModel
+        """
+        if self._columnar is None:
+            self._columnar = self._build_columnar()
+
+        return self._columnar
+
+    def _build_columnar(self) -> ColumnarPhysicalModel:
+        layer_code_by_id = {layer_id: code for code, layer_id in enumerate(self.layers)}
+        table_code_by_id = {table_id: code for code, table_id in enumerate(self.tables)}
+        tables = self.tables.values()
+        columns = self.columns.values()
+
+        dependency_dependent = array("I")
+        dependency_dependency = array("I")
+        for dependent_id, dependency_ids in self.dependencies.items():
+            dependent_code = table_code_by_id.get(dependent_id, MISSING_CODE)
+            for dependency_id in dependency_ids:
+                dependency_dependent.append(dependent_code)
+                dependency_dependency.append(
+                    table_code_by_id.get(dependency_id, MISSING_CODE)
+                )
+
+        return ColumnarPhysicalModel(
+            layer_ids=tuple(self.layers),
+            layer_names=tuple(layer.name for layer in self.layers.values()),
+            table_ids=tuple(self.tables),
+            table_names=tuple(table.name for table in tables),
+            table_layer=array(
+                "I",
+                [
+                    layer_code_by_id.get(table.layer_id, MISSING_CODE)
+                    for table in tables
+                ],
+            ),
+            column_ids=tuple(self.columns),
+            column_names=tuple(sys.intern(column.name) for column in columns),
+            column_data_types=tuple(sys.intern(column.data_type) for column in columns),
+            column_table=array(
+                "I",
+                [
+                    table_code_by_id.get(column.table_id, MISSING_CODE)
+                    for column in columns
+                ],
+            ),
+            column_layer=array(
+                "I",
+                [
+                    layer_code_by_id.get(column.layer_id, MISSING_CODE)
+                    for column in columns
+                ],
+            ),
+            dependency_dependent=dependency_dependent,
+            dependency_dependency=dependency_dependency,
+        )
 
 
 class PhysicalModelsDatabase:
@@ -0,0 +1,467 @@
+"""Declarative convention rules compiled into columnar checks.
+
+A declarative rule selects model objects of one type, optionally filtered by
+field values, and applies predicates to one of their fields. Rules are listed
+under the ``declarative`` convention rule::
+
+    declarative:
+      severity: warning
+      description: Simple metadata rules.
+      rules:
+        attributes_have_description:
+          select:
+            type: attribute
+            domain: [sales, finance]
+          field: description
+          not_null: true
+        core_columns_are_snake_case:
+          select: {type: column, layer: [core]}
+          field: name
+          regex: "^[a-z0-9_]+$"
+          severity: error
+
+Regexes are case-sensitive. Set ``ignore_case: true`` on the rule, or start
+the pattern with ``(?i)``, to match regardless of case.
+
+Model objects are read once per type into columns shared by every rule, and
+each distinct selector and predicate is evaluated once over its column.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+import re
+
+from dg_kit.base.dataclasses.convention import (
+    ConventionBreach,
+    ConventionRuleInputs,
+    DeclarativeRule,
+)
+from dg_kit.base.dataclasses.logical_model import Attribute, Entity, Relation
+from dg_kit.base.dataclasses.physical_model import Column, Table
+from dg_kit.base.enums import ConventionRuleSeverity
+from dg_kit.base.logical_model import LogicalModel
+from dg_kit.base.physical_model import PhysicalModel
+
+
+OBJECT_CLASS_BY_TYPE = {
+    "entity": Entity,
+    "attribute": Attribute,
+    "relation": Relation,
+    "table": Table,
+    "column": Column,
+}
+# Fields resolved from related objects instead of read from the object.
+VIRTUAL_FIELDS_BY_TYPE = {
+    "table": ("layer",),
+    "column": ("layer", "table"),
+}
+PREDICATES = ("not_null", "regex", "in_set", "references_exist")
+RULE_KEYS = frozenset(
+    ("select", "field", "severity", "message", "ignore_case", *PREDICATES)
+)
+
+
+def compile_declarative_rules(
+    rules_config: Dict[str, Dict[str, Any]],
+    default_severity: ConventionRuleSeverity,
+) -> Tuple[DeclarativeRule, ...]:
+    """Validate declarative rule definitions and compile them.
+
+    :param rules_config: Rule definitions keyed by rule name.
+    :type rules_config: dict[str, dict[str, Any]]
+    :param default_severity: Severity of rules that do not set their own.
+    :type default_severity: ConventionRuleSeverity
+    :returns: Compiled rules in definition order.
+    :rtype: tuple[DeclarativeRule, ...]
+    :raises ValueError: If a rule selects an unknown type or field, uses an
+        unknown key, has no predicate, or sets ``ignore_case`` without a regex.
+    """
+    compiled = []
+
+    for rule_name, spec in rules_config.items():
+        unknown_keys = set(spec) - RULE_KEYS
+        if unknown_keys:
+            raise ValueError(
+                f"Unknown keys in declarative rule '{rule_name}': "
+                f"{', '.join(sorted(unknown_keys))}"
+            )
+
+        select = dict(spec.get("select") or {})
+        object_type = select.pop("type", None)
+        if object_type not in OBJECT_CLASS_BY_TYPE:
+            raise ValueError(
+                f"Declarative rule '{rule_name}' must select a type out of "
+                f"{', '.join(OBJECT_CLASS_BY_TYPE)}"
+            )
+
+        field = spec.get("field")
+        for selected_field in (*select, field):
+            _check_field(rule_name, object_type, selected_field)
+
+        predicates = []
+        for predicate in PREDICATES:
+            if predicate not in spec or spec[predicate] is False:
+                continue
+            predicates.append(
+                (predicate, _predicate_argument(rule_name, predicate, spec[predicate]))
+            )
+        if not predicates:
+            raise ValueError(
+                f"Declarative rule '{rule_name}' needs at least one predicate out of "
+                f"{', '.join(PREDICATES)}"
+            )
+        if spec.get("ignore_case"):
+            if not any(predicate == "regex" for predicate, _ in predicates):
+                raise ValueError(
+                    f"Declarative rule '{rule_name}' sets ignore_case without a regex"
+                )
+            predicates = [
+                (predicate, f"(?i){argument}" if predicate == "regex" else argument)
+                for predicate, argument in predicates
+            ]
+
+        compiled.append(
+            DeclarativeRule(
+                name=rule_name,
+                object_type=object_type,
+                selector=tuple(
+                    (
+                        selected_field,
+                        frozenset(str(value) for value in _as_list(values)),
+                    )
+                    for selected_field, values in select.items()
+                ),
+                field=field,
+                predicates=tuple(predicates),
+                severity=ConventionRuleSeverity(spec.get("severity", default_severity)),
+                message=spec.get("message"),
+            )
+        )
+
+    return tuple(compiled)
+
+
+def _as_list(value: Any) -> List[Any]:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _check_field(rule_name: str, object_type: str, field: Optional[str]) -> None:
+    allowed_fields = {
+        dataclass_field.name
+        for dataclass_field in fields(OBJECT_CLASS_BY_TYPE[object_type])
+    }
+    allowed_fields.update(VIRTUAL_FIELDS_BY_TYPE.get(object_type, ()))
+
+    if field not in allowed_fields:
+        raise ValueError(
+            f"Declarative rule '{rule_name}' uses unknown {object_type} field "
+            f"'{field}', expected one of {', '.join(sorted(allowed_fields))}"
+        )
+
+
+def _predicate_argument(rule_name: str, predicate: str, argument: Any) -> Any:
+    if predicate == "not_null":
+        return True
+    if predicate == "regex":
+        try:
+            re.compile(argument)
+        except (re.error, TypeError) as e:
+            raise ValueError(
+                f"Declarative rule '{rule_name}' has an invalid regex: {e}"
+            ) from e
+        return argument
+    if predicate == "in_set":
+        return frozenset(str(value) for value in _as_list(argument))
+    if argument not in OBJECT_CLASS_BY_TYPE:
+        raise ValueError(
+            f"Declarative rule '{rule_name}' references unknown type '{argument}'"
+        )
+    return argument
+
+
+def _elements(value: Any) -> Tuple[Any, ...]:
+    return value if isinstance(value, tuple) else (value,)
+
+
+def _text(value: Any) -> str:
+    return str(getattr(value, "name", value))
+
+
+def _input_column(values: Sequence[Any]) -> Sequence[Any]:
+    # Text columns are read as they are; other values are recorded as scalars.
+    try:
+        "".join(values)
+    except TypeError:
+        return [
+            value if value is None or isinstance(value, (int, float)) else str(value)
+            for value in values
+        ]
+    return values
+
+
+class ModelColumns:
+    """Columnar view of model objects.
+
+    Each ``(object type, field)`` column is read once and shared by every rule
+    evaluated against the same models.
+    """
+
+    def __init__(self, LM: LogicalModel, PM: PhysicalModel):
+        """Initialize the view.
+
+        :param LM: Logical model to read entities, attributes and relations from.
+        :type LM: LogicalModel
+        :param PM: Physical model to read tables and columns from.
+        :type PM: PhysicalModel
+        """
+        self.LM = LM
+        self.PM = PM
+        self._objects: Dict[str, List[Any]] = {}
+        self._columns: Dict[Tuple[str, str], Sequence[Any]] = {}
+        self._id_sets: Dict[str, FrozenSet[str]] = {}
+
+    def objects(self, object_type: str) -> List[Any]:
+        """Return the objects of one type in model order.
+
+        :param object_type: Object type, such as ``"table"``.
+        :type object_type: str
+        :returns: Model objects of the type.
+        :rtype: list[Any]
+        """
+        if object_type not in self._objects:
+            container = {
+                "entity": self.LM.entities,
+                "attribute": self.LM.attributes,
+                "relation": self.LM.relations,
+                "table": self.PM.tables,
+                "column": self.PM.columns,
+            }[object_type]
+            self._objects[object_type] = list(container.values())
+
+        return self._objects[object_type]
+
+    def column(self, object_type: str, field: str) -> Sequence[Any]:
+        """Return the values of one field for every object of a type.
+
+        :param object_type: Object type, such as ``"table"``.
+        :type object_type: str
+        :param field: Field name.
+        :type field: str
+        :returns: Field values aligned with :meth:`objects`.
+        :rtype: Sequence[Any]
+        """
+        key = (object_type, field)
+        if key in self._columns:
+            return self._columns[key]
+
+        if object_type in ("table", "column") and field in ("id", "name"):
+            # Ids and names are kept by the cached columnar snapshot.
+            values = getattr(self.PM.to_columnar(), f"{object_type}_{field}s")
+        elif field in VIRTUAL_FIELDS_BY_TYPE.get(object_type, ()):
+            columnar = self.PM.to_columnar()
+            if field == "layer":
+                names = columnar.layer_names
+                codes = getattr(columnar, f"{object_type}_layer")
+            else:
+                names = columnar.table_names
+                codes = columnar.column_table
+            # Unknown codes, MISSING_CODE included, resolve to None.
+            values = list(map(dict(enumerate(names)).get, codes))
+        else:
+            values = list(map(attrgetter(field), self.objects(object_type)))
+
+        self._columns[key] = values
+        return values
+
+    def id_set(self, object_type: str) -> FrozenSet[str]:
+        """Return the ids of every object of a type.
+
+        :param object_type: Object type, such as ``"table"``.
+        :type object_type: str
+        :returns: Object ids.
+        :rtype: frozenset[str]
+        """
+        if object_type not in self._id_sets:
+            self._id_sets[object_type] = frozenset(self.column(object_type, "id"))
+        return self._id_sets[object_type]
+
+
+def _failure_fn(
+    predicate: str, argument: Any, columns: ModelColumns
+) -> Callable[[Any], bool]:
+    """Return a function telling whether a field value breaks a predicate.
+
+    Only ``not_null`` rejects missing values; other predicates ignore them.
+    """
+    if predicate == "not_null":
+        return lambda value: value is None or value == "" or value == ()
+
+    if predicate == "regex":
+        match = re.compile(argument).match
+        return lambda value: (
+            value is not None
+            and not all(match(_text(element)) for element in _elements(value))
+        )
+
+    if predicate == "in_set":
+        return lambda value: (
+            value is not None
+            and not all(_text(element) in argument for element in _elements(value))
+        )
+
+    ids = columns.id_set(argument)
+    return lambda value: (
+        value is not None
+        and not all(
+            getattr(element, "id", element) in ids for element in _elements(value)
+        )
+    )
+
+
+def _describe_failure(predicate: str, argument: Any) -> str:
+    if predicate == "not_null":
+        return "is empty"
+    if predicate == "regex":
+        return f"does not match '{argument}'"
+    if predicate == "in_set":
+        return f"is not one of {', '.join(sorted(argument))}"
+    return f"references a missing {argument}"
+
+
+def evaluate_declarative_rules(
+    rules: Tuple[DeclarativeRule, ...],
+    columns: ModelColumns,
+    object_ids: Optional[Set[str]] = None,
+) -> Dict[str, List[ConventionBreach]]:
+    """Evaluate compiled rules over model columns.
+
+    Selections and predicate results are cached per column, so rules sharing a
+    selector or predicate reuse each other's work.
+
+    :param rules: Compiled declarative rules.
+    :type rules: tuple[DeclarativeRule, ...]
+    :param columns: Columnar view of the models.
+    :type columns: ModelColumns
+    :param object_ids: Only check these objects. Checks every object when
+        ``None``.
+    :type object_ids: set[str] | None
+    :returns: Breaches keyed by object id.
+    :rtype: dict[str, list[ConventionBreach]]
+    """
+    issues: Dict[str, List[ConventionBreach]] = {}
+    rows_by_selector: Dict[Tuple[str, Any], List[int]] = {}
+    failures_by_predicate: Dict[Tuple[str, str, str, Any], List[bool]] = {}
+
+    for rule in rules:
+        ids = columns.column(rule.object_type, "id")
+
+        selector_key = (rule.object_type, rule.selector)
+        if selector_key not in rows_by_selector:
+            rows = range(len(ids))
+            if object_ids is not None:
+                rows = [row for row in rows if ids[row] in object_ids]
+            for selected_field, allowed_values in rule.selector:
+                values = columns.column(rule.object_type, selected_field)
+                rows = [row for row in rows if str(values[row]) in allowed_values]
+            rows_by_selector[selector_key] = list(rows)
+        rows = rows_by_selector[selector_key]
+
+        values = columns.column(rule.object_type, rule.field)
+        failed_rows: Dict[int, List[str]] = {}
+        for predicate, argument in rule.predicates:
+            failure_fn = _failure_fn(predicate, argument, columns)
+            if object_ids is None:
+                predicate_key = (rule.object_type, rule.field, predicate, argument)
+                if predicate_key not in failures_by_predicate:
+                    failures_by_predicate[predicate_key] = list(map(failure_fn, values))
+                failures = failures_by_predicate[predicate_key]
+                failing = [row for row in rows if failures[row]]
+            else:
+                failing = [row for row in rows if failure_fn(values[row])]
+
+            for row in failing:
+                failed_rows.setdefault(row, []).append(
+                    _describe_failure(predicate, argument)
+                )
+
+        if not failed_rows:
+            continue
+
+        names = columns.column(rule.object_type, "name")
+        for row in sorted(failed_rows):
+            if rule.message:
+                message = rule.message.format(
+                    rule=rule.name,
+                    name=names[row],
+                    field=rule.field,
+                    value=values[row],
+                )
+            else:
+                message = (
+                    f"{rule.object_type.capitalize()} '{names[row]}' breaks rule "
+                    f"'{rule.name}': {rule.field} {' and '.join(failed_rows[row])}"
+                )
+            issues.setdefault(ids[row], []).append(
+                ConventionBreach(severity=rule.severity, message=message)
+            )
+
+    return issues
+
+
+def declarative_inputs(
+    rules: Tuple[DeclarativeRule, ...],
+    columns: ModelColumns,
+) -> List[ConventionRuleInputs]:
+    """Collect, per rule, the columns of every value the rule reads.
+
+    Used to find changed objects for incremental validation. Referenced ids
+    are recorded with their existence, so deleting a referenced object
+    re-checks the objects pointing to it.
+
+    :param rules: Compiled declarative rules.
+    :type rules: tuple[DeclarativeRule, ...]
+    :param columns: Columnar view of the models.
+    :type columns: ModelColumns
+    :returns: One input block per rule.
+    :rtype: list[ConventionRuleInputs]
+    """
+    blocks: List[ConventionRuleInputs] = []
+
+    for rule in rules:
+        values = columns.column(rule.object_type, rule.field)
+        read_columns = [
+            _input_column(columns.column(rule.object_type, selected_field))
+            for selected_field, _ in rule.selector
+        ]
+        read_columns.append(_input_column(values))
+
+        for predicate, argument in rule.predicates:
+            if predicate != "references_exist":
+                continue
+            reference_ids = columns.id_set(argument)
+            read_columns.append(
+                [
+                    "".join(
+                        "1" if getattr(element, "id", element) in reference_ids else "0"
+                        for element in _elements(value)
+                    )
+                    for value in values
+                ]
+            )
+
+        blocks.append((columns.column(rule.object_type, "id"), tuple(read_columns)))
+
+    return blocks
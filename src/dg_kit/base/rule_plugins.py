@@ -0,0 +1,66 @@
+"""Convention rules provided by installed packages.
+
+Packages expose rules through the ``dg_kit.convention_rules`` entry point
+group. Each entry point name is a rule name usable in the convention YAML,
+and its object is a rule function::
+
+    [project.entry-points."dg_kit.convention_rules"]
+    no_wide_tables = "my_rules.tables:no_wide_tables"
+
+Only rules referenced by the convention are imported.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib.metadata import EntryPoint, entry_points
+from typing import Dict
+import logging
+
+from dg_kit.base.dataclasses.convention import ConventionRuleFn
+
+
+logger = logging.getLogger(__name__)
+
+CONVENTION_RULES_ENTRY_POINT_GROUP = "dg_kit.convention_rules"
+
+
+@lru_cache(maxsize=None)
+def available_rule_plugins() -> Dict[str, EntryPoint]:
+    """Return installed rule entry points without importing them.
+
+    :returns: Entry points keyed by rule name.
+    :rtype: dict[str, EntryPoint]
+    """
+    plugins: Dict[str, EntryPoint] = {}
+    for entry_point in entry_points(group=CONVENTION_RULES_ENTRY_POINT_GROUP):
+        if entry_point.name in plugins:
+            logger.warning(
+                f"Convention rule '{entry_point.name}' is provided more than once, "
+                f"using {plugins[entry_point.name].value}"
+            )
+            continue
+        plugins[entry_point.name] = entry_point
+
+    return plugins
+
+
+@lru_cache(maxsize=None)
+def load_rule_plugin(rule_name: str) -> ConventionRuleFn:
+    """Import the rule function registered under a name.
+
+    :param rule_name: Rule name used in the convention YAML.
+    :type rule_name: str
+    :returns: Rule function.
+    :rtype: ConventionRuleFn
+    :raises ValueError: If no installed package provides the rule.
+    """
+    entry_point = available_rule_plugins().get(rule_name)
+    if entry_point is None:
+        raise ValueError(
+            f"Unknown convention rule '{rule_name}'. It is neither built in nor "
+            f"provided by a '{CONVENTION_RULES_ENTRY_POINT_GROUP}' entry point."
+        )
+
+    logger.debug(f"Loading convention rule '{rule_name}' from {entry_point.value}")
+    return entry_point.load()
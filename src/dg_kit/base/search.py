@@ -0,0 +1,285 @@
+"""Inverted index for looking up model units by name and description.
+
+Names, natural keys and descriptions of logical and physical units are split
+into lowercase tokens. Identifiers such as ``customer_id`` are indexed whole
+and by their underscore-separated parts, and camelCase names are split the
+same way. A query token matches index tokens exactly, by prefix, or, when
+neither matches, by trigram similarity, so misspelled queries still find
+units. Every query token has to match for a unit to be returned.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import re
+
+from dg_kit.base.dataclasses.search import SearchHit
+from dg_kit.base.logical_model import LogicalModel
+from dg_kit.base.physical_model import PhysicalModel
+
+
+SEARCH_KINDS = ("entity", "attribute", "relation", "table", "column")
+# Matches in names and natural keys rank above matches in descriptions.
+NAME_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+PREFIX_MATCH_FACTOR = 0.6
+FUZZY_MATCH_FACTOR = 0.5
+# Minimum trigram Jaccard similarity of a fuzzy match.
+FUZZY_MATCH_THRESHOLD = 0.4
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def _words(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return _TOKEN.findall(_CAMEL_CASE_BOUNDARY.sub("_", text).lower())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into index tokens.
+
+    :param text: Name, natural key or description.
+    :type text: str | None
+    :returns: Lowercase identifiers followed by their underscore-separated parts.
+    :rtype: list[str]
+    """
+    tokens = []
+    for word in _words(text):
+        tokens.append(word)
+        if "_" in word:
+            tokens.extend(word.split("_"))
+    return tokens
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Search logical and physical model units by name and description."""
+
+    def __init__(
+        self,
+        LM: Optional[LogicalModel] = None,
+        PM: Optional[PhysicalModel] = None,
+    ):
+        """Build the index.
+
+        :param LM: Logical model whose entities, attributes and relations are indexed.
+        :type LM: LogicalModel | None
+        :param PM: Physical model whose tables and columns are indexed. Its
+            layers also resolve the layers of logical units from their ``pm_map``.
+        :type PM: PhysicalModel | None
+        """
+        self._ids: List[str] = []
+        self._kinds: List[str] = []
+        self._layers: List[Tuple[str, ...]] = []
+        self._units: List[Any] = []
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._tokens_by_trigram: Optional[Dict[str, Set[str]]] = None
+
+        layer_name_by_id = (
+            {layer.id: layer.name for layer in PM.layers.values()} if PM else {}
+        )
+
+        if LM is not None:
+            for kind, units in (
+                ("entity", LM.entities),
+                ("attribute", LM.attributes),
+                ("relation", LM.relations),
+            ):
+                for unit in units.values():
+                    layers = tuple(
+                        dict.fromkeys(
+                            layer_name_by_id.get(pm_obj.layer_id, pm_obj.layer_id)
+                            for pm_obj in unit.pm_map
+                        )
+                    )
+                    self._add(kind, unit, layers)
+
+        if PM is not None:
+            for kind, units in (("table", PM.tables), ("column", PM.columns)):
+                for unit in units.values():
+                    layer_name = layer_name_by_id.get(unit.layer_id, unit.layer_id)
+                    self._add(kind, unit, (layer_name,))
+
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def _add(self, kind: str, unit: Any, layers: Tuple[str, ...]) -> None:
+        code = len(self._units)
+        self._ids.append(unit.id)
+        self._kinds.append(kind)
+        self._layers.append(layers)
+        self._units.append(unit)
+
+        weight_by_token: Dict[str, float] = {}
+        for token in tokenize(unit.name) + tokenize(unit.nk):
+            weight_by_token[token] = NAME_WEIGHT
+        for token in tokenize(getattr(unit, "description", None)):
+            weight_by_token.setdefault(token, DESCRIPTION_WEIGHT)
+
+        for token, weight in weight_by_token.items():
+            self._postings.setdefault(token, {})[code] = weight
+
+    def _prefix_tokens(self, prefix: str) -> Iterable[str]:
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary) and self._vocabulary[
+            position
+        ].startswith(prefix):
+            yield self._vocabulary[position]
+            position += 1
+
+    def _fuzzy_tokens(self, query_token: str) -> Dict[str, float]:
+        if self._tokens_by_trigram is None:
+            self._tokens_by_trigram = {}
+            for token in self._vocabulary:
+                for trigram in _trigrams(token):
+                    self._tokens_by_trigram.setdefault(trigram, set()).add(token)
+
+        query_trigrams = _trigrams(query_token)
+        candidates: Set[str] = set()
+        for trigram in query_trigrams:
+            candidates.update(self._tokens_by_trigram.get(trigram, ()))
+
+        similarity_by_token = {}
+        for token in candidates:
+            token_trigrams = _trigrams(token)
+            similarity = len(query_trigrams & token_trigrams) / len(
+                query_trigrams | token_trigrams
+            )
+            if similarity >= FUZZY_MATCH_THRESHOLD:
+                similarity_by_token[token] = similarity
+        return similarity_by_token
+
+    def _matching_tokens(self, query_token: str) -> Dict[str, float]:
+        factor_by_token = {
+            token: 1.0 if token == query_token else PREFIX_MATCH_FACTOR
+            for token in self._prefix_tokens(query_token)
+        }
+        if factor_by_token:
+            return factor_by_token
+
+        return {
+            token: FUZZY_MATCH_FACTOR * similarity
+            for token, similarity in self._fuzzy_tokens(query_token).items()
+        }
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Iterable[str]] = None,
+        layers: Optional[Iterable[str]] = None,
+        limit: Optional[int] = 20,
+    ) -> List[SearchHit]:
+        """Find units matching every token of a query.
+
+        :param query: Free text, such as ``"customer_id"`` or ``"order date"``.
+        :type query: str
+        :param kinds: Unit kinds to return, out of :data:`SEARCH_KINDS`. All
+            kinds are returned by default.
+        :type kinds: Iterable[str] | None
+        :param layers: Physical layer names to return units from. Logical units
+            belong to the layers of their ``pm_map`` objects.
+        :type layers: Iterable[str] | None
+        :param limit: Maximum number of hits. ``None`` returns every hit.
+        :type limit: int | None
+        :returns: Hits ordered by descending score, then kind and name.
+        :rtype: list[SearchHit]
+        :raises ValueError: If an unknown kind is requested.
+        """
+        kinds = frozenset(kinds) if kinds is not None else None
+        if kinds is not None and not kinds <= set(SEARCH_KINDS):
+            raise ValueError(
+                f"Unknown search kinds {sorted(kinds - set(SEARCH_KINDS))}, "
+                f"expected any of {', '.join(SEARCH_KINDS)}"
+            )
+        layers = frozenset(layers) if layers is not None else None
+
+        # Start from the most selective query token, so later tokens only
+        # score the units that are still candidates.
+        factors_by_query_token = [
+            self._matching_tokens(query_token)
+            for query_token in dict.fromkeys(_words(query))
+        ]
+        if not factors_by_query_token:
+            return []
+        posting_sizes = [
+            sum(len(self._postings[token]) for token in factor_by_token)
+            for factor_by_token in factors_by_query_token
+        ]
+
+        score_by_code: Optional[Dict[int, float]] = None
+        for posting_size, factor_by_token in sorted(
+            zip(posting_sizes, factors_by_query_token), key=lambda pair: pair[0]
+        ):
+            postings = [
+                (self._postings[token], factor)
+                for token, factor in factor_by_token.items()
+            ]
+            token_score_by_code: Dict[int, float] = {}
+            if (
+                score_by_code is not None
+                and len(score_by_code) * len(postings) < posting_size
+            ):
+                # Few candidates left: look them up instead of scanning postings.
+                for code in score_by_code:
+                    for weight_by_code, factor in postings:
+                        weight = weight_by_code.get(code)
+                        if weight and weight * factor > token_score_by_code.get(
+                            code, 0.0
+                        ):
+                            token_score_by_code[code] = weight * factor
+            else:
+                for weight_by_code, factor in postings:
+                    for code, weight in weight_by_code.items():
+                        if weight * factor > token_score_by_code.get(code, 0.0):
+                            token_score_by_code[code] = weight * factor
+
+            if score_by_code is None:
+                score_by_code = token_score_by_code
+            else:
+                score_by_code = {
+                    code: score + token_score_by_code[code]
+                    for code, score in score_by_code.items()
+                    if code in token_score_by_code
+                }
+
+            if not score_by_code:
+                return []
+
+        codes = [
+            code
+            for code in score_by_code
+            if (kinds is None or self._kinds[code] in kinds)
+            and (layers is None or not layers.isdisjoint(self._layers[code]))
+        ]
+        kind_order = {kind: order for order, kind in enumerate(SEARCH_KINDS)}
+        codes.sort(
+            key=lambda code: (
+                -score_by_code[code],
+                kind_order[self._kinds[code]],
+                self._units[code].name,
+            )
+        )
+        if limit is not None:
+            codes = codes[:limit]
+
+        return [
+            SearchHit(
+                id=self._ids[code],
+                kind=self._kinds[code],
+                name=self._units[code].name,
+                layers=self._layers[code],
+                score=score_by_code[code],
+                unit=self._units[code],
+                description=getattr(self._units[code], "description", None),
+            )
+            for code in codes
+        ]
@@ -14,7 +14,8 @@ from typing import Any
 
 import yaml
 
-from dg_kit.commands import test
+from dg_kit.base.search import SEARCH_KINDS
+from dg_kit.commands import search, test
 from dg_kit.commands.data_catalog import pull, sync
 
 DEFAULT_CONFIG_FILE = "dg_kit.yml"
@@ -81,6 +82,56 @@ def build_parser() -> argparse.ArgumentParser:
         default=str(Path.cwd() / "dg_kit.convention.yml"),
         help="Path to convention YAML config. Defaults to ./dg_kit.convention.yml.",
     )
+    test.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of convention rules run in parallel. 0 uses one job per CPU.",
+    )
+    test.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile convention rules and log time, objects scanned and breaches.",
+    )
+    test.add_argument(
+        "--profile-output",
+        help="Write per-rule stats to this JSON file.",
+    )
+    test.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-check objects changed since the previous incremental run.",
+    )
+    test.add_argument(
+        "--cache-path",
+        help=(
+            "Breach cache used by --incremental. "
+            "Defaults to ./.artifacts/<name>.convention_cache.sqlite."
+        ),
+    )
+
+    # dg_kit search customer_id --kind column --layer core
+    search = command_parser.add_parser(
+        "search", help="Search model units by name and description."
+    )
+    search.add_argument("query", help="Text to look up, such as customer_id.")
+    search.add_argument(
+        "--kind",
+        action="append",
+        choices=SEARCH_KINDS,
+        help="Only report units of this kind. Can be repeated.",
+    )
+    search.add_argument(
+        "--layer",
+        action="append",
+        help="Only report units from this physical layer. Can be repeated.",
+    )
+    search.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum number of reported units. 0 reports every match.",
+    )
 
     # dg_kit data-catalog pull/sync
     data_catalog = command_parser.add_parser(
@@ -90,11 +141,26 @@ def build_parser() -> argparse.ArgumentParser:
         dest="data_catalog_command",
         required=True,
     )
-    data_catalog_subparsers.add_parser("pull", help="Pull data catalog to local.")
-    data_catalog_subparsers.add_parser(
+    data_catalog_pull = data_catalog_subparsers.add_parser(
+        "pull", help="Pull data catalog to local."
+    )
+    data_catalog_pull.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only pull data units edited since the last pull.",
+    )
+    data_catalog_sync = data_catalog_subparsers.add_parser(
         "sync",
         help="Sync Logical Model, Business Information and Physical model with Data Catalog.",
     )
+    data_catalog_sync.add_argument(
+        "--plan",
+        action="store_true",
+        help=(
+            "Only report planned operations and estimated API calls, "
+            "using the local checkpoint."
+        ),
+    )
 
     return parser
 
@@ -111,13 +177,30 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.command == "test":
         convention_config = _load_config(args.convention)
-        sys_exit_status = test.run(config, convention_config)
+        sys_exit_status = test.run(
+            config,
+            convention_config,
+            jobs=args.jobs,
+            profile=args.profile,
+            profile_output=args.profile_output,
+            incremental=args.incremental,
+            cache_path=args.cache_path,
+        )
+
+    elif args.command == "search":
+        sys_exit_status = search.run(
+            config,
+            args.query,
+            kinds=args.kind,
+            layers=args.layer,
+            limit=args.limit,
+        )
 
     elif args.command == "data-catalog":
         if args.data_catalog_command == "pull":
-            sys_exit_status = pull.run(config)
+            sys_exit_status = pull.run(config, incremental=args.incremental)
         elif args.data_catalog_command == "sync":
-            sys_exit_status = sync.run(config)
+            sys_exit_status = sync.run(config, plan=args.plan)
 
     return sys_exit_status
 
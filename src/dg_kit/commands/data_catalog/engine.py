@@ -0,0 +1,53 @@
+"""Data catalog engine selection for ``dg_kit data-catalog`` commands.
+
+The engine is chosen with ``data_catalog.engine`` in the project config.
+Engine modules are imported lazily so optional dependencies are only needed
+for the engine actually in use.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from os import environ
+
+from dg_kit.base.data_catalog import DataCatalogEngine
+
+
+def build_engine(
+    config: dict[str, Any],
+    offline: bool = False,
+) -> DataCatalogEngine:
+    """Create the data catalog engine configured for the project.
+
+    :param config: Project configuration containing catalog settings.
+    :type config: dict[str, Any]
+    :param offline: Create an engine that only plans syncs, without backend
+        credentials or a connection to the remote catalog.
+    :type offline: bool
+    :returns: Configured data catalog engine.
+    :rtype: DataCatalogEngine
+    :raises ValueError: If the configured engine is not supported.
+    """
+    engine_name = config["data_catalog"].get("engine", "notion")
+
+    if engine_name == "notion":
+        from dg_kit.integrations.notion.api import NotionDataCatalog
+
+        if not offline:
+            config["data_catalog"]["notion_token"] = environ["NOTION_TOKEN"]
+            config["data_catalog"]["dc_table_id"] = environ["DATA_CATALOG_ID"]
+
+        return NotionDataCatalog(
+            notion_config=config["data_catalog"],
+            offline=offline,
+        )
+
+    if engine_name == "sqlite":
+        from dg_kit.integrations.sqlite.api import SQLiteDataCatalog
+
+        return SQLiteDataCatalog(
+            sqlite_config=config["data_catalog"],
+        )
+
+    raise ValueError(f"Unsupported data catalog engine: {engine_name}")
@@ -8,25 +8,19 @@ from __future__ import annotations
 
 from typing import Any
 
-from os import environ
-
 from dg_kit.base.data_catalog import DataCatalog
-from dg_kit.integrations.notion.api import NotionDataCatalog
+from dg_kit.commands.data_catalog.engine import build_engine
 
 
 def run(
     config: dict[str, Any],
+    incremental: bool = False,
 ) -> None:
-    config["data_catalog"]["notion_token"] = environ["NOTION_TOKEN"]
-    config["data_catalog"]["dc_table_id"] = environ["DATA_CATALOG_ID"]
-
-    ndc_engine = NotionDataCatalog(
-        notion_config=config["data_catalog"],
-    )
+    engine = build_engine(config)
 
     DC = DataCatalog(
-        engine=ndc_engine,
+        engine=engine,
         config=config,
     )
 
-    DC.pull_data_catalog()
+    DC.pull_data_catalog(incremental=incremental)
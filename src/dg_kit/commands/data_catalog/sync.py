@@ -6,20 +6,36 @@ catalog backend.
 
 from __future__ import annotations
 
+import logging
+from collections import Counter
 from typing import Any
 
 from pathlib import Path
-from os import environ
-
 from dg_kit.base.data_catalog import DataCatalog
+from dg_kit.base.dataclasses.data_catalog import SyncPlan
+from dg_kit.base.enums import SyncAction
+from dg_kit.commands.data_catalog.engine import build_engine
 from dg_kit.integrations.dbt.parser import DBTParser
-from dg_kit.integrations.notion.api import NotionDataCatalog
 from dg_kit.integrations.odm.parser import ODMVersionedProjectParser
 
 
+logger = logging.getLogger(__name__)
+
+
 def run(
     config: dict[str, Any],
-) -> None:
+    plan: bool = False,
+) -> int:
+    """Synchronize the data catalog with the logical model.
+
+    :param config: Project configuration with model locations and catalog settings.
+    :type config: dict[str, Any]
+    :param plan: Only report the operations a sync would perform, using the
+        local checkpoint and without contacting the catalog backend.
+    :type plan: bool
+    :returns: Process-style exit status where ``0`` means success.
+    :rtype: int
+    """
     odm_project_path = Path(config.get("logical_model", {}).get("path"))
     dbt_project_path = Path(config.get("physical_model", {}).get("path"))
 
@@ -30,18 +46,46 @@ def run(
     odm_project.parse_version(config["version"], PM)
     LM = odm_project.get_model(config["version"])
 
-    config["data_catalog"]["notion_token"] = environ["NOTION_TOKEN"]
-    config["data_catalog"]["dc_table_id"] = environ["DATA_CATALOG_ID"]
-
-    ndc_engine = NotionDataCatalog(
-        notion_config=config["data_catalog"],
-    )
+    engine = build_engine(config, offline=plan)
 
     DC = DataCatalog(
-        engine=ndc_engine,
+        engine=engine,
         config=config,
+        offline=plan,
     )
 
+    if plan:
+        _log_plan(DC.plan_sync(LM))
+        return 0
+
     DC.sync_with_model(LM)
 
     DC.save_to_local()
+
+    return 0
+
+
+def _log_plan(sync_plan: SyncPlan) -> None:
+    for operation in sync_plan.operations:
+        logger.debug(
+            f"{operation.action} {operation.data_unit_type} "
+            f"'{operation.data_unit_name}' ({operation.data_unit_id}): "
+            f"~{operation.api_calls} API calls"
+        )
+
+    operations_by_action = Counter(
+        operation.action for operation in sync_plan.operations
+    )
+    api_calls_by_action = Counter()
+    for operation in sync_plan.operations:
+        api_calls_by_action[operation.action] += operation.api_calls
+
+    for action in SyncAction:
+        logger.info(
+            f"{action}: {operations_by_action[action]} operations, "
+            f"~{api_calls_by_action[action]} API calls"
+        )
+    logger.info(
+        f"Planned {len(sync_plan.operations)} operations, "
+        f"~{sync_plan.api_calls} API calls in total."
+    )
@@ -0,0 +1,68 @@
+"""Implementation of the ``dg_kit search`` command.
+
+This module loads logical and physical models, indexes their units and
+reports the units matching a query.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, List, Optional
+
+from dg_kit.base.search import SearchIndex
+from dg_kit.integrations.dbt.parser import DBTParser
+from dg_kit.integrations.odm.parser import ODMVersionedProjectParser
+
+
+logger = logging.getLogger(__name__)
+
+
+def run(
+    config: dict[str, Any],
+    query: str,
+    kinds: Optional[List[str]] = None,
+    layers: Optional[List[str]] = None,
+    limit: int = 20,
+) -> int:
+    """Search logical and physical model units by name and description.
+
+    :param config: Project configuration with model locations and version info.
+    :type config: dict[str, Any]
+    :param query: Free text to look up, such as ``"customer_id"``.
+    :type query: str
+    :param kinds: Unit kinds to report. All kinds are reported by default.
+    :type kinds: list[str] | None
+    :param layers: Physical layer names to report units from.
+    :type layers: list[str] | None
+    :param limit: Maximum number of reported units. ``0`` reports every match.
+    :type limit: int
+    :returns: Process-style exit status, ``1`` when nothing matches.
+    :rtype: int
+    """
+    odm_project_path = Path(config.get("logical_model", {}).get("path"))
+    dbt_project_path = Path(config.get("physical_model", {}).get("path"))
+
+    dbt_parser = DBTParser(dbt_project_path, config["version"])
+    PM = dbt_parser.parse_pm()
+
+    odm_project = ODMVersionedProjectParser(odm_project_path=odm_project_path)
+    odm_project.parse_version(config["version"], PM)
+    LM = odm_project.get_model(config["version"])
+
+    hits = SearchIndex(LM, PM).search(
+        query, kinds=kinds, layers=layers, limit=limit or None
+    )
+
+    for hit in hits:
+        layers_str = f" [{', '.join(hit.layers)}]" if hit.layers else ""
+        logger.info(
+            f"{hit.kind} '{hit.name}'{layers_str} ({hit.id}) score={hit.score:.2f}"
+        )
+
+    if not hits:
+        logger.info(f"No units match '{query}'.")
+        return 1
+
+    logger.info(f"{len(hits)} units match '{query}'.")
+    return 0
@@ -6,13 +6,16 @@ convention rules, and reports validation breaches.
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, List
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, List, Optional
 
 
 from pathlib import Path
 from dg_kit.base.enums import ConventionRuleSeverity
-from dg_kit.base.dataclasses.convention import ConventionBreach
+from dg_kit.base.dataclasses.convention import ConventionBreach, ConventionRuleStats
 from dg_kit.base.convention import Convention, ConventionValidator
 from dg_kit.integrations.dbt.parser import DBTParser
 from dg_kit.integrations.odm.parser import ODMVersionedProjectParser
@@ -20,10 +23,17 @@ from dg_kit.integrations.odm.parser import ODMVersionedProjectParser
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = ".artifacts"
+
 
 def run(
     config: dict[str, Any],
     convention_config: dict[str, Any],
+    jobs: int = 1,
+    profile: bool = False,
+    profile_output: Optional[str] = None,
+    incremental: bool = False,
+    cache_path: Optional[str] = None,
 ) -> int:
     """Validate logical and physical model consistency against a convention.
 
@@ -31,6 +41,20 @@ def run(
     :type config: dict[str, Any]
     :param convention_config: Convention settings and rule definitions.
     :type convention_config: dict[str, Any]
+    :param jobs: Number of convention rules run concurrently. ``0`` uses one
+        job per CPU.
+    :type jobs: int
+    :param profile: Profile every rule with :mod:`cProfile` and log a per-rule
+        summary of wall time, objects scanned and breaches.
+    :type profile: bool
+    :param profile_output: Path of a JSON report with the per-rule stats.
+    :type profile_output: str | None
+    :param incremental: Only re-check objects changed since the previous
+        incremental run, reusing cached breaches for the rest.
+    :type incremental: bool
+    :param cache_path: Breach cache used with ``incremental``. Defaults to
+        ``./.artifacts/<name>.convention_cache.sqlite``.
+    :type cache_path: str | None
     :returns: Process-style exit status where ``0`` means success.
     :rtype: int
     """
@@ -51,8 +75,25 @@ def run(
 
     convention = Convention(config["name"], convention_config)
 
-    convention_validator = ConventionValidator(LM, PM, convention)
+    if incremental and cache_path is None:
+        cache_path = str(
+            Path(DEFAULT_CACHE_DIR) / f"{config['name']}.convention_cache.sqlite"
+        )
+
+    convention_validator = ConventionValidator(
+        LM,
+        PM,
+        convention,
+        jobs=jobs,
+        profile=profile,
+        cache_path=cache_path if incremental else None,
+    )
     issues += convention_validator.validate()
+
+    if profile:
+        _log_rule_stats(convention_validator.rule_stats)
+    if profile_output:
+        _write_rule_stats(config, convention_validator.rule_stats, profile_output)
     issues += odm_project.parsing_issues[config["version"]]
 
     sys_exit_status = 0
@@ -66,3 +107,36 @@ def run(
         logger.info("Validation successful")
 
     return sys_exit_status
+
+
+def _log_rule_stats(rule_stats: List[ConventionRuleStats]) -> None:
+    name_width = max([len("rule"), *(len(stats.rule_name) for stats in rule_stats)])
+
+    logger.info(f"{'rule':<{name_width}} {'time s':>9} {'scanned':>9} {'breaches':>9}")
+    for stats in sorted(rule_stats, key=lambda stats: -stats.wall_time):
+        scanned = "-" if stats.objects_scanned is None else stats.objects_scanned
+        logger.info(
+            f"{stats.rule_name:<{name_width}} {stats.wall_time:>9.3f} "
+            f"{scanned:>9} {stats.breach_count:>9}"
+        )
+        if stats.profile:
+            logger.debug(f"Profile of {stats.rule_name}:\n{stats.profile}")
+
+
+def _write_rule_stats(
+    config: dict[str, Any],
+    rule_stats: List[ConventionRuleStats],
+    path: str,
+) -> None:
+    report = {
+        "name": config["name"],
+        "version": config["version"],
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "total_wall_time": sum(stats.wall_time for stats in rule_stats),
+        "rules": [asdict(stats) for stats in rule_stats],
+    }
+
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    logger.info(f"Rule stats written to {output_path}")
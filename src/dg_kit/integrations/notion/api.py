@@ -5,11 +5,13 @@ interface used by synchronization commands.
 """
 
 from __future__ import annotations
-from typing import Dict, List
+import logging
+from math import ceil
+from typing import Dict, Iterable, List, Optional
 
 from notion_client import Client
 
-from dg_kit.base.data_catalog import DataCatalogEngine
+from dg_kit.base.data_catalog import DataCatalogEngine, page_content_hash
 from dg_kit.base.dataclasses.data_catalog import (
     DataCatalogRow,
     EntityPage,
@@ -21,37 +23,93 @@ from dg_kit.base.dataclasses.data_catalog import (
 from dg_kit.base.enums import (
     DataUnitType,
     DataCatalogRowProperties,
+    SyncAction,
 )
 
+from dg_kit.integrations.notion.differ import diff_blocks
 from dg_kit.integrations.notion.formater import RowFormater
 from dg_kit.integrations.notion.parser import PageParser
 
 
+_LOOKUP_BATCH_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+
 class NotionDataCatalog(DataCatalogEngine):
     def __init__(
         self,
         notion_config: dict,
+        offline: bool = False,
     ):
         self.notion_config = notion_config
-        self.notion = Client(auth=notion_config["notion_token"])
-        self.dc_table_id = notion_config["dc_table_id"]
+        # Offline engines only estimate API calls and need no credentials.
+        self.notion: Optional[Client] = None
+        self.dc_table_id: Optional[str] = None
+        if not offline:
+            self.notion = Client(auth=notion_config["notion_token"])
+            self.dc_table_id = notion_config["dc_table_id"]
         self.notion_page_by_id: Dict[str, str] = {}
         self.row_formater = RowFormater(notion_config)
         self.page_parser = PageParser(notion_config)
+        self.content_hash_property: Optional[str] = notion_config[
+            "row_property_mapping"
+        ].get("content_hash")
+
+    def _overwrite_page_body(
+        self,
+        page_id: str,
+        new_blocks: list[dict],
+        existing_blocks: Optional[list[dict]] = None,
+    ) -> None:
+        if existing_blocks is None:
+            existing_blocks = self._list_page_blocks(page_id)
 
-    def _overwrite_page_body(self, page_id: str, new_blocks: list[dict]) -> None:
         # 1) delete all existing top-level blocks
-        for block in self._list_page_blocks(page_id):
+        for block in existing_blocks:
             bid = block.get("id")
             if not bid:
                 continue
             self.notion.blocks.delete(block_id=bid)
 
-        # 2) append new blocks (<=100 per request) :contentReference[oaicite:3]{index=3}
-        for i in range(0, len(new_blocks), 100):
-            self.notion.blocks.children.append(
-                block_id=page_id, children=new_blocks[i : i + 100]
-            )
+        # 2) append new blocks
+        self._append_blocks(page_id, new_blocks)
+
+    def _patch_page_body(self, page_id: str, new_blocks: list[dict]) -> None:
+        existing_blocks = self._list_page_blocks(page_id)
+        operations = diff_blocks(existing_blocks, new_blocks)
+
+        if operations is None:
+            self._overwrite_page_body(page_id, new_blocks, existing_blocks)
+            return
+
+        for operation in operations:
+            if operation.kind == "update":
+                block = operation.blocks[0]
+                self.notion.blocks.update(
+                    block_id=operation.block_id,
+                    **{block["type"]: block[block["type"]]},
+                )
+            elif operation.kind == "delete":
+                self.notion.blocks.delete(block_id=operation.block_id)
+            elif operation.kind == "append":
+                self._append_blocks(
+                    page_id, list(operation.blocks), after=operation.after
+                )
+
+    def _append_blocks(
+        self, page_id: str, blocks: list[dict], after: Optional[str] = None
+    ) -> None:
+        # Notion accepts at most 100 children per append request
+        for i in range(0, len(blocks), 100):
+            payload: dict = {"block_id": page_id, "children": blocks[i : i + 100]}
+            if after:
+                payload["after"] = after
+
+            resp = self.notion.blocks.children.append(**payload)
+
+            if after and resp.get("results"):
+                after = resp["results"][-1]["id"]
 
     def _list_page_blocks(self, page_id: str, page_size=100) -> list[dict]:
         blocks: List[Dict] = []
@@ -70,6 +128,18 @@ class NotionDataCatalog(DataCatalogEngine):
 
         return blocks
 
+    def _get_content_hash(self, props: dict) -> Optional[str]:
+        # The hash stored by the last ``update_page``. Manual edits of the page
+        # body in Notion do not change it.
+        if not self.content_hash_property:
+            return None
+
+        prop = props.get(self.content_hash_property)
+        if not prop or not prop.get("rich_text"):
+            return None
+
+        return self.page_parser.get_property_value(props, self.content_hash_property)
+
     def _get_references(
         self, index: Dict, notion_page_ids: list[str]
     ) -> ObjectReference:
@@ -78,17 +148,29 @@ class NotionDataCatalog(DataCatalogEngine):
             for notion_page_id in notion_page_ids
         )
 
-    def pull_data_catalog(self, page_size=100) -> list[DataCatalogRow]:
+    def pull_data_catalog(
+        self, page_size=100, edited_since: Optional[str] = None
+    ) -> IndexedCatalog:
         rows_by_id: Dict[str, DataCatalogRow] = {}
         page_by_id: Dict[str, EntityPage | AttributePage | RelationPage] = {}
+        reference_by_id: Dict[str, ObjectReference] = {}
         id_by_notion_page: Dict[str, str] = {}
         raw_page_by_id: Dict[str, dict] = {}
+        content_hash_by_id: Dict[str, str] = {}
+        last_edited_time: Optional[str] = edited_since
         start_cursor: str = None
 
         while True:
             payload: dict = {"data_source_id": self.dc_table_id, "page_size": page_size}
             if start_cursor:
                 payload["start_cursor"] = start_cursor
+            if edited_since:
+                # Notion timestamps have minute precision, so "on_or_after" may
+                # re-fetch a few pages already merged by the previous pull.
+                payload["filter"] = {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": edited_since},
+                }
 
             resp = self.notion.data_sources.query(**payload)
 
@@ -121,6 +203,10 @@ class NotionDataCatalog(DataCatalogEngine):
 
                 rows_by_id[id] = row
 
+                content_hash = self._get_content_hash(props)
+                if content_hash:
+                    content_hash_by_id[id] = content_hash
+
                 page_blocks = self._list_page_blocks(notion_page_id)
 
                 # if unit_type == DataUnitType.ENTITY:
@@ -134,7 +220,14 @@ class NotionDataCatalog(DataCatalogEngine):
                 raw_page["data_unit_type"] = unit_type
                 raw_page_by_id[id] = raw_page
                 id_by_notion_page[notion_page_id] = id
-                self.notion_page_by_id[id] = ObjectReference(id, notion_page_id)
+                reference_by_id[id] = ObjectReference(id, notion_page_id)
+                self.notion_page_by_id[id] = reference_by_id[id]
+
+                page_edited_time = page.get("last_edited_time")
+                if page_edited_time and (
+                    last_edited_time is None or page_edited_time > last_edited_time
+                ):
+                    last_edited_time = page_edited_time
 
             if not resp.get("has_more"):
                 break
@@ -161,29 +254,82 @@ class NotionDataCatalog(DataCatalogEngine):
 
             page_by_id[id] = page_obj
 
+            if id not in content_hash_by_id:
+                content_hash_by_id[id] = page_content_hash(page_obj)
+
         ic = IndexedCatalog(
             row_by_id=rows_by_id,
-            reference_by_id=self.notion_page_by_id,
+            reference_by_id=reference_by_id,
             page_by_id=page_by_id,
+            last_edited_time=last_edited_time,
+            content_hash_by_id=content_hash_by_id,
         )
 
         return ic
 
-    def update_page(self, page_obj: EntityPage | AttributePage | RelationPage) -> None:
+    def _build_page_blocks(
+        self, page_obj: EntityPage | AttributePage | RelationPage
+    ) -> list[dict]:
         if isinstance(page_obj, EntityPage):
-            blocks = self.row_formater.build_entity_page_blocks(page_obj)
+            return self.row_formater.build_entity_page_blocks(page_obj)
         elif isinstance(page_obj, AttributePage):
-            blocks = self.row_formater.build_attribute_page_blocks(page_obj)
+            return self.row_formater.build_attribute_page_blocks(page_obj)
         elif isinstance(page_obj, RelationPage):
-            blocks = self.row_formater.build_relation_page_blocks(page_obj)
+            return self.row_formater.build_relation_page_blocks(page_obj)
         else:
             raise ValueError(f"Unsupported data unit type: {page_obj.data_unit_type}")
 
-        self._overwrite_page_body(page_obj.reference.reference_link, blocks)
+    def update_page(self, page_obj: EntityPage | AttributePage | RelationPage) -> None:
+        blocks = self._build_page_blocks(page_obj)
+
+        self._patch_page_body(page_obj.reference.reference_link, blocks)
+
+        if self.content_hash_property:
+            self.notion.pages.update(
+                page_id=page_obj.reference.reference_link,
+                properties=self.row_formater.properties_from_content_hash(
+                    page_content_hash(page_obj)
+                ),
+            )
 
     def add_page(self, data_unit_page):
         self.update_page(data_unit_page)
 
+    def estimate_api_calls(
+        self,
+        action: SyncAction,
+        current_page: Optional[EntityPage | AttributePage | RelationPage] = None,
+        new_page: Optional[EntityPage | AttributePage | RelationPage] = None,
+    ) -> int:
+        if action not in (SyncAction.ADD_PAGE, SyncAction.UPDATE_PAGE):
+            return 1
+
+        # The remote body is assumed to match the cached page, so the diff is
+        # run against blocks rebuilt from it, with stand-in block ids.
+        existing_blocks = []
+        if current_page is not None:
+            existing_blocks = [
+                dict(block, id=str(i))
+                for i, block in enumerate(self._build_page_blocks(current_page))
+            ]
+        new_blocks = self._build_page_blocks(new_page)
+
+        calls = max(1, ceil(len(existing_blocks) / 100))  # list existing blocks
+        operations = diff_blocks(existing_blocks, new_blocks)
+        if operations is None:
+            calls += len(existing_blocks) + ceil(len(new_blocks) / 100)
+        else:
+            for operation in operations:
+                if operation.kind == "append":
+                    calls += ceil(len(operation.blocks) / 100)
+                else:
+                    calls += 1
+
+        if self.content_hash_property:
+            calls += 1
+
+        return calls
+
     def update_row(self, data_catalog_row: DataCatalogRow) -> None:
         props = self.row_formater.properties_from_row(data_catalog_row)
 
@@ -237,6 +383,79 @@ class NotionDataCatalog(DataCatalogEngine):
             raise KeyError(f"Notion page not found for id={row_id}")
         return results[0]["id"]
 
-    def delete_by_id(self, id: str) -> None:
-        page_id = self._find_page_id_by_row_id(id)
+    def _find_page_ids_by_row_ids(self, row_ids: List[str]) -> Dict[str, str]:
+        page_id_by_row_id: Dict[str, str] = {}
+
+        for i in range(0, len(row_ids), _LOOKUP_BATCH_SIZE):
+            start_cursor: str = None
+            while True:
+                payload: dict = {
+                    "data_source_id": self.dc_table_id,
+                    "filter": {
+                        "or": [
+                            {
+                                "property": DataCatalogRowProperties.ID,
+                                "rich_text": {"equals": row_id},
+                            }
+                            for row_id in row_ids[i : i + _LOOKUP_BATCH_SIZE]
+                        ]
+                    },
+                    "page_size": 100,
+                }
+                if start_cursor:
+                    payload["start_cursor"] = start_cursor
+
+                resp = self.notion.data_sources.query(**payload)
+                for page in resp.get("results", []):
+                    row_id = self.page_parser.get_property_value(
+                        page["properties"], DataCatalogRowProperties.ID
+                    )
+                    page_id_by_row_id[row_id] = page["id"]
+
+                if not resp.get("has_more"):
+                    break
+                start_cursor = resp.get("next_cursor")
+                if not start_cursor:
+                    break
+
+        return page_id_by_row_id
+
+    def delete_by_id(
+        self, id: str, reference: Optional[ObjectReference] = None
+    ) -> None:
+        reference = reference or self.notion_page_by_id.get(id)
+        if reference:
+            page_id = reference.reference_link
+        else:
+            page_id = self._find_page_id_by_row_id(id)
+
         self.notion.pages.update(page_id=page_id, archived=True)
+        self.notion_page_by_id.pop(id, None)
+
+    def delete_many(
+        self,
+        ids: Iterable[str],
+        reference_by_id: Optional[Dict[str, ObjectReference]] = None,
+    ) -> None:
+        reference_by_id = reference_by_id or {}
+        page_id_by_row_id: Dict[str, str] = {}
+        missing_ids: List[str] = []
+
+        for id in ids:
+            reference = reference_by_id.get(id) or self.notion_page_by_id.get(id)
+            if reference:
+                page_id_by_row_id[id] = reference.reference_link
+            else:
+                missing_ids.append(id)
+
+        if missing_ids:
+            logger.info(f"Looking up {len(missing_ids)} uncached Notion pages.")
+            page_id_by_row_id.update(self._find_page_ids_by_row_ids(missing_ids))
+
+        for id in missing_ids:
+            if id not in page_id_by_row_id:
+                logger.warning(f"Notion page not found for id={id}. Skipping.")
+
+        for id, page_id in page_id_by_row_id.items():
+            self.notion.pages.update(page_id=page_id, archived=True)
+            self.notion_page_by_id.pop(id, None)
@@ -0,0 +1,120 @@
+"""Block-level diffing of Notion page bodies.
+
+Compares the blocks currently stored on a page with the blocks produced by
+:class:`dg_kit.integrations.notion.formater.RowFormater` and returns the
+minimal list of update/delete/append operations to turn one into the other.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import List, Literal, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class BlockOperation:
+    kind: Literal["update", "delete", "append"]
+    block_id: Optional[str] = None
+    after: Optional[str] = None
+    blocks: Tuple[dict, ...] = ()
+
+
+def block_signature(block: dict) -> tuple:
+    """Return a comparable signature of a block's type and visible content.
+
+    Works for blocks returned by the Notion API as well as for blocks built by
+    ``RowFormater``. Text annotations and empty text runs are ignored, so an
+    empty paragraph built locally matches the empty paragraph Notion returns.
+
+    :param block: Notion block payload.
+    :type block: dict
+    :returns: Hashable ``(type, rich_text_parts)`` signature.
+    :rtype: tuple
+    """
+    block_type = block.get("type")
+    rich_text = (block.get(block_type) or {}).get("rich_text", [])
+
+    parts = []
+    for rt in rich_text:
+        if rt.get("type") == "mention":
+            mention = rt["mention"]
+            if "page" in mention:
+                parts.append(("page", mention["page"]["id"].replace("-", "")))
+            elif "user" in mention:
+                parts.append(("user", mention["user"]["id"].replace("-", "")))
+            else:
+                parts.append(("mention", rt.get("plain_text", "")))
+        else:
+            text = rt.get("text") or {}
+            content = text.get("content", rt.get("plain_text", ""))
+            if not content:
+                continue
+            link = (text.get("link") or {}).get("url")
+            parts.append(("text", content, link))
+
+    return (block_type, tuple(parts))
+
+
+def diff_blocks(
+    existing_blocks: List[dict], new_blocks: List[dict]
+) -> Optional[List[BlockOperation]]:
+    """Compute the operations that turn ``existing_blocks`` into ``new_blocks``.
+
+    Unchanged blocks are kept, changed blocks of the same type are updated in
+    place, and the rest is deleted or appended after the closest kept block.
+
+    :param existing_blocks: Top-level blocks currently on the page, with ids.
+    :type existing_blocks: list[dict]
+    :param new_blocks: Desired top-level blocks.
+    :type new_blocks: list[dict]
+    :returns: Ordered operations, or ``None`` when blocks would have to be
+        inserted before the first kept block, which the API cannot express.
+    :rtype: list[BlockOperation] | None
+    """
+    matcher = SequenceMatcher(
+        a=[block_signature(block) for block in existing_blocks],
+        b=[block_signature(block) for block in new_blocks],
+        autojunk=False,
+    )
+
+    operations: List[BlockOperation] = []
+    anchor: Optional[str] = None
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            anchor = existing_blocks[i2 - 1]["id"]
+            continue
+
+        old_chunk = existing_blocks[i1:i2]
+        new_chunk = new_blocks[j1:j2]
+
+        paired = 0
+        while (
+            paired < len(old_chunk)
+            and paired < len(new_chunk)
+            and old_chunk[paired].get("type") == new_chunk[paired].get("type")
+        ):
+            operations.append(
+                BlockOperation(
+                    kind="update",
+                    block_id=old_chunk[paired]["id"],
+                    blocks=(new_chunk[paired],),
+                )
+            )
+            anchor = old_chunk[paired]["id"]
+            paired += 1
+
+        for block in old_chunk[paired:]:
+            operations.append(BlockOperation(kind="delete", block_id=block["id"]))
+
+        if paired < len(new_chunk):
+            if anchor is None and i2 < len(existing_blocks):
+                return None
+            operations.append(
+                BlockOperation(
+                    kind="append", after=anchor, blocks=tuple(new_chunk[paired:])
+                )
+            )
+
+    return operations
@@ -36,6 +36,13 @@ class RowFormater:
 
         return props
 
+    def properties_from_content_hash(self, content_hash: str) -> dict:
+        return {
+            self.config["row_property_mapping"]["content_hash"]: {
+                "rich_text": [{"type": "text", "text": {"content": content_hash}}]
+            },
+        }
+
     def _rt_text(self, text: str, url: Optional[str] = None) -> dict:
         rt = {"type": "text", "text": {"content": text}}
         if url:
@@ -152,7 +159,13 @@ class RowFormater:
         if entity_page.pm_mapping_references:
             for pm_obj_reference in entity_page.pm_mapping_references:
                 blocks.append(
-                    self._bullet([self._rt_text(pm_obj_reference.name)])
+                    self._bullet(
+                        [
+                            self._rt_text(
+                                getattr(pm_obj_reference, "name", pm_obj_reference)
+                            )
+                        ]
+                    )
                 )  # or _rt_user_mention(not_user_id)
         else:
             blocks.append(self._para(""))
@@ -230,7 +243,15 @@ class RowFormater:
         )
         if attribute_page.pm_mapping_references:
             for pm_obj_reference in attribute_page.pm_mapping_references:
-                blocks.append(self._bullet([self._rt_text(pm_obj_reference.name)]))
+                blocks.append(
+                    self._bullet(
+                        [
+                            self._rt_text(
+                                getattr(pm_obj_reference, "name", pm_obj_reference)
+                            )
+                        ]
+                    )
+                )
         else:
             blocks.append(self._para(""))
 
@@ -309,7 +330,13 @@ class RowFormater:
         if relation_page.pm_mapping_references:
             for pm_obj_reference in relation_page.pm_mapping_references:
                 blocks.append(
-                    self._bullet([self._rt_text(pm_obj_reference.name)])
+                    self._bullet(
+                        [
+                            self._rt_text(
+                                getattr(pm_obj_reference, "name", pm_obj_reference)
+                            )
+                        ]
+                    )
                 )  # or _rt_user_mention(not_user_id)
         else:
             blocks.append(self._para(""))
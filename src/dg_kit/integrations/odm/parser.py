@@ -10,6 +10,7 @@ import xml.etree.ElementTree as ET
 
 from typing import Optional, Dict, Tuple, List
 
+from dg_kit.base.interning import Interner, UnitStore
 from dg_kit.base.logical_model import LogicalModelsDatabase
 from dg_kit.base.business_information import BusinessInformationDatabase
 
@@ -61,7 +62,13 @@ class ODMBusinessInformation(BusinessInformation):
 
 
 class ODMParser:
-    def __init__(self, odm_project_path: Path, PM: PhysicalModel):
+    def __init__(
+        self,
+        odm_project_path: Path,
+        PM: PhysicalModel,
+        interner: Optional[Interner] = None,
+        units: Optional[UnitStore] = None,
+    ):
         if not isinstance(odm_project_path, Path):
             odm_project_path = Path(odm_project_path)
         if not odm_project_path.is_file() and not odm_project_path.name.endswith(
@@ -95,6 +102,8 @@ class ODMParser:
         self.parties_path = self.business_information_path / "party"
 
         self.issues = []
+        self.interner = interner if interner is not None else Interner()
+        self.units = units if units is not None else UnitStore()
 
         self.LM = ODMLogicalModel(self.model_name)
         self.BI = ODMBusinessInformation(self.model_name)
@@ -116,7 +125,7 @@ class ODMParser:
                 for p in elem.findall("./responsibleParties/party")
             ]
         )
-        return parties or tuple()
+        return self.interner.intern(parties)
 
     def _parse_documents(self, elem: ET.Element) -> Optional[Tuple[Document, ...]]:
         docs_elem = elem.find("./documents")
@@ -132,7 +141,7 @@ class ODMParser:
             ]
         )
 
-        return documents
+        return self.interner.intern(documents)
 
     def _parse_dt_utc(self, s: Optional[str]) -> Optional[datetime]:
         if not s:
@@ -198,7 +207,12 @@ class ODMParser:
                         )
                     )
 
-        return tuple(pm_objects_list)
+        return self.interner.intern(tuple(pm_objects_list))
+
+    def _parse_source_systems(self, source_systems_str: Optional[str]):
+        if not source_systems_str:
+            return tuple()
+        return self.interner.strings(source_systems_str.split(","))
 
     def parse_bi(self) -> BusinessInformation:
         # Documents
@@ -302,6 +316,7 @@ class ODMParser:
         return self.BI
 
     def parse_lm(self) -> LogicalModel:
+        intern = self.interner.intern
         dependencies_by_entity_id = {}
         identifier_xml_by_entity_id = {}
         for seg in self.entites_path.iterdir():
@@ -310,36 +325,32 @@ class ODMParser:
 
                 entity_dynamic_props = self._parse_dynamic_properties(xml_root)
 
-                entity_responsible_parties = tuple(
-                    self._parse_responsible_parties(xml_root)
-                )
+                entity_responsible_parties = self._parse_responsible_parties(xml_root)
 
-                entity_domain = entity_dynamic_props.get("domain")
+                entity_domain = intern(entity_dynamic_props.get("domain"))
 
                 entity_pm_map_str = entity_dynamic_props.get("pm_map")
                 entity_pm_map_tuple = self._parse_pm_map_str(entity_pm_map_str)
 
-                entity_source_systems_str = entity_dynamic_props.get("source_systems")
-                entity_source_systems_tuple = (
-                    entity_source_systems_str.split(",")
-                    if entity_source_systems_str
-                    else tuple()
+                entity_source_systems_tuple = self._parse_source_systems(
+                    entity_dynamic_props.get("source_systems")
                 )
 
-                entity = Entity(
-                    id=id_generator(xml_root.attrib["name"]),
-                    nk=xml_root.attrib["name"],
-                    name=xml_root.attrib["name"],
-                    description=xml_root.findtext("comment")
-                    if xml_root.findtext("comment")
-                    else "",
-                    responsible_parties=entity_responsible_parties,
-                    documents=self._parse_documents(xml_root),
-                    pm_map=entity_pm_map_tuple,
-                    domain=entity_domain,
-                    source_systems=entity_source_systems_tuple,
-                    created_by=None,
-                    created_time=None,
+                entity_name = intern(xml_root.attrib["name"])
+                entity = self.units.store(
+                    Entity(
+                        id=intern(id_generator(entity_name)),
+                        nk=entity_name,
+                        name=entity_name,
+                        description=intern(xml_root.findtext("comment") or ""),
+                        responsible_parties=entity_responsible_parties,
+                        documents=self._parse_documents(xml_root),
+                        pm_map=entity_pm_map_tuple,
+                        domain=entity_domain,
+                        source_systems=entity_source_systems_tuple,
+                        created_by=None,
+                        created_time=None,
+                    )
                 )
 
                 self.LM.register_entity(entity)
@@ -349,7 +360,7 @@ class ODMParser:
                 for attr_xml in entity_attributes_xml:
                     attribute_dynamic_props = self._parse_dynamic_properties(attr_xml)
                     attribute_responsible_parties = (
-                        tuple(self._parse_responsible_parties(attr_xml))
+                        self._parse_responsible_parties(attr_xml)
                         or entity_responsible_parties
                     )
 
@@ -373,37 +384,37 @@ class ODMParser:
                     attr_pm_map_str = attribute_dynamic_props.get("pm_map")
                     attr_pm_map_tuple = self._parse_pm_map_str(attr_pm_map_str)
 
-                    attr_source_systems_str = attribute_dynamic_props.get(
-                        "source_systems"
-                    )
-                    attr_source_systems_tuple = (
-                        tuple(attr_source_systems_str.split(","))
-                        if attr_source_systems_str
-                        else tuple()
+                    attr_source_systems_tuple = self._parse_source_systems(
+                        attribute_dynamic_props.get("source_systems")
                     )
 
-                    attribute = Attribute(
-                        id=id_generator(attr_xml.attrib["name"]),
-                        nk=attr_xml.attrib["name"],
-                        entity_id=entity.id,
-                        name=attr_xml.attrib.get("name", ""),
-                        data_type=ODMAttributeTypesMapping.get(
-                            attr_xml.findtext("./logicalDatatype"),
-                            "type missing in mapping",
-                        ),
-                        sensitivity_type=(
-                            attr_xml.findtext("./sensitiveType") or "Not sensitive"
-                        ),
-                        description=(attr_xml.findtext("./comment") or ""),
-                        documents=self._parse_documents(attr_xml),
-                        pm_map=attr_pm_map_tuple,
-                        domain=attribute_dynamic_props.get("domain", entity_domain),
-                        source_systems=attr_source_systems_tuple,
-                        responsible_parties=attribute_responsible_parties,
-                        created_by=attr_xml.findtext("./createdBy") or None,
-                        created_time=self._parse_dt_utc(
-                            attr_xml.findtext("./createdTime") or ""
-                        ),
+                    attr_name = intern(attr_xml.attrib["name"])
+                    attribute = self.units.store(
+                        Attribute(
+                            id=intern(id_generator(attr_name)),
+                            nk=attr_name,
+                            entity_id=entity.id,
+                            name=attr_name,
+                            data_type=ODMAttributeTypesMapping.get(
+                                attr_xml.findtext("./logicalDatatype"),
+                                "type missing in mapping",
+                            ),
+                            sensitivity_type=intern(
+                                attr_xml.findtext("./sensitiveType") or "Not sensitive"
+                            ),
+                            description=intern(attr_xml.findtext("./comment") or ""),
+                            documents=self._parse_documents(attr_xml),
+                            pm_map=attr_pm_map_tuple,
+                            domain=intern(
+                                attribute_dynamic_props.get("domain", entity_domain)
+                            ),
+                            source_systems=attr_source_systems_tuple,
+                            responsible_parties=attribute_responsible_parties,
+                            created_by=intern(attr_xml.findtext("./createdBy") or None),
+                            created_time=self._parse_dt_utc(
+                                attr_xml.findtext("./createdTime") or ""
+                            ),
+                        )
                     )
 
                     self.LM.register_attribute(attribute)
@@ -421,46 +432,40 @@ class ODMParser:
 
                 relation_dynamic_props = self._parse_dynamic_properties(xml_root)
 
-                relation_responsible_parties = tuple(
-                    self._parse_responsible_parties(xml_root)
-                )
+                relation_responsible_parties = self._parse_responsible_parties(xml_root)
 
                 relation_pm_map_str = relation_dynamic_props.get("pm_map")
                 relation_pm_map_tuple = self._parse_pm_map_str(relation_pm_map_str)
 
-                relation_dynamic_props_str = relation_dynamic_props.get(
-                    "source_systems"
-                )
-                relation_dynamic_props_tuple = (
-                    relation_dynamic_props_str.split(",")
-                    if relation_dynamic_props_str
-                    else tuple()
+                relation_dynamic_props_tuple = self._parse_source_systems(
+                    relation_dynamic_props.get("source_systems")
                 )
 
-                relation = Relation(
-                    id=id_generator(xml_root.attrib["name"]),
-                    nk=xml_root.attrib["name"],
-                    source_entity_id=self.LM.all_lm_units_by_odm_id[
-                        xml_root.findtext("sourceEntity")
-                    ].id,
-                    target_entity_id=self.LM.all_lm_units_by_odm_id[
-                        xml_root.findtext("targetEntity")
-                    ].id,
-                    name=xml_root.attrib["name"],
-                    domain=relation_dynamic_props.get("domain"),
-                    description=xml_root.findtext("comment")
-                    if xml_root.findtext("comment") is not None
-                    else "",
-                    pm_map=relation_pm_map_tuple,
-                    source_systems=relation_dynamic_props_tuple,
-                    responsible_parties=relation_responsible_parties,
-                    documents=self._parse_documents(xml_root),
-                    optional_source=xml_root.findtext("optionalSource"),
-                    optional_target=xml_root.findtext("optionalTarget"),
-                    source_cardinality=xml_root.findtext("sourceCardinality"),
-                    target_cardinality=xml_root.findtext("targetCardinalityString"),
-                    created_by=None,
-                    created_time=None,
+                relation_name = intern(xml_root.attrib["name"])
+                relation = self.units.store(
+                    Relation(
+                        id=intern(id_generator(relation_name)),
+                        nk=relation_name,
+                        source_entity_id=self.LM.all_lm_units_by_odm_id[
+                            xml_root.findtext("sourceEntity")
+                        ].id,
+                        target_entity_id=self.LM.all_lm_units_by_odm_id[
+                            xml_root.findtext("targetEntity")
+                        ].id,
+                        name=relation_name,
+                        domain=intern(relation_dynamic_props.get("domain")),
+                        description=intern(xml_root.findtext("comment") or ""),
+                        pm_map=relation_pm_map_tuple,
+                        source_systems=relation_dynamic_props_tuple,
+                        responsible_parties=relation_responsible_parties,
+                        documents=self._parse_documents(xml_root),
+                        optional_source=xml_root.findtext("optionalSource"),
+                        optional_target=xml_root.findtext("optionalTarget"),
+                        source_cardinality=xml_root.findtext("sourceCardinality"),
+                        target_cardinality=xml_root.findtext("targetCardinalityString"),
+                        created_by=None,
+                        created_time=None,
+                    )
                 )
 
                 self.LM.register_relation(relation)
@@ -499,13 +504,15 @@ class ODMParser:
                         used_attributes.append(
                             self.LM.all_lm_units_by_odm_id[attr_elem.text]
                         )
-                entity_identifier = EntityIdentifier(
-                    id=id_generator(name),
-                    nk=name,
-                    name=name,
-                    is_pk=is_pk,
-                    entity_id=entity_id,
-                    attributes=used_attributes,
+                entity_identifier = self.units.store(
+                    EntityIdentifier(
+                        id=id_generator(name),
+                        nk=name,
+                        name=name,
+                        is_pk=is_pk,
+                        entity_id=entity_id,
+                        attributes=tuple(used_attributes),
+                    )
                 )
 
                 self.LM.register_identifier(entity_identifier)
@@ -544,7 +551,12 @@ class ODMVersionedProjectParser:
         if not odm_version_path:
             raise ValueError(f"Version {version} not found in ODM project paths.")
 
-        parser = ODMParser(odm_version_path, PM)
+        parser = ODMParser(
+            odm_version_path,
+            PM,
+            interner=self.LMDatabse.interner,
+            units=self.LMDatabse.units,
+        )
 
         bi = parser.parse_bi()
         self.BIDatabase.register_business_information(bi)
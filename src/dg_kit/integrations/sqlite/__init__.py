@@ -0,0 +1 @@
+"""SQLite integration components for offline data catalog storage."""
@@ -0,0 +1,276 @@
+"""SQLite-backed data catalog engine.
+
+This module stores catalog rows and pages in a local SQLite database and
+implements the :class:`dg_kit.base.data_catalog.DataCatalogEngine` interface,
+so catalogs can be synchronized and benchmarked without network access.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from dg_kit.base.data_catalog import (
+    DataCatalogEngine,
+    canonical_page_content,
+    page_content_hash,
+)
+from dg_kit.base.dataclasses.data_catalog import (
+    DataCatalogRow,
+    EntityPage,
+    AttributePage,
+    RelationPage,
+    ObjectReference,
+    IndexedCatalog,
+)
+from dg_kit.base.enums import DataUnitType
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS data_catalog_rows (
+    id TEXT PRIMARY KEY,
+    reference_link TEXT NOT NULL UNIQUE,
+    data_unit_type TEXT NOT NULL,
+    data_unit_name TEXT NOT NULL,
+    domain TEXT,
+    last_edited_time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_data_catalog_rows_last_edited_time
+    ON data_catalog_rows (last_edited_time);
+CREATE TABLE IF NOT EXISTS data_catalog_pages (
+    id TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    content_hash TEXT NOT NULL
+);
+"""
+
+_PAGE_CLASS_BY_UNIT_TYPE = {
+    DataUnitType.ENTITY: EntityPage,
+    DataUnitType.ATTRIBUTE: AttributePage,
+    DataUnitType.RELATION: RelationPage,
+}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+class SQLiteDataCatalog(DataCatalogEngine):
+    def __init__(
+        self,
+        sqlite_config: dict,
+    ):
+        self.sqlite_config = sqlite_config
+        self.database_path = str(sqlite_config.get("sqlite_path", ":memory:"))
+        self.connection = sqlite3.connect(self.database_path)
+
+        if self.database_path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+    def _page_from_content(
+        self,
+        unit_type: DataUnitType,
+        content: str,
+        reference: ObjectReference,
+    ) -> EntityPage | AttributePage | RelationPage:
+        page_cls = _PAGE_CLASS_BY_UNIT_TYPE[unit_type]
+        page_fields = page_cls.__dataclass_fields__
+
+        values = {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in json.loads(content).items()
+            if key in page_fields
+        }
+        values["data_unit_type"] = unit_type
+        values["reference"] = reference
+
+        return page_cls(**values)
+
+    def pull_data_catalog(self, edited_since: Optional[str] = None) -> IndexedCatalog:
+        query = """
+            SELECT r.id, r.reference_link, r.data_unit_type, r.data_unit_name,
+                   r.domain, r.last_edited_time, p.content, p.content_hash
+            FROM data_catalog_rows r
+            LEFT JOIN data_catalog_pages p ON p.id = r.id
+        """
+        params: tuple = ()
+        if edited_since:
+            query += " WHERE r.last_edited_time >= ?"
+            params = (edited_since,)
+
+        rows_by_id: Dict[str, DataCatalogRow] = {}
+        reference_by_id: Dict[str, ObjectReference] = {}
+        page_by_id: Dict[str, EntityPage | AttributePage | RelationPage] = {}
+        content_hash_by_id: Dict[str, str] = {}
+        last_edited_time: Optional[str] = edited_since
+
+        for (
+            id,
+            reference_link,
+            data_unit_type,
+            data_unit_name,
+            domain,
+            row_edited_time,
+            content,
+            content_hash,
+        ) in self.connection.execute(query, params):
+            unit_type = DataUnitType(data_unit_type)
+            reference = ObjectReference(id=id, reference_link=reference_link)
+
+            rows_by_id[id] = DataCatalogRow(
+                id=id,
+                reference=reference,
+                data_unit_type=unit_type,
+                data_unit_name=data_unit_name,
+                domain=domain,
+            )
+            reference_by_id[id] = reference
+
+            if content is not None:
+                page_by_id[id] = self._page_from_content(unit_type, content, reference)
+                content_hash_by_id[id] = content_hash
+
+            if last_edited_time is None or row_edited_time > last_edited_time:
+                last_edited_time = row_edited_time
+
+        return IndexedCatalog(
+            row_by_id=rows_by_id,
+            reference_by_id=reference_by_id,
+            page_by_id=page_by_id,
+            last_edited_time=last_edited_time,
+            content_hash_by_id=content_hash_by_id,
+        )
+
+    def _insert_rows(self, raw_data_catalog_rows: List[Dict]) -> List[ObjectReference]:
+        edited_time = _utc_now()
+        references = [
+            ObjectReference(raw_row["id"], str(uuid.uuid4()))
+            for raw_row in raw_data_catalog_rows
+        ]
+
+        with self.connection:
+            self.connection.executemany(
+                """
+                INSERT INTO data_catalog_rows (
+                    id, reference_link, data_unit_type, data_unit_name, domain,
+                    last_edited_time
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        raw_row["id"],
+                        reference.reference_link,
+                        str(raw_row["data_unit_type"]),
+                        raw_row["data_unit_name"],
+                        raw_row["domain"],
+                        edited_time,
+                    )
+                    for raw_row, reference in zip(raw_data_catalog_rows, references)
+                ],
+            )
+
+        return references
+
+    def _update_rows(self, data_catalog_rows: List[DataCatalogRow]) -> None:
+        edited_time = _utc_now()
+
+        with self.connection:
+            self.connection.executemany(
+                """
+                UPDATE data_catalog_rows
+                SET data_unit_type = ?, data_unit_name = ?, domain = ?,
+                    last_edited_time = ?
+                WHERE id = ?
+                """,
+                [
+                    (
+                        str(row.data_unit_type),
+                        row.data_unit_name,
+                        row.domain,
+                        edited_time,
+                        row.id,
+                    )
+                    for row in data_catalog_rows
+                ],
+            )
+
+    def _upsert_pages(
+        self, pages: List[EntityPage | AttributePage | RelationPage]
+    ) -> None:
+        edited_time = _utc_now()
+
+        with self.connection:
+            self.connection.executemany(
+                """
+                INSERT INTO data_catalog_pages (id, content, content_hash)
+                VALUES (?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    content = excluded.content,
+                    content_hash = excluded.content_hash
+                """,
+                [
+                    (
+                        page.id,
+                        json.dumps(canonical_page_content(page), ensure_ascii=False),
+                        page_content_hash(page),
+                    )
+                    for page in pages
+                ],
+            )
+            self.connection.executemany(
+                "UPDATE data_catalog_rows SET last_edited_time = ? WHERE id = ?",
+                [(edited_time, page.id) for page in pages],
+            )
+
+    def update_row(self, data_catalog_row: DataCatalogRow) -> None:
+        self._update_rows([data_catalog_row])
+
+    def update_page(self, page_obj: EntityPage | AttributePage | RelationPage) -> None:
+        self._upsert_pages([page_obj])
+
+    def add_page(self, data_unit_page: EntityPage | AttributePage | RelationPage):
+        self._upsert_pages([data_unit_page])
+
+    def add_row(self, raw_data_catalog_row: Dict) -> ObjectReference:
+        return self._insert_rows([raw_data_catalog_row])[0]
+
+    def add_rows(self, raw_data_catalog_rows: List[Dict]) -> List[ObjectReference]:
+        return self._insert_rows(raw_data_catalog_rows)
+
+    def update_rows(self, data_catalog_rows: List[DataCatalogRow]) -> None:
+        self._update_rows(data_catalog_rows)
+
+    def add_pages(
+        self, data_unit_pages: List[EntityPage | AttributePage | RelationPage]
+    ) -> None:
+        self._upsert_pages(data_unit_pages)
+
+    def update_pages(
+        self, data_unit_pages: List[EntityPage | AttributePage | RelationPage]
+    ) -> None:
+        self._upsert_pages(data_unit_pages)
+
+    def delete_by_id(
+        self, id: str, reference: Optional[ObjectReference] = None
+    ) -> None:
+        self.delete_many([id])
+
+    def delete_many(
+        self,
+        ids: Iterable[str],
+        reference_by_id: Optional[Dict[str, ObjectReference]] = None,
+    ) -> None:
+        params = [(id,) for id in ids]
+
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM data_catalog_pages WHERE id = ?", params
+            )
+            self.connection.executemany(
+                "DELETE FROM data_catalog_rows WHERE id = ?", params
+            )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import pytest
+
+from dg_kit.base.dataclasses import id_generator
+from dg_kit.base.dataclasses.logical_model import (
+    Attribute,
+    Entity,
+    EntityIdentifier,
+    Relation,
+)
+from dg_kit.base.dataclasses.physical_model import Column, Layer, Table
+from dg_kit.base.logical_model import LogicalModel
+from dg_kit.base.physical_model import PhysicalModel
+
+
+def build_logical_model(
+    entity_count: int = 3,
+    attributes_per_entity: int = 3,
+    revision: str = "v1",
+) -> LogicalModel:
+    LM = LogicalModel(revision)
+    entity_ids = [id_generator(f"entity_{e}") for e in range(entity_count)]
+
+    for e, entity_id in enumerate(entity_ids):
+        table = Table(
+            id=id_generator(f"core.entity_{e}"),
+            nk=f"core.entity_{e}",
+            layer_id="core",
+            name=f"entity_{e}",
+        )
+        LM.register_entity(
+            Entity(
+                id=entity_id,
+                nk=f"entity_{e}",
+                name=f"Entity {e}",
+                domain="sales",
+                description=f"Entity {e} ({revision}).",
+                pm_map=(table,),
+                source_systems=("crm",),
+                responsible_parties=(),
+                documents=(),
+            )
+        )
+
+        attributes = []
+        for a in range(attributes_per_entity):
+            attribute = Attribute(
+                id=id_generator(f"entity_{e}.attribute_{a}"),
+                nk=f"entity_{e}.attribute_{a}",
+                entity_id=entity_id,
+                name=f"Attribute {a}",
+                domain="sales",
+                description=f"Attribute {a} of entity {e} ({revision}).",
+                sensitivity_type="Not sensitive",
+                data_type="STRING",
+                pm_map=(
+                    Column(
+                        id=id_generator(f"core.entity_{e}.column_{a}"),
+                        nk=f"core.entity_{e}.column_{a}",
+                        layer_id="core",
+                        table_id=table.id,
+                        name=f"column_{a}",
+                        data_type="STRING",
+                    ),
+                ),
+                source_systems=("crm",),
+                responsible_parties=(),
+                documents=(),
+            )
+            LM.register_attribute(attribute)
+            attributes.append(attribute)
+
+        LM.register_identifier(
+            EntityIdentifier(
+                id=id_generator(f"entity_{e}.pk"),
+                nk=f"entity_{e}.pk",
+                entity_id=entity_id,
+                name="pk",
+                is_pk=True,
+                attributes=(attributes[0],),
+            )
+        )
+
+    for e, entity_id in enumerate(entity_ids):
+        LM.register_relation(
+            Relation(
+                id=id_generator(f"entity_{e}.relation"),
+                nk=f"entity_{e}.relation",
+                source_entity_id=entity_id,
+                target_entity_id=entity_ids[(e + 1) % entity_count],
+                name=f"Relation of entity {e}",
+                domain="sales",
+                description=f"Relation of entity {e} ({revision}).",
+                pm_map=(),
+                source_systems=(),
+                responsible_parties=(),
+                documents=(),
+                optional_source=None,
+                optional_target=None,
+                source_cardinality=None,
+                target_cardinality=None,
+            )
+        )
+
+    return LM
+
+
+def build_physical_model(columns_by_table: dict, layer: str = "core") -> PhysicalModel:
+    PM = PhysicalModel("v1")
+    PM.register_layer(Layer(id=layer, nk=layer, name=layer, is_landing=False))
+    for table_name, column_names in columns_by_table.items():
+        table = Table(
+            id=id_generator(f"{layer}.{table_name}"),
+            nk=f"{layer}.{table_name}",
+            layer_id=layer,
+            name=table_name,
+        )
+        PM.register_table(table)
+        for column_name in column_names:
+            PM.register_column(
+                Column(
+                    id=id_generator(f"{layer}.{table_name}.{column_name}"),
+                    nk=f"{layer}.{table_name}.{column_name}",
+                    layer_id=layer,
+                    table_id=table.id,
+                    name=column_name,
+                    data_type="STRING",
+                )
+            )
+    return PM
+
+
+@pytest.fixture
+def make_logical_model():
+    return build_logical_model
+
+
+@pytest.fixture
+def make_physical_model():
+    return build_physical_model
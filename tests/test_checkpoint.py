@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import replace
+
+import pytest
+
+from dg_kit.base.checkpoint import (
+    CHECKPOINT_VERSION,
+    decode_indexed_catalog,
+    encode_indexed_catalog,
+    read_checkpoint,
+    write_checkpoint,
+)
+from dg_kit.base.data_catalog import DataCatalog, page_content_hash
+from dg_kit.integrations.sqlite.api import SQLiteDataCatalog
+
+
+@pytest.fixture
+def synced_catalog(tmp_path, make_logical_model):
+    config = {
+        "name": "test",
+        "data_catalog": {"engine": "sqlite", "dc_checkpoint_path": str(tmp_path)},
+    }
+    DC = DataCatalog(SQLiteDataCatalog(config["data_catalog"]), config)
+    DC.sync_with_model(make_logical_model())
+    return DC
+
+
+def test_checkpoint_round_trip(tmp_path, synced_catalog):
+    indexed_catalog = synced_catalog.indexed_catalog
+    path = tmp_path / "catalog.dgkc"
+
+    write_checkpoint(indexed_catalog, path)
+    loaded = read_checkpoint(path)
+
+    assert loaded.row_by_id == indexed_catalog.row_by_id
+    assert loaded.reference_by_id == indexed_catalog.reference_by_id
+    assert loaded.content_hash_by_id == indexed_catalog.content_hash_by_id
+    assert loaded.last_edited_time == indexed_catalog.last_edited_time
+    # Pages keep their canonical content, physical objects are stored by name.
+    assert {
+        id: page_content_hash(page) for id, page in loaded.page_by_id.items()
+    } == indexed_catalog.content_hash_by_id
+
+
+def test_missing_page_values_stay_distinct_from_empty_text(synced_catalog):
+    indexed_catalog = synced_catalog.indexed_catalog
+    missing_id, empty_id = sorted(indexed_catalog.page_by_id)[:2]
+    page_by_id = dict(indexed_catalog.page_by_id)
+    page_by_id[missing_id] = replace(
+        page_by_id[missing_id], description=None, source_systems=("crm", None)
+    )
+    page_by_id[empty_id] = replace(
+        page_by_id[empty_id], description="", source_systems=("",)
+    )
+
+    loaded = decode_indexed_catalog(
+        encode_indexed_catalog(replace(indexed_catalog, page_by_id=page_by_id))
+    )
+
+    assert loaded.page_by_id[missing_id].description is None
+    assert loaded.page_by_id[missing_id].source_systems == ("crm", None)
+    assert loaded.page_by_id[empty_id].description == ""
+    assert loaded.page_by_id[empty_id].source_systems == ("",)
+
+
+def test_encoding_is_deterministic(synced_catalog):
+    payload = encode_indexed_catalog(synced_catalog.indexed_catalog)
+
+    assert encode_indexed_catalog(decode_indexed_catalog(payload)) == payload
+
+
+@pytest.mark.parametrize(
+    "corrupt, error",
+    [
+        (lambda payload: payload[:4], "truncated"),
+        (lambda payload: b"PKL0" + payload[4:], "Not a dg_kit"),
+        (
+            lambda payload: (
+                payload[:4] + struct.pack("<H", CHECKPOINT_VERSION + 1) + payload[6:]
+            ),
+            "Unsupported checkpoint version",
+        ),
+    ],
+)
+def test_unsupported_checkpoints_raise(synced_catalog, corrupt, error):
+    payload = encode_indexed_catalog(synced_catalog.indexed_catalog)
+
+    with pytest.raises(ValueError, match=error):
+        decode_indexed_catalog(corrupt(payload))
+
+
+def test_unreadable_checkpoint_falls_back_to_a_pull(synced_catalog):
+    synced_catalog.artifact_path.write_bytes(b"not a checkpoint")
+
+    DC = DataCatalog(synced_catalog.engine, synced_catalog.config)
+
+    assert DC.indexed_catalog.row_by_id == synced_catalog.indexed_catalog.row_by_id
+    assert read_checkpoint(DC.artifact_path).row_by_id == DC.indexed_catalog.row_by_id
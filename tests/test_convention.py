@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import time
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from dg_kit.base import rule_plugins
+from dg_kit.base.convention import Convention, ConventionValidator
+from dg_kit.base.dataclasses import id_generator
+from dg_kit.base.dataclasses.convention import ConventionBreach
+from dg_kit.base.dataclasses.physical_model import Layer, Table
+from dg_kit.base.enums import ConventionRuleSeverity
+from dg_kit.base.logical_model import LogicalModel
+
+
+def rule_config(**rules) -> dict:
+    return {
+        "rules": {
+            name: {"severity": "warning", "description": name, **config}
+            for name, config in rules.items()
+        }
+    }
+
+
+def no_wide_tables(LM, PM, **kwargs):
+    return [
+        ConventionBreach(
+            severity=ConventionRuleSeverity(kwargs["severity"]),
+            message=f"{len(PM.tables)} tables checked",
+        )
+    ]
+
+
+@pytest.fixture
+def installed_plugin(monkeypatch):
+    entry_point = EntryPoint(
+        name="no_wide_tables",
+        value=f"{__name__}:no_wide_tables",
+        group=rule_plugins.CONVENTION_RULES_ENTRY_POINT_GROUP,
+    )
+    monkeypatch.setattr(
+        rule_plugins, "available_rule_plugins", lambda: {"no_wide_tables": entry_point}
+    )
+    rule_plugins.load_rule_plugin.cache_clear()
+    yield
+    rule_plugins.load_rule_plugin.cache_clear()
+
+
+def test_subclass_rule_methods_are_used(make_physical_model):
+    class TeamConvention(Convention):
+        def tables_exist(self, LM, PM, **kwargs):
+            return [ConventionBreach(ConventionRuleSeverity.WARNING, "custom")]
+
+    convention = TeamConvention("team", rule_config(tables_exist={}))
+    PM = make_physical_model({"customers": ["id"]})
+
+    breaches = ConventionValidator(LogicalModel("v1"), PM, convention).validate()
+
+    assert [breach.message for breach in breaches] == ["custom"]
+
+
+def test_rules_are_loaded_from_entry_points(installed_plugin, make_physical_model):
+    convention = Convention("team", rule_config(no_wide_tables={}))
+    PM = make_physical_model({"customers": ["id"], "orders": ["id"]})
+
+    breaches = ConventionValidator(LogicalModel("v1"), PM, convention).validate()
+
+    assert [breach.message for breach in breaches] == ["2 tables checked"]
+
+
+def test_unknown_rule_raises(installed_plugin):
+    with pytest.raises(ValueError, match="Unknown convention rule 'missing'"):
+        Convention("team", rule_config(missing={}))
+
+
+def consistency_convention(**config) -> Convention:
+    return Convention(
+        "team",
+        {
+            **rule_config(lm_x_pm_consistency={}),
+            "lm_mapping_layers": ["core"],
+            **config,
+        },
+    )
+
+
+def mapped_physical_model(make_physical_model, extra_columns=()):
+    return make_physical_model(
+        {
+            f"entity_{e}": [f"column_{a}" for a in range(3)]
+            + (list(extra_columns) if e == 0 else [])
+            for e in range(3)
+        }
+    )
+
+
+def test_consistency_without_technical_fields(make_logical_model, make_physical_model):
+    LM = make_logical_model()
+    PM = mapped_physical_model(make_physical_model)
+
+    breaches = ConventionValidator(LM, PM, consistency_convention()).validate()
+
+    # Relations have no physical mapping in the test model.
+    assert sorted(breach.message for breach in breaches) == [
+        f"Missing PM mapping for Relation of entity {e}" for e in range(3)
+    ]
+
+
+def test_consistency_skips_technical_fields(make_logical_model, make_physical_model):
+    LM = make_logical_model()
+    PM = mapped_physical_model(make_physical_model, ["created_at", "loaded_by"])
+    convention = consistency_convention(technical_fields={"core": ["created_at"]})
+
+    messages = [
+        breach.message
+        for breach in ConventionValidator(LM, PM, convention).validate()
+        if "not used in LM" in breach.message
+    ]
+
+    assert messages == ["This PM object is not used in LM: core.entity_0.loaded_by"]
+
+
+class TimedConvention(Convention):
+    def slow_rule(self, LM, PM, **kwargs):
+        # Finishes after the rules listed behind it when run concurrently.
+        time.sleep(0.05)
+        return [
+            ConventionBreach(ConventionRuleSeverity.WARNING, f"slow {table.name}")
+            for table in PM.tables.values()
+        ]
+
+    def fast_rule(self, LM, PM, **kwargs):
+        return [ConventionBreach(ConventionRuleSeverity.ERROR, "fast")]
+
+
+@pytest.mark.parametrize("jobs", [2, 4, 0])
+def test_concurrent_rules_keep_breach_order(
+    jobs, make_logical_model, make_physical_model
+):
+    core_tables = {"layer": "core", "regex": {"string": "^core_"}}
+    config = {
+        **rule_config(
+            slow_rule={},
+            lm_x_pm_consistency={},
+            regex_by_layer={"rules": {"core_tables": core_tables}},
+            fast_rule={},
+        ),
+        "lm_mapping_layers": ["core"],
+    }
+    LM = make_logical_model()
+    PM = mapped_physical_model(make_physical_model, ["loaded_by"])
+
+    sequential = ConventionValidator(LM, PM, TimedConvention("team", config))
+    concurrent = ConventionValidator(LM, PM, TimedConvention("team", config), jobs)
+
+    expected = sequential.validate()
+    assert concurrent.validate() == expected
+    assert expected[0].message == "slow entity_0"
+    assert expected[-1].message == "fast"
+    assert [stats.rule_name for stats in concurrent.rule_stats] == [
+        "slow_rule",
+        "lm_x_pm_consistency",
+        "regex_by_layer",
+        "fast_rule",
+    ]
+
+
+def test_profiling_runs_rules_sequentially(make_physical_model, caplog):
+    convention = TimedConvention("team", rule_config(slow_rule={}, fast_rule={}))
+    validator = ConventionValidator(
+        LogicalModel("v1"), make_physical_model({"t": []}), convention, 4, True
+    )
+
+    with caplog.at_level("WARNING"):
+        breaches = validator.validate()
+
+    assert [breach.message for breach in breaches] == ["slow t", "fast"]
+    assert all(stats.profile for stats in validator.rule_stats)
+    assert "ignoring jobs=4" in caplog.text
+
+
+def layered_physical_model(make_physical_model):
+    """Core tables that all read a mart table, which reads a stage table."""
+    core_names = [f"core_{t}" for t in range(7)]
+    PM = make_physical_model({name: [] for name in core_names})
+    tables = {}
+    for layer in ("stage", "mart"):
+        PM.register_layer(Layer(id=layer, nk=layer, name=layer, is_landing=False))
+        tables[layer] = Table(
+            id=id_generator(f"{layer}.{layer}_table"),
+            nk=f"{layer}.{layer}_table",
+            layer_id=layer,
+            name=f"{layer}_table",
+        )
+        PM.register_table(tables[layer])
+
+    PM.register_dependency(tables["mart"], tables["stage"])
+    for name in core_names:
+        core_table = PM.tables[id_generator(f"core.{name}")]
+        PM.register_dependency(core_table, tables["mart"])
+        PM.register_dependency(core_table, tables["stage"])
+    return PM
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_group_by_layer_pair_reports_one_breach_per_layer_pair(
+    cache, tmp_path, make_physical_model
+):
+    allowed = {"core": ["stage"], "mart": ["core"]}
+    PM = layered_physical_model(make_physical_model)
+
+    def validate(**rule):
+        convention = Convention(
+            "team", rule_config(allowed_dependencies={"rules": allowed, **rule})
+        )
+        cache_path = tmp_path / f"{len(rule)}.sqlite" if cache else None
+        return ConventionValidator(
+            LogicalModel("v1"), PM, convention, cache_path=cache_path
+        ).validate()
+
+    per_dependency = validate()
+    grouped = validate(group_by_layer_pair=True)
+
+    assert len(per_dependency) == 8
+    assert [breach.message for breach in grouped] == [
+        "1 dependencies from mart layer on stage layer: mart_table -> stage_table",
+        "7 dependencies from core layer on mart layer: core_0 -> mart_table, "
+        "core_1 -> mart_table, core_2 -> mart_table, core_3 -> mart_table, "
+        "core_4 -> mart_table and 2 more",
+    ]
+    assert {breach.severity for breach in grouped} == {ConventionRuleSeverity.WARNING}
+    assert validate(group_by_layer_pair=True) == grouped
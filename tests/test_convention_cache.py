@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import replace
+
+import pytest
+
+from dg_kit.base.convention import Convention, ConventionValidator
+from dg_kit.base.convention_cache import ConventionCache
+from dg_kit.base.dataclasses import id_generator
+from dg_kit.base.dataclasses.physical_model import Column, Table
+
+
+CONVENTION_CONFIG = {
+    "lm_mapping_layers": ["core"],
+    "technical_fields": {"core": ["created_at"]},
+    "rules": {
+        "lm_x_pm_consistency": {"severity": "error", "description": "Mappings."},
+        "regex_by_layer": {
+            "severity": "warning",
+            "description": "Table names.",
+            "rules": {"core": {"layer": "core", "regex": {"string": "^entity_\\d+$"}}},
+        },
+        "declarative": {
+            "severity": "warning",
+            "description": "Column names.",
+            "rules": {
+                "snake_case": {
+                    "select": {"type": "column"},
+                    "field": "name",
+                    "regex": "^[a-z0-9_]+$",
+                }
+            },
+        },
+    },
+}
+
+
+def add_table(PM, name: str, column_names) -> None:
+    table = Table(
+        id=id_generator(f"core.{name}"), nk=f"core.{name}", layer_id="core", name=name
+    )
+    PM.register_table(table)
+    for column_name in column_names:
+        PM.register_column(
+            Column(
+                id=id_generator(f"core.{name}.{column_name}"),
+                nk=f"core.{name}.{column_name}",
+                layer_id="core",
+                table_id=table.id,
+                name=column_name,
+                data_type="STRING",
+            )
+        )
+
+
+def validate(LM, PM, config, cache_path=None):
+    validator = ConventionValidator(
+        LM, PM, Convention("test", config), cache_path=cache_path
+    )
+    breaches = validator.validate()
+    return sorted(breaches, key=lambda breach: breach.message), validator.rule_stats
+
+
+@pytest.fixture
+def models(make_logical_model, make_physical_model):
+    LM = make_logical_model()
+    PM = make_physical_model(
+        {f"entity_{e}": [f"column_{a}" for a in range(3)] for e in range(3)}
+    )
+    return LM, PM
+
+
+def test_incremental_runs_match_full_runs(tmp_path, models):
+    LM, PM = models
+    cache_path = tmp_path / "convention_cache.sqlite"
+    config = copy.deepcopy(CONVENTION_CONFIG)
+
+    def check(expected_scanned=None):
+        full, _ = validate(LM, PM, config)
+        incremental, stats = validate(LM, PM, config, cache_path)
+        assert incremental == full
+        if expected_scanned is not None:
+            assert {s.rule_name: s.objects_scanned for s in stats} == expected_scanned
+        return full
+
+    assert check()
+
+    # Nothing changed, every object reuses its cached breaches.
+    check({"lm_x_pm_consistency": 0, "regex_by_layer": 0, "declarative": 0})
+
+    add_table(PM, "Staging", ["created_at", "LoadedBy"])
+    breaches = check({"lm_x_pm_consistency": 3, "regex_by_layer": 1, "declarative": 2})
+    messages = [breach.message for breach in breaches]
+    assert any("core.Staging.LoadedBy" in message for message in messages)
+    assert not any("created_at" in message for message in messages)
+
+    # Changing a rule's configuration re-checks every object of that rule.
+    config["rules"]["regex_by_layer"]["severity"] = "error"
+    _, stats = validate(LM, PM, config, cache_path)
+    scanned = {s.rule_name: s.objects_scanned for s in stats}
+    assert scanned["regex_by_layer"] == len(PM.tables)
+    assert scanned["declarative"] == 0
+
+
+def test_unreadable_cache_is_ignored(tmp_path, models):
+    LM, PM = models
+    cache_path = tmp_path / "convention_cache.sqlite"
+    cache_path.write_text("{not a database", encoding="utf-8")
+
+    assert (
+        validate(LM, PM, CONVENTION_CONFIG, cache_path)[0]
+        == validate(LM, PM, CONVENTION_CONFIG)[0]
+    )
+    cache = ConventionCache(cache_path)
+    assert cache.rule_state("regex_by_layer") is not None
+    cache.close()
+
+
+def test_unchanged_models_leave_the_cache_untouched(tmp_path, models):
+    LM, PM = models
+    cache_path = tmp_path / "convention_cache.sqlite"
+    validate(LM, PM, CONVENTION_CONFIG, cache_path)
+    content = cache_path.read_bytes()
+
+    validate(LM, PM, CONVENTION_CONFIG, cache_path)
+
+    assert cache_path.read_bytes() == content
+
+
+def test_only_changed_objects_are_rewritten(tmp_path, models):
+    LM, PM = models
+    cache_path = tmp_path / "convention_cache.sqlite"
+    add_table(PM, "Staging", ["LoadedBy"])
+    validate(LM, PM, CONVENTION_CONFIG, cache_path)
+
+    cache = ConventionCache(cache_path)
+    regex_breaches = cache.breaches("regex_by_layer")
+    cache.close()
+    assert list(regex_breaches) == [id_generator("core.Staging")]
+
+    # Renaming a column re-checks that column only, and its old breach is
+    # replaced by the new one.
+    column = PM.columns[id_generator("core.Staging.LoadedBy")]
+    PM.register_column(replace(column, name="loaded_by"))
+    breaches, stats = validate(LM, PM, CONVENTION_CONFIG, cache_path)
+
+    scanned = {s.rule_name: s.objects_scanned for s in stats}
+    assert scanned == {"lm_x_pm_consistency": 1, "regex_by_layer": 0, "declarative": 1}
+    assert breaches == validate(LM, PM, CONVENTION_CONFIG)[0]
+    assert not any("LoadedBy" in breach.message for breach in breaches)
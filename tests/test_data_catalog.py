@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from dg_kit.base.data_catalog import DataCatalog, DataCatalogEngine
+from dg_kit.base.dataclasses.data_catalog import IndexedCatalog, ObjectReference
+from dg_kit.base.enums import SyncAction
+from dg_kit.integrations.sqlite.api import SQLiteDataCatalog
+
+
+class FailingSQLiteDataCatalog(SQLiteDataCatalog):
+    """Create part of the second row batch, then fail."""
+
+    def __init__(self, sqlite_config: dict, fail_on_call: int = 2, created: int = 3):
+        super().__init__(sqlite_config)
+        self.fail_on_call = fail_on_call
+        self.created = created
+        self.add_rows_calls = 0
+
+    def add_rows(self, raw_data_catalog_rows):
+        self.add_rows_calls += 1
+        if self.add_rows_calls == self.fail_on_call:
+            super().add_rows(raw_data_catalog_rows[: self.created])
+            raise RuntimeError("Remote failed mid batch.")
+        return super().add_rows(raw_data_catalog_rows)
+
+
+class RecordingEngine(DataCatalogEngine):
+    """Record calls to the single-unit engine methods."""
+
+    def __init__(self):
+        self.calls = []
+
+    def pull_data_catalog(self, edited_since=None):
+        return IndexedCatalog()
+
+    def update_row(self, data_catalog_row):
+        self.calls.append(("update_row", data_catalog_row))
+
+    def update_page(self, data_unit_page):
+        self.calls.append(("update_page", data_unit_page))
+
+    def add_page(self, data_unit_page):
+        self.calls.append(("add_page", data_unit_page))
+
+    def add_row(self, data_catalog_row):
+        self.calls.append(("add_row", data_catalog_row))
+        return ObjectReference(id=data_catalog_row["id"], reference_link="link")
+
+    def delete_by_id(self, id, reference=None):
+        self.calls.append(("delete_by_id", id, reference))
+
+
+def make_config(tmp_path, batch_size: int = 10) -> dict:
+    return {
+        "name": "test",
+        "data_catalog": {
+            "engine": "sqlite",
+            "dc_checkpoint_path": str(tmp_path),
+            "batch_size": batch_size,
+        },
+    }
+
+
+def engine_row_ids(engine: SQLiteDataCatalog) -> list:
+    return [
+        row_id
+        for (row_id,) in engine.connection.execute("SELECT id FROM data_catalog_rows")
+    ]
+
+
+def test_failed_row_batch_does_not_leave_a_partial_checkpoint(
+    tmp_path, make_logical_model
+):
+    config = make_config(tmp_path)
+    LM = make_logical_model(entity_count=5)
+    engine = FailingSQLiteDataCatalog(config["data_catalog"])
+    DC = DataCatalog(engine, config)
+
+    with pytest.raises(RuntimeError):
+        DC.sync_with_model(LM)
+
+    assert len(engine_row_ids(engine)) == 13
+    assert not DC.artifact_path.exists()
+
+    # The next run pulls the 13 created rows instead of creating them again.
+    engine.fail_on_call = None
+    DC = DataCatalog(engine, config)
+    assert len(DC.indexed_catalog.row_by_id) == 13
+    DC.sync_with_model(LM)
+
+    row_ids = engine_row_ids(engine)
+    assert sorted(row_ids) == sorted(LM.all_units_by_id)
+    assert set(DC.load_from_local().row_by_id) == set(LM.all_units_by_id)
+
+
+def test_failure_after_adding_rows_drops_the_checkpoint(
+    tmp_path, make_logical_model, monkeypatch
+):
+    config = make_config(tmp_path)
+    engine = SQLiteDataCatalog(config["data_catalog"])
+    DC = DataCatalog(engine, config)
+    assert DC.artifact_path.exists()
+
+    def fail(pages):
+        raise RuntimeError("Remote failed.")
+
+    monkeypatch.setattr(engine, "add_pages", fail)
+    with pytest.raises(RuntimeError):
+        DC.sync_with_model(make_logical_model())
+
+    assert not DC.artifact_path.exists()
+
+
+def test_failure_without_new_rows_keeps_the_checkpoint(
+    tmp_path, make_logical_model, monkeypatch
+):
+    config = make_config(tmp_path)
+    engine = SQLiteDataCatalog(config["data_catalog"])
+    DC = DataCatalog(engine, config)
+    DC.sync_with_model(make_logical_model())
+    checkpoint = DC.artifact_path.read_bytes()
+
+    def fail(pages):
+        raise RuntimeError("Remote failed.")
+
+    monkeypatch.setattr(engine, "update_pages", fail)
+    with pytest.raises(RuntimeError):
+        DC.sync_with_model(make_logical_model(revision="v2"))
+
+    assert DC.artifact_path.read_bytes() == checkpoint
+
+
+def test_sync_writes_the_checkpoint_once(tmp_path, make_logical_model, monkeypatch):
+    config = make_config(tmp_path, batch_size=5)
+    DC = DataCatalog(SQLiteDataCatalog(config["data_catalog"]), config)
+
+    saves = []
+    save_to_local = DC.save_to_local
+    monkeypatch.setattr(DC, "save_to_local", lambda: saves.append(save_to_local()))
+    LM = make_logical_model(entity_count=5)
+    DC.sync_with_model(LM)
+
+    assert len(saves) == 1
+    assert set(DC.load_from_local().row_by_id) == set(LM.all_units_by_id)
+
+
+class PlanRecordingSQLiteDataCatalog(SQLiteDataCatalog):
+    """Record the pages passed to ``estimate_api_calls`` by id."""
+
+    def __init__(self, sqlite_config: dict):
+        super().__init__(sqlite_config)
+        self.estimated_pages = {}
+
+    def estimate_api_calls(self, action, current_page=None, new_page=None):
+        if new_page is not None:
+            self.estimated_pages[new_page.id] = new_page
+        return super().estimate_api_calls(action, current_page, new_page)
+
+
+def test_plan_sync_counts_operations_and_links_new_units(tmp_path, make_logical_model):
+    config = make_config(tmp_path)
+    DataCatalog(SQLiteDataCatalog(config["data_catalog"]), config).sync_with_model(
+        make_logical_model(entity_count=2)
+    )
+    engine = PlanRecordingSQLiteDataCatalog(config["data_catalog"])
+    DC = DataCatalog(engine, config, offline=True)
+    checkpoint = DC.artifact_path.read_bytes()
+    LM = make_logical_model(entity_count=3)
+
+    sync_plan = DC.plan_sync(LM)
+
+    new_ids = set(LM.all_units_by_id) - set(DC.indexed_catalog.row_by_id)
+    assert len(new_ids) == 5
+    assert Counter(operation.action for operation in sync_plan.operations) == {
+        SyncAction.ADD_ROW: 5,
+        SyncAction.ADD_PAGE: 5,
+        SyncAction.UPDATE_PAGE: 2,
+    }
+    assert sync_plan.api_calls == 12
+    assert DC.artifact_path.read_bytes() == checkpoint
+
+    # New units are linked through placeholders, existing ones through the catalog.
+    new_entity_id = next(id for id in new_ids if id in LM.entities)
+    for id in new_ids:
+        assert engine.estimated_pages[id].reference.reference_link == f"planned:{id}"
+    for attribute in LM.attributes_by_entity_id[new_entity_id]:
+        page = engine.estimated_pages[attribute.id]
+        assert page.parent_entity_reference == f"planned:{new_entity_id}"
+    relation_into_new_entity = next(
+        relation
+        for relation in LM.relations.values()
+        if relation.target_entity_id == new_entity_id
+    )
+    page = engine.estimated_pages[relation_into_new_entity.id]
+    assert page.target_entity_reference == f"planned:{new_entity_id}"
+    assert not page.source_entity_reference.startswith("planned:")
+
+
+def test_engine_batch_defaults_call_single_unit_methods_in_order():
+    engine = RecordingEngine()
+    reference = ObjectReference(id="b", reference_link="link-b")
+
+    references = engine.add_rows([{"id": "a"}, {"id": "b"}])
+    engine.update_rows(["row-a", "row-b"])
+    engine.add_pages(["page-a"])
+    engine.update_pages(["page-a", "page-b"])
+    engine.delete_many(iter(["a", "b"]), {"b": reference})
+    engine.delete_many(["c"])
+
+    assert [reference.id for reference in references] == ["a", "b"]
+    assert engine.calls == [
+        ("add_row", {"id": "a"}),
+        ("add_row", {"id": "b"}),
+        ("update_row", "row-a"),
+        ("update_row", "row-b"),
+        ("add_page", "page-a"),
+        ("update_page", "page-a"),
+        ("update_page", "page-b"),
+        ("delete_by_id", "a", None),
+        ("delete_by_id", "b", reference),
+        ("delete_by_id", "c", None),
+    ]
+    assert all(
+        engine.estimate_api_calls(action, new_page="page-a") == 1
+        for action in SyncAction
+    )
+
+
+@pytest.mark.parametrize(
+    "batch_size, batch_lengths", [(None, [100, 50]), (40, [40, 40, 40, 30])]
+)
+def test_sync_batches_default_to_the_config_or_100(
+    tmp_path, make_logical_model, monkeypatch, batch_size, batch_lengths
+):
+    config = make_config(tmp_path, batch_size=batch_size)
+    if batch_size is None:
+        del config["data_catalog"]["batch_size"]
+    engine = SQLiteDataCatalog(config["data_catalog"])
+    DC = DataCatalog(engine, config)
+
+    lengths = []
+    add_rows = engine.add_rows
+    monkeypatch.setattr(
+        engine, "add_rows", lambda rows: lengths.append(len(rows)) or add_rows(rows)
+    )
+    DC.sync_with_model(make_logical_model(entity_count=30))
+
+    assert lengths == batch_lengths
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dg_kit.base.dataclasses import ID_CACHE_SIZE, id_generator
+
+
+def test_id_generator_reuses_cached_ids():
+    id_generator.cache_clear()
+
+    first = id_generator("core.orders")
+    second = id_generator("core." + "orders")
+
+    assert first == second == id_generator.__wrapped__("core.orders")
+    assert id_generator.cache_info().hits == 1
+    assert id_generator.cache_info().maxsize == ID_CACHE_SIZE
+    assert id_generator("core.orders", size=8) == id_generator.__wrapped__(
+        "core.orders", size=8
+    )
+
+
+def test_id_generator_joins_parts_unambiguously():
+    assert id_generator("core", "orders") != id_generator("core.orders")
+    assert id_generator("ab", "c") != id_generator("a", "bc")
+    assert len(id_generator("core.orders")) == 32
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from dg_kit.base.interning import Interner, UnitStore
+from dg_kit.base.logical_model import LogicalModel, LogicalModelsDatabase
+
+
+def _next_version(LM: LogicalModel, version: str) -> LogicalModel:
+    """Copy ``LM`` with one attribute changed, one removed and one entity added."""
+    attributes = list(LM.attributes.values())
+    changed, removed = attributes[0], attributes[1]
+    entity = next(iter(LM.entities.values()))
+
+    next_LM = LogicalModel(version)
+    for unit in LM.entities.values():
+        next_LM.register_entity(unit)
+    next_LM.register_entity(replace(entity, id="new_entity", nk="new_entity"))
+    for unit in attributes:
+        if unit is changed:
+            next_LM.register_attribute(replace(unit, description="Changed."))
+        elif unit is not removed:
+            next_LM.register_attribute(unit)
+    for unit in LM.relations.values():
+        next_LM.register_relation(unit)
+
+    return next_LM
+
+
+def test_interner_returns_one_instance_per_value():
+    interner = Interner()
+    first = interner.intern("".join(["sa", "les"]))
+    second = interner.intern("".join(["sal", "es"]))
+
+    assert first is second
+    assert interner.intern(None) is None
+    assert interner.strings(["crm", "erp"]) is interner.strings(("crm", "erp"))
+    assert interner.stats() == {"values": 4, "hits": 4, "misses": 4}
+
+
+def test_unit_store_deduplicates_equal_units(make_logical_model):
+    store = UnitStore()
+    entity = next(iter(make_logical_model().entities.values()))
+    same_entity = next(iter(make_logical_model().entities.values()))
+
+    assert store.store(entity) is entity
+    assert store.store(same_entity) is entity
+    assert store.hash(same_entity) == store.hash(entity)
+    assert len(store) == 1
+
+
+def test_unit_store_drops_units_released_by_every_version(make_logical_model):
+    store = UnitStore()
+    entity = next(iter(make_logical_model().entities.values()))
+    unit_hash = store.hash(entity)
+
+    store.retain([unit_hash])
+    store.retain([unit_hash])
+    store.release([unit_hash])
+    assert store.units_by_hash == {unit_hash: entity}
+
+    store.release([unit_hash])
+    assert len(store) == 0
+    with pytest.raises(KeyError):
+        store.release([unit_hash])
+    with pytest.raises(KeyError):
+        store.retain([unit_hash])
+
+
+def test_diff_versions_reports_unit_changes(make_logical_model):
+    LM = make_logical_model(revision="v1")
+    next_LM = _next_version(LM, "v2")
+    attributes = list(LM.attributes)
+
+    database = LogicalModelsDatabase()
+    database.register_logical_model(LM)
+    database.register_logical_model(next_LM)
+
+    assert database.diff_versions("v1", "v2") == {
+        "added": ["new_entity"],
+        "removed": [attributes[1]],
+        "changed": [attributes[0]],
+    }
+    with pytest.raises(KeyError):
+        database.diff_versions("v1", "v3")
+
+
+def test_memory_report_counts_shared_units_once(make_logical_model):
+    LM = make_logical_model(revision="v1")
+    next_LM = _next_version(LM, "v2")
+
+    database = LogicalModelsDatabase()
+    database.register_logical_model(LM)
+    database.register_logical_model(next_LM)
+    report = database.memory_report()
+
+    assert list(report) == ["v1", "v2"]
+    assert report["v1"]["units"] == len(LM.all_units_by_id)
+    assert report["v1"]["unique_bytes"] == report["v1"]["bytes"]
+    assert 0 < report["v2"]["unique_bytes"] < report["v2"]["bytes"] / 2
+
+
+def test_unregistered_versions_release_their_units(make_logical_model):
+    LM = make_logical_model(revision="v1")
+    next_LM = _next_version(LM, "v2")
+
+    database = LogicalModelsDatabase()
+    database.register_logical_model(LM)
+    database.register_logical_model(next_LM)
+    database.register_logical_model(next_LM)
+    assert len(database.units) == len(LM.all_units_by_id) + 2
+
+    database.unregister_logical_model("v1")
+
+    assert list(database.logical_models) == ["v2"]
+    assert len(database.units) == len(next_LM.all_units_by_id)
+    assert set(database.units.units_by_hash) == set(
+        database.unit_hashes_by_version["v2"].values()
+    )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from dg_kit.base.checkpoint import MappedCheckpoint, read_checkpoint
+from dg_kit.base.data_catalog import DataCatalog
+from dg_kit.integrations.sqlite.api import SQLiteDataCatalog
+
+
+@pytest.fixture
+def synced_catalog(tmp_path, make_logical_model):
+    config = {
+        "name": "test",
+        "data_catalog": {"engine": "sqlite", "dc_checkpoint_path": str(tmp_path)},
+    }
+    DC = DataCatalog(SQLiteDataCatalog(config["data_catalog"]), config)
+    DC.sync_with_model(make_logical_model())
+    return DC
+
+
+@pytest.fixture
+def mapped_checkpoint(synced_catalog):
+    checkpoint = MappedCheckpoint(synced_catalog.artifact_path)
+    yield checkpoint
+    checkpoint.close()
+
+
+def test_mapped_checkpoint_decodes_the_stored_catalog(
+    synced_catalog, mapped_checkpoint
+):
+    stored = read_checkpoint(synced_catalog.artifact_path)
+    lazy = mapped_checkpoint.indexed_catalog
+
+    assert dict(lazy.row_by_id) == stored.row_by_id
+    assert dict(lazy.reference_by_id) == stored.reference_by_id
+    assert dict(lazy.page_by_id) == stored.page_by_id
+    assert dict(lazy.content_hash_by_id) == stored.content_hash_by_id
+    assert lazy.last_edited_time == stored.last_edited_time
+    assert "missing" not in lazy.row_by_id
+
+
+def test_writes_and_deletes_stay_in_the_overlay(synced_catalog, mapped_checkpoint):
+    rows = mapped_checkpoint.indexed_catalog.row_by_id
+    stored_ids = list(rows)
+    first, second = stored_ids[:2]
+
+    rows[first] = rows[second]
+    del rows[second]
+
+    assert rows[first].id == second
+    assert second not in rows
+    assert len(rows) == len(stored_ids) - 1
+    with pytest.raises(KeyError):
+        del rows[second]
+
+    materialized = mapped_checkpoint.materialize(mapped_checkpoint.indexed_catalog)
+    assert set(materialized.row_by_id) == set(stored_ids) - {second}
+    # The file itself is never modified.
+    assert second in read_checkpoint(synced_catalog.artifact_path).row_by_id
+
+
+def test_lazy_catalog_syncs_like_an_eager_one(synced_catalog, make_logical_model):
+    config = dict(synced_catalog.config)
+    config["data_catalog"] = dict(config["data_catalog"], lazy_checkpoint=True)
+    lazy_DC = DataCatalog(synced_catalog.engine, config, offline=True)
+
+    lazy_DC.sync_with_model(make_logical_model(entity_count=2, revision="v2"))
+    synced_catalog.sync_with_model(make_logical_model(entity_count=2, revision="v2"))
+
+    assert dict(lazy_DC.indexed_catalog.content_hash_by_id) == (
+        synced_catalog.indexed_catalog.content_hash_by_id
+    )
+    assert read_checkpoint(lazy_DC.artifact_path).row_by_id == (
+        synced_catalog.indexed_catalog.row_by_id
+    )
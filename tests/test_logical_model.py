@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from dg_kit.base.dataclasses import id_generator
+
+
+def test_lm_ids_by_pm_id_maps_physical_objects_to_units(make_logical_model):
+    LM = make_logical_model(entity_count=2, attributes_per_entity=2)
+    entity = LM.entities[id_generator("entity_0")]
+    attribute = LM.attributes[id_generator("entity_0.attribute_1")]
+    table, column = entity.pm_map[0], attribute.pm_map[0]
+
+    assert LM.lm_ids_by_pm_id[table.id] == [entity.id]
+    assert LM.lm_ids_by_pm_id[column.id] == [attribute.id]
+    assert len(LM.lm_ids_by_pm_id) == 2 + 2 * 2
+
+    # Relations are indexed too, and several units may share a physical object.
+    relation = next(iter(LM.relations.values()))
+    LM.register_relation(replace(relation, pm_map=(table,)))
+
+    assert LM.lm_ids_by_pm_id[table.id] == [entity.id, relation.id]
+    assert LM.pm_objects_by_lm_id[relation.id] == [table]
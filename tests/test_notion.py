@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from itertools import count
+from types import SimpleNamespace
+
+import pytest
+
+from dg_kit.base.data_catalog import page_content_hash
+from dg_kit.base.dataclasses.data_catalog import (
+    AttributePage,
+    EntityPage,
+    ObjectReference,
+)
+from dg_kit.base.enums import DataCatalogRowProperties, DataUnitType, SyncAction
+from dg_kit.commands.data_catalog.engine import build_engine
+from dg_kit.integrations.notion.api import NotionDataCatalog
+from dg_kit.integrations.notion.formater import RowFormater
+from dg_kit.integrations.notion.parser import PageParser
+
+
+SECTIONS = (
+    "description",
+    "pk_attributes_references",
+    "attributes_references",
+    "relations_references",
+    "linked_documents",
+    "responsible_parties",
+    "pm_mapping_references",
+    "source_systems",
+    "parent_entity_reference",
+    "data_type",
+    "sensitivity_type",
+    "source_entity_reference",
+    "target_entity_reference",
+)
+
+NOTION_CONFIG = {
+    "row_property_mapping": {
+        "id": "Data unit id",
+        "title": "Data unit",
+        "type": "Data unit type",
+        "domain": "Domain",
+    },
+    "section_name_mapping": {
+        section: section.replace("_", " ").capitalize() for section in SECTIONS
+    },
+}
+
+
+def as_returned_by_notion(block: dict) -> dict:
+    # Notion drops empty text items and adds plain_text to the others.
+    content = block[block["type"]]
+    rich_text = []
+    for item in content["rich_text"]:
+        text = item.get("text", {}).get("content", "")
+        if item["type"] == "text" and not text:
+            continue
+        rich_text.append(dict(item, plain_text=text))
+    return dict(block, **{block["type"]: dict(content, rich_text=rich_text)})
+
+
+def attribute_page(description) -> AttributePage:
+    return AttributePage(
+        id="attribute",
+        reference=ObjectReference("attribute", "attribute-page"),
+        data_unit_type=DataUnitType.ATTRIBUTE,
+        description=description,
+        parent_entity_reference="entity-page",
+        data_type="STRING",
+        sensitivity_type="Not sensitive",
+        linked_documents=(),
+        responsible_parties=(),
+        pm_mapping_references=(),
+        source_systems=("crm",),
+    )
+
+
+@pytest.mark.parametrize("description", [None, "", "Customer identifier."])
+def test_pulled_attribute_page_keeps_its_content_hash(description):
+    page = attribute_page(description)
+    blocks = RowFormater(NOTION_CONFIG).build_attribute_page_blocks(page)
+
+    raw_page = PageParser(NOTION_CONFIG).parse_page_from_blocks(
+        DataUnitType.ATTRIBUTE, [as_returned_by_notion(block) for block in blocks]
+    )
+    pulled = AttributePage(
+        id=page.id,
+        reference=page.reference,
+        data_unit_type=page.data_unit_type,
+        **raw_page,
+    )
+
+    assert page_content_hash(pulled) == page_content_hash(page)
+
+
+def test_missing_description_hashes_like_empty_text():
+    page = EntityPage(
+        id="entity",
+        reference=ObjectReference("entity", "entity-page"),
+        data_unit_type=DataUnitType.ENTITY,
+        description=None,
+        pk_attributes_references=(),
+        attributes_references=(),
+        relations_references=(),
+        linked_documents=(),
+        responsible_parties=(),
+        pm_mapping_references=(),
+        source_systems=(),
+    )
+
+    assert page_content_hash(page) == page_content_hash(replace(page, description=""))
+
+
+def test_offline_notion_engine_needs_no_credentials(monkeypatch):
+    monkeypatch.delenv("NOTION_TOKEN", raising=False)
+    monkeypatch.delenv("DATA_CATALOG_ID", raising=False)
+    config = {"data_catalog": {"engine": "notion", **NOTION_CONFIG}}
+
+    engine = build_engine(config, offline=True)
+
+    assert isinstance(engine, NotionDataCatalog)
+    assert engine.notion is None
+    assert "notion_token" not in config["data_catalog"]
+    assert engine.estimate_api_calls(SyncAction.ADD_ROW) == 1
+    assert (
+        engine.estimate_api_calls(
+            SyncAction.ADD_PAGE, new_page=attribute_page("Customer identifier.")
+        )
+        > 1
+    )
+
+
+class FakeNotion:
+    """Answer data source queries and block calls from memory, counting calls."""
+
+    def __init__(self, page_id_by_row_id: dict = None, page_size: int = 30):
+        self.page_id_by_row_id = page_id_by_row_id or {}
+        self.page_size = page_size
+        self.queries = []
+        self.archived_page_ids = []
+        self.blocks_by_page = {}
+        self.block_ids = count()
+        self.calls = 0
+        self.data_sources = SimpleNamespace(query=self.query)
+        self.pages = SimpleNamespace(update=self.update)
+        self.blocks = SimpleNamespace(
+            children=SimpleNamespace(list=self.list_blocks, append=self.append_blocks),
+            update=self.update_block,
+            delete=self.delete_block,
+        )
+
+    def list_blocks(self, block_id, page_size, start_cursor=None):
+        self.calls += 1
+        blocks = self.blocks_by_page.get(block_id, [])
+        start = int(start_cursor or 0)
+        end = start + page_size
+        return {
+            "results": blocks[start:end],
+            "has_more": end < len(blocks),
+            "next_cursor": str(end),
+        }
+
+    def append_blocks(self, block_id, children, after=None):
+        self.calls += 1
+        blocks = self.blocks_by_page.setdefault(block_id, [])
+        position = len(blocks)
+        if after is not None:
+            position = [block["id"] for block in blocks].index(after) + 1
+        appended = [
+            dict(as_returned_by_notion(block), id=f"block_{next(self.block_ids)}")
+            for block in children
+        ]
+        blocks[position:position] = appended
+        return {"results": appended}
+
+    def update_block(self, block_id, **content):
+        self.calls += 1
+        for blocks in self.blocks_by_page.values():
+            for i, block in enumerate(blocks):
+                if block["id"] == block_id:
+                    (block_type,) = content
+                    blocks[i] = as_returned_by_notion(
+                        {"id": block_id, "type": block_type, **content}
+                    )
+
+    def delete_block(self, block_id):
+        self.calls += 1
+        for page_id, blocks in self.blocks_by_page.items():
+            self.blocks_by_page[page_id] = [
+                block for block in blocks if block["id"] != block_id
+            ]
+
+    def query(self, **payload):
+        self.calls += 1
+        self.queries.append(payload)
+        row_ids = [
+            condition["rich_text"]["equals"] for condition in payload["filter"]["or"]
+        ]
+        results = [
+            {
+                "id": self.page_id_by_row_id[row_id],
+                "properties": {
+                    DataCatalogRowProperties.ID: {
+                        "type": "rich_text",
+                        "rich_text": [{"text": {"content": row_id}}],
+                    }
+                },
+            }
+            for row_id in row_ids
+            if row_id in self.page_id_by_row_id
+        ]
+        start = int(payload.get("start_cursor", 0))
+        end = start + self.page_size
+        return {
+            "results": results[start:end],
+            "has_more": end < len(results),
+            "next_cursor": str(end),
+        }
+
+    def update(self, page_id, archived=False, properties=None):
+        self.calls += 1
+        if archived:
+            self.archived_page_ids.append(page_id)
+
+
+def test_delete_many_looks_up_uncached_pages_in_batches(caplog):
+    uncached_ids = [f"row_{i}" for i in range(120)]
+    missing_ids = uncached_ids[110:]
+    fake = FakeNotion({row_id: f"page_{row_id}" for row_id in uncached_ids[:110]})
+    engine = NotionDataCatalog(NOTION_CONFIG, offline=True)
+    engine.notion = fake
+    engine.dc_table_id = "catalog"
+    engine.notion_page_by_id = {
+        f"cached_{i}": ObjectReference(f"cached_{i}", f"page_cached_{i}")
+        for i in range(5)
+    }
+    reference_by_id = {
+        f"known_{i}": ObjectReference(f"known_{i}", f"page_known_{i}") for i in range(5)
+    }
+
+    engine.delete_many(
+        [*reference_by_id, *engine.notion_page_by_id, *uncached_ids], reference_by_id
+    )
+
+    # 120 uncached ids are looked up in OR filters of at most 50 ids, and each
+    # filter follows the result cursor until every matching page is read.
+    assert [len(query["filter"]["or"]) for query in fake.queries] == [
+        50,
+        50,
+        50,
+        50,
+        20,
+    ]
+    assert [query.get("start_cursor") for query in fake.queries] == [
+        None,
+        "30",
+        None,
+        "30",
+        None,
+    ]
+    assert all(query["data_source_id"] == "catalog" for query in fake.queries)
+    # Every resolved page is archived with its own pages.update call.
+    assert fake.archived_page_ids == [
+        *(f"page_known_{i}" for i in range(5)),
+        *(f"page_cached_{i}" for i in range(5)),
+        *(f"page_{row_id}" for row_id in uncached_ids[:110]),
+    ]
+    assert engine.notion_page_by_id == {}
+    assert all(f"id={row_id}" in caplog.text for row_id in missing_ids)
+
+
+@pytest.mark.parametrize("content_hash", [None, "Content hash"])
+def test_estimated_api_calls_match_page_writes(content_hash):
+    config = dict(NOTION_CONFIG)
+    if content_hash:
+        config["row_property_mapping"] = {
+            **NOTION_CONFIG["row_property_mapping"],
+            "content_hash": content_hash,
+        }
+    engine = NotionDataCatalog(config, offline=True)
+    engine.notion = fake = FakeNotion()
+    page = replace(
+        attribute_page("Customer identifier."),
+        source_systems=tuple(f"system_{i}" for i in range(150)),
+    )
+    assert len(engine._build_page_blocks(page)) > 100
+
+    # Each write starts from the page written before it. Listing more than 100
+    # blocks takes two calls, and so does appending them.
+    hash_call = 1 if content_hash else 0
+    current_page = None
+    for new_page, expected_calls in (
+        (page, 1 + 2),
+        (page, 2),
+        (replace(page, description="Changed."), 2 + 1),
+        (replace(page, source_systems=("crm",)), 153),
+        (page, 1 + 3),
+    ):
+        action = SyncAction.ADD_PAGE if current_page is None else SyncAction.UPDATE_PAGE
+        estimate = engine.estimate_api_calls(action, current_page, new_page)
+        fake.calls = 0
+        engine.update_page(new_page)
+
+        assert estimate == fake.calls == expected_calls + hash_call
+        current_page = new_page
+
+    assert all(
+        engine.estimate_api_calls(action) == 1
+        for action in (SyncAction.ADD_ROW, SyncAction.UPDATE_ROW, SyncAction.DELETE)
+    )
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from dg_kit.integrations.notion.differ import block_signature, diff_blocks
+
+
+def para(text: str) -> dict:
+    return {
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": text}}]},
+    }
+
+
+def heading(text: str) -> dict:
+    return {
+        "type": "heading_2",
+        "heading_2": {"rich_text": [{"type": "text", "text": {"content": text}}]},
+    }
+
+
+def stored(blocks: list) -> list:
+    return [dict(block, id=f"block-{i}") for i, block in enumerate(blocks)]
+
+
+def apply(existing: list, operations: list) -> list:
+    """Apply operations the way the Notion API does."""
+    blocks = list(existing)
+    new_ids = itertools.count()
+    for operation in operations:
+        ids = [block["id"] for block in blocks]
+        if operation.kind == "update":
+            position = ids.index(operation.block_id)
+            blocks[position] = dict(operation.blocks[0], id=operation.block_id)
+        elif operation.kind == "delete":
+            del blocks[ids.index(operation.block_id)]
+        else:
+            position = ids.index(operation.after) + 1 if operation.after else len(ids)
+            blocks[position:position] = [
+                dict(block, id=f"new-{next(new_ids)}") for block in operation.blocks
+            ]
+    return blocks
+
+
+def signatures(blocks: list) -> list:
+    return [block_signature(block) for block in blocks]
+
+
+PAGE = [heading("Description"), para("Customer."), heading("Data type"), para("INT")]
+
+
+def test_unchanged_page_needs_no_operations():
+    assert diff_blocks(stored(PAGE), PAGE) == []
+
+
+def test_changed_paragraph_is_updated_in_place():
+    new = [heading("Description"), para("A customer."), *PAGE[2:]]
+
+    operations = diff_blocks(stored(PAGE), new)
+
+    assert [(op.kind, op.block_id) for op in operations] == [("update", "block-1")]
+
+
+@pytest.mark.parametrize(
+    "new",
+    [
+        PAGE[:2],
+        [*PAGE, para("Extra.")],
+        [PAGE[0], para("Customer."), para("Second line."), *PAGE[2:]],
+        [PAGE[0], *PAGE[2:]],
+        [PAGE[0], heading("Sensitivity"), para("High"), *PAGE[1:]],
+        [PAGE[0], para("Rewritten."), para("Twice."), PAGE[2]],
+    ],
+)
+def test_applied_operations_produce_the_new_page(new):
+    existing = stored(PAGE)
+
+    operations = diff_blocks(existing, new)
+
+    assert signatures(apply(existing, operations)) == signatures(new)
+    kept = {block["id"] for block in apply(existing, operations)}
+    assert kept & {block["id"] for block in existing}
+
+
+def test_insert_before_first_block_requires_a_rewrite():
+    assert diff_blocks(stored(PAGE), [para("Preamble."), *PAGE]) is None
+
+
+def test_signature_ignores_annotations_and_empty_text():
+    built = para("Customer.")
+    returned = {
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [
+                {"type": "text", "text": {"content": ""}, "plain_text": ""},
+                {
+                    "type": "text",
+                    "text": {"content": "Customer."},
+                    "plain_text": "Customer.",
+                    "annotations": {"bold": False},
+                },
+            ]
+        },
+    }
+
+    assert block_signature(built) == block_signature(returned)
+
+
+def test_signature_normalizes_mentioned_page_ids():
+    def mention(page_id: str) -> dict:
+        return {
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [{"type": "mention", "mention": {"page": {"id": page_id}}}]
+            },
+        }
+
+    assert block_signature(mention("0f3c9a12-aa")) == block_signature(
+        mention("0f3c9a12aa")
+    )
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from dg_kit.base.dataclasses import id_generator
+from dg_kit.base.dataclasses.physical_model import Column, Layer, Table
+from dg_kit.base.physical_model import MISSING_CODE
+
+
+def test_to_columnar_encodes_the_model(make_physical_model):
+    PM = make_physical_model({"orders": ["id", "amount"], "customers": ["id"]})
+    orders, customers = PM.tables.values()
+    PM.register_dependency(orders, customers)
+    PM.register_column(
+        Column(
+            id="orphan",
+            nk="core.missing.orphan",
+            layer_id="core",
+            table_id="missing",
+            name="orphan",
+            data_type="STRING",
+        )
+    )
+
+    columnar = PM.to_columnar()
+
+    assert columnar.layer_names == ("core",)
+    assert columnar.table_names == ("orders", "customers")
+    assert list(columnar.table_layer) == [0, 0]
+    assert columnar.column_names == ("id", "amount", "id", "orphan")
+    assert list(columnar.column_table) == [0, 0, 1, MISSING_CODE]
+    assert list(columnar.column_layer) == [0, 0, 0, 0]
+    assert list(columnar.dependency_dependent) == [0]
+    assert list(columnar.dependency_dependency) == [1]
+
+
+@pytest.mark.parametrize(
+    "register",
+    [
+        lambda PM: PM.register_layer(
+            Layer(id="mart", nk="mart", name="mart", is_landing=False)
+        ),
+        lambda PM: PM.register_table(
+            Table(id="new", nk="core.new", layer_id="core", name="new")
+        ),
+        lambda PM: PM.register_column(
+            Column(
+                id="new",
+                nk="core.orders.new",
+                layer_id="core",
+                table_id=id_generator("core.orders"),
+                name="new",
+                data_type="STRING",
+            )
+        ),
+        lambda PM: PM.register_dependency(*PM.tables.values()),
+    ],
+    ids=["layer", "table", "column", "dependency"],
+)
+def test_to_columnar_is_cached_until_the_model_changes(make_physical_model, register):
+    PM = make_physical_model({"orders": ["id"], "customers": ["id"]})
+    columnar = PM.to_columnar()
+
+    assert PM.to_columnar() is columnar
+
+    register(PM)
+    rebuilt = PM.to_columnar()
+
+    assert rebuilt is not columnar
+    assert rebuilt is PM.to_columnar()
+    assert rebuilt == PM._build_columnar()
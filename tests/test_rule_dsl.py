@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+
+from dg_kit.base.convention import Convention, ConventionValidator
+from dg_kit.base.enums import ConventionRuleSeverity
+from dg_kit.base.logical_model import LogicalModel
+from dg_kit.base.rule_dsl import (
+    ModelColumns,
+    compile_declarative_rules,
+    evaluate_declarative_rules,
+)
+
+
+SNAKE_CASE_RULE = {
+    "select": {"type": "column", "layer": ["core"]},
+    "field": "name",
+    "regex": "^[a-z0-9_]+$",
+    "severity": "error",
+}
+
+
+def validate(LM, PM, rules: dict):
+    convention = Convention(
+        "test",
+        {
+            "rules": {
+                "declarative": {
+                    "severity": "warning",
+                    "description": "Declarative rules.",
+                    "rules": rules,
+                }
+            }
+        },
+    )
+    return ConventionValidator(LM, PM, convention).validate()
+
+
+def test_documented_snake_case_rule_rejects_mixed_case(make_physical_model):
+    PM = make_physical_model({"customers": ["customer_id", "CustomerID"]})
+
+    breaches = validate(LogicalModel("v1"), PM, {"snake_case": SNAKE_CASE_RULE})
+
+    assert len(breaches) == 1
+    assert breaches[0].severity == ConventionRuleSeverity.ERROR
+    assert "'CustomerID'" in breaches[0].message
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        dict(SNAKE_CASE_RULE, ignore_case=True),
+        dict(SNAKE_CASE_RULE, regex="(?i)^[a-z0-9_]+$"),
+    ],
+)
+def test_case_insensitive_regex_is_opt_in(make_physical_model, rule):
+    PM = make_physical_model({"customers": ["customer_id", "CustomerID"]})
+
+    assert validate(LogicalModel("v1"), PM, {"snake_case": rule}) == []
+
+
+@pytest.mark.parametrize(
+    "rule, error",
+    [
+        ({"select": {"type": "view"}, "field": "name", "not_null": True}, "type"),
+        ({"select": {"type": "table"}, "field": "owner", "not_null": True}, "field"),
+        ({"select": {"type": "table"}, "field": "name"}, "predicate"),
+        ({"select": {"type": "table"}, "field": "name", "regex": "("}, "regex"),
+        ({"select": {"type": "table"}, "field": "name", "unique": True}, "Unknown"),
+        (
+            {"select": {"type": "table"}, "field": "name", "references_exist": "view"},
+            "unknown type",
+        ),
+        (
+            {
+                "select": {"type": "table"},
+                "field": "name",
+                "not_null": True,
+                "ignore_case": True,
+            },
+            "ignore_case",
+        ),
+    ],
+)
+def test_invalid_rules_raise(rule, error):
+    with pytest.raises(ValueError, match=error):
+        compile_declarative_rules({"rule": rule}, ConventionRuleSeverity.WARNING)
+
+
+def test_predicates(make_logical_model, make_physical_model):
+    LM = make_logical_model(entity_count=2)
+    PM = make_physical_model({"entity_0": ["column_0"]})
+    rules = compile_declarative_rules(
+        {
+            "descriptions": {
+                "select": {"type": "entity"},
+                "field": "description",
+                "not_null": True,
+            },
+            "known_domains": {
+                "select": {"type": "attribute"},
+                "field": "domain",
+                "in_set": ["finance"],
+            },
+            "mapped_columns_exist": {
+                "select": {"type": "attribute"},
+                "field": "pm_map",
+                "references_exist": "column",
+            },
+        },
+        ConventionRuleSeverity.WARNING,
+    )
+
+    issues = evaluate_declarative_rules(rules, ModelColumns(LM, PM))
+    messages = [breach.message for breaches in issues.values() for breach in breaches]
+
+    assert not any("descriptions" in message for message in messages)
+    assert sum("known_domains" in message for message in messages) == 6
+    # Only the first column of the first entity exists in the physical model.
+    assert sum("mapped_columns_exist" in message for message in messages) == 5
+
+
+def test_object_ids_restrict_evaluation(make_physical_model):
+    PM = make_physical_model({"customers": ["CustomerID", "OrderID"]})
+    rules = compile_declarative_rules(
+        {"snake_case": SNAKE_CASE_RULE}, ConventionRuleSeverity.WARNING
+    )
+    columns = ModelColumns(LogicalModel("v1"), PM)
+    customer_id = next(
+        column.id for column in PM.columns.values() if column.name == "CustomerID"
+    )
+
+    issues = evaluate_declarative_rules(rules, columns, {customer_id})
+
+    assert list(issues) == [customer_id]
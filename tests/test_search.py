@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from dg_kit.base.search import SearchIndex, tokenize
+
+
+@pytest.fixture
+def index(make_logical_model, make_physical_model):
+    LM = make_logical_model(entity_count=2)
+    PM = make_physical_model(
+        {"customers": ["customer_id", "orderDate"], "orders": ["order_id"]}
+    )
+    return SearchIndex(LM, PM)
+
+
+def test_tokenize_splits_identifiers_and_camel_case():
+    assert tokenize("customer_id orderDate") == [
+        "customer_id",
+        "customer",
+        "id",
+        "order_date",
+        "order",
+        "date",
+    ]
+
+
+def test_name_matches_rank_above_description_matches(index):
+    # "of" is in relation names and in attribute descriptions.
+    hits = index.search("of", limit=None)
+
+    assert [hit.kind for hit in hits] == ["relation"] * 2 + ["attribute"] * 6
+    assert hits[0].score > hits[-1].score
+
+
+def test_every_query_token_must_match(index):
+    names = {hit.name for hit in index.search("customer id")}
+
+    assert names == {"customer_id"}
+
+
+def test_prefix_and_fuzzy_matches(index):
+    # Columns also match through the table part of their natural key.
+    assert {hit.name for hit in index.search("cust", kinds=["column"])} == {
+        "customer_id",
+        "orderDate",
+    }
+    assert [hit.name for hit in index.search("order dat")] == ["orderDate"]
+    assert [hit.name for hit in index.search("custmer id")] == ["customer_id"]
+    assert index.search("zzzz") == []
+
+
+def test_filters_by_kind_layer_and_limit(index):
+    assert {hit.kind for hit in index.search("order", kinds=["table"])} == {"table"}
+    assert all(
+        "core" in hit.layers for hit in index.search("attribute", layers=["core"])
+    )
+    assert index.search("order", layers=["mart"]) == []
+    assert len(index.search("attribute", limit=2)) == 2
+
+    with pytest.raises(ValueError, match="Unknown search kinds"):
+        index.search("order", kinds=["view"])